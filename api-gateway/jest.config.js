@@ -0,0 +1,9 @@
+// TypeScript 테스트(src/**/*.test.ts)는 tsconfig 설정 그대로 트랜스파일해서 실행 (타입 검사는 npm run build)
+module.exports = {
+  testEnvironment: "node",
+  roots: ["<rootDir>/src"],
+  testMatch: ["**/*.test.ts"],
+  transform: {
+    "^.+\\.ts$": "<rootDir>/jest.transform.js",
+  },
+};
@@ -0,0 +1,13 @@
+// Jest용 TypeScript 변환 (devDependencies의 typescript만 사용)
+const ts = require("typescript");
+const { compilerOptions } = require("./tsconfig.json");
+
+module.exports = {
+  process(sourceText, sourcePath) {
+    const { outputText, sourceMapText } = ts.transpileModule(sourceText, {
+      compilerOptions: { ...compilerOptions, sourceMap: true },
+      fileName: sourcePath,
+    });
+    return { code: outputText, map: sourceMapText };
+  },
+};
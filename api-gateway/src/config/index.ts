@@ -17,6 +17,20 @@ export const config = {
     name: process.env.QUEUE_NAME || "translation-jobs",
     maxJobs: parseInt(process.env.QUEUE_MAX_JOBS || "1000", 10),
     timeout: parseInt(process.env.QUEUE_TIMEOUT || "30000", 10),
+    // bull: Bull 리스트 + pub/sub, streams: Redis Streams (Python Worker의 QUEUE_TRANSPORT와 같은 값)
+    transport: (process.env.QUEUE_TRANSPORT || "bull") as "bull" | "streams",
+    // 우선순위 lane (bull 전용): 프리미엄 BJ / 시청자 수가 많은 방송의 채팅을 별도 Bull 큐로 보냄
+    // Python Worker의 QUEUE_LANES에 같은 큐 이름을 더 큰 가중치로 등록해야 소비됨
+    priorityLane: process.env.QUEUE_PRIORITY_LANE || "",
+    priorityBjIds: (process.env.QUEUE_PRIORITY_BJ_IDS || "")
+      .split(",")
+      .map((id) => id.trim())
+      .filter(Boolean),
+    priorityMinViewers: parseInt(process.env.QUEUE_PRIORITY_MIN_VIEWERS || "0", 10), // 0이면 시청자 수 기준 사용 안 함
+    // 결과 메시지/스트림 직렬화: json, msgpack (Python Worker의 QUEUE_SERIALIZER와 같은 형식, orjson은 json과 같음)
+    serializer: (process.env.QUEUE_SERIALIZER === "msgpack" ? "msgpack" : "json") as
+      | "json"
+      | "msgpack",
   },
 
   rateLimit: {
@@ -615,14 +615,18 @@ async function processLanguageIndependently(
 
   try {
     const detectedLanguage = detectLanguage(text);
-    // Step 1: 전처리 (각 언어마다 독립적으로)
-    await queueService.addJob({
-      id: jobId,
-      text: text,
-      targetLanguages: [targetLang],
-      options: options,
-      createdAt: Date.now(),
-    });
+    // Step 1: 전처리 (각 언어마다 독립적으로, 방송 정보로 우선순위 lane 선택)
+    await queueService.addJob(
+      {
+        id: jobId,
+        text: text,
+        targetLanguages: [targetLang],
+        options: options,
+        createdAt: Date.now(),
+      },
+      undefined,
+      metadata
+    );
 
     // logger.debug({ jobId, targetLang }, "Independent job started"); // CPU 최적화
 
@@ -2,6 +2,7 @@ import Queue, { Job, JobOptions } from "bull";
 import { config } from "../config";
 import { logger } from "../utils/logger";
 import Redis from "ioredis";
+import { decodePayload, decodeResultMessage, encodePayload } from "../utils/payload";
 
 export interface TranslationJob {
   id: string;
@@ -15,6 +16,18 @@ export interface TranslationJob {
     fixTypos?: boolean;
   };
   createdAt: number;
+  // Python Worker가 방송별로 돌아가며 처리할 때 사용 (FAIR_SCHEDULING)
+  broadcast?: {
+    bj_id?: string;
+    broadcast_index?: number;
+  };
+}
+
+// 크롤러가 채팅에 붙이는 방송 정보 (afreecatv-chat-crawler/multi_broadcaster.py)
+export interface BroadcastMetadata {
+  bj_id?: string;
+  broadcast_index?: number;
+  viewer_count?: number;
 }
 
 export interface TranslationResult {
@@ -41,6 +54,7 @@ export interface PreprocessingResult {
 
 class QueueService {
   private queue: Queue.Queue<TranslationJob>;
+  private priorityQueue?: Queue.Queue<TranslationJob>;
   private preprocessingResults: Map<string, PreprocessingResult> = new Map();
   private preprocessingResolvers: Map<
     string,
@@ -61,6 +75,11 @@ class QueueService {
   private lastRedisWriteAvg = 0;
   private lastRedisReadAvg = 0;
 
+  // Redis Streams 모드 (작업 XADD용, 결과 XREAD BLOCK용 연결 분리)
+  private streamClient?: Redis;
+  private streamReader?: Redis;
+  private closing = false;
+
   constructor() {
     // Queue 삽입 RPS 모니터링
     setInterval(() => {
@@ -92,7 +111,22 @@ class QueueService {
       this.redisReadTimeSum = 0;
       this.redisReadCount = 0;
     }, 1000);
-    this.queue = new Queue<TranslationJob>(config.queue.name, {
+    this.queue = this.createQueue(config.queue.name);
+    // 우선순위 lane (Python Worker의 QUEUE_LANES에 같은 이름을 더 큰 가중치로 등록)
+    if (config.queue.priorityLane && config.queue.transport === "bull") {
+      this.priorityQueue = this.createQueue(config.queue.priorityLane);
+    }
+
+    this.setupEventHandlers();
+    if (config.queue.transport === "streams") {
+      this.setupStreams();
+    } else {
+      this.subscribeToWorker();
+    }
+  }
+
+  private createQueue(name: string): Queue.Queue<TranslationJob> {
+    return new Queue<TranslationJob>(name, {
       // Bull이 Redis 클라이언트를 생성할 때 호출 (client, bclient, eclient 총 3개)
       createClient: (type) => {
         const client = new Redis({
@@ -118,9 +152,18 @@ class QueueService {
         timeout: config.queue.timeout,
       },
     });
+  }
 
-    this.setupEventHandlers();
-    this.subscribeToWorker();
+  /**
+   * 우선순위 lane으로 보낼 방송인지 (프리미엄 BJ 또는 시청자 수 기준, 크롤러가 붙인 metadata)
+   */
+  private isPriority(metadata?: BroadcastMetadata): boolean {
+    if (!this.priorityQueue || !metadata) return false;
+    if (metadata.bj_id && config.queue.priorityBjIds.includes(metadata.bj_id)) {
+      return true;
+    }
+    const minViewers = config.queue.priorityMinViewers;
+    return minViewers > 0 && (metadata.viewer_count ?? 0) >= minViewers;
   }
 
   private setupEventHandlers() {
@@ -161,95 +204,211 @@ class QueueService {
       logger.info(`Subscribed to ${PREPROCESSING_CHANNEL} (${count} channels)`);
     });
 
-    redisSub.on("message", async (channel, message) => {
-      if (channel !== PREPROCESSING_CHANNEL) return;
+    // msgpack은 바이너리이므로 Buffer로 받음
+    redisSub.on("messageBuffer", async (channel: Buffer, message: Buffer) => {
+      if (channel.toString() !== PREPROCESSING_CHANNEL) return;
 
       try {
-        const { jobId, result, status } = JSON.parse(message);
-        logger.debug({
-          msg: "Preprocessing result received",
-          jobId,
-          status,
-        });
+        // 배치 메시지(version 2)와 단건 메시지 모두 작업별 결과 목록으로
+        const results = decodeResultMessage(message, config.queue.serializer);
+        await Promise.all(
+          results.map(({ jobId, result, status }) =>
+            this.handlePreprocessingResult(jobId, result, status).catch((err) =>
+              logger.error({ err, jobId }, "Error processing Python preprocessing result")
+            )
+          )
+        );
+      } catch (err) {
+        logger.error({ err }, "Error processing Python preprocessing message");
+      }
+    });
+  }
 
-        if (status === "completed") {
-          this.preprocessingCompleteCounter++; // RPS 카운터
-
-          // 전처리 결과 저장
-          this.preprocessingResults.set(jobId, result);
-
-          // Bull job을 completed로 마킹 (통계 업데이트를 위해)
-          const job = await this.getJob(jobId);
-          if (job) {
-            await job
-              .moveToCompleted(
-                JSON.stringify({
-                  preprocessing: result,
-                  completed_at: Date.now(),
-                }),
-                true,
-                true
-              )
-              .catch((error) => {
-                // 이미 completed 상태이거나 타이밍 이슈로 실패할 수 있음 (무시해도 됨)
-                logger.debug(
-                  { error, jobId },
-                  "Job already completed or moved"
-                );
-              });
-          }
+  /**
+   * Python Worker 전처리 결과 처리 (pub/sub, Streams 공통)
+   */
+  private async handlePreprocessingResult(
+    jobId: string,
+    result: any,
+    status: string
+  ) {
+    logger.debug({
+      msg: "Preprocessing result received",
+      jobId,
+      status,
+    });
 
-          // 대기 중인 resolver가 있으면 호출
-          const resolver = this.preprocessingResolvers.get(jobId);
-          if (resolver) {
-            resolver(result);
-            this.preprocessingResolvers.delete(jobId);
-          }
-        } else if (status === "failed") {
-          // Bull job을 failed로 마킹
-          const job = await this.getJob(jobId);
-          if (job) {
-            await job
-              .moveToFailed(
-                { message: result?.filter_reason || "Preprocessing failed" },
-                true
-              )
-              .catch((error) => {
-                // 이미 failed 상태이거나 타이밍 이슈로 실패할 수 있음 (무시해도 됨)
-                logger.debug({ error, jobId }, "Job already failed or moved");
-              });
-          }
+    if (status === "completed") {
+      this.preprocessingCompleteCounter++; // RPS 카운터
+
+      // 전처리 결과 저장
+      this.preprocessingResults.set(jobId, result);
+
+      // Bull job을 completed로 마킹 (통계 업데이트를 위해)
+      const job = await this.getJob(jobId);
+      if (job) {
+        await job
+          .moveToCompleted(
+            JSON.stringify({
+              preprocessing: result,
+              completed_at: Date.now(),
+            }),
+            true,
+            true
+          )
+          .catch((error) => {
+            // 이미 completed 상태이거나 타이밍 이슈로 실패할 수 있음 (무시해도 됨)
+            logger.debug({ error, jobId }, "Job already completed or moved");
+          });
+      }
 
-          // 실패 시 resolver에게 에러 전달
-          const resolver = this.preprocessingResolvers.get(jobId);
-          if (resolver) {
-            // reject는 따로 관리하지 않으므로, filtered=true로 처리
-            const failedResult: PreprocessingResult = {
-              original_text: "",
-              preprocessed_text: "",
-              // detected_language: "unknown",
-              preprocessing_time_ms: 0,
-              filtered: true,
-              filter_reason: result?.filter_reason || "Preprocessing failed",
-            };
-            resolver(failedResult);
-            this.preprocessingResolvers.delete(jobId);
+      // 대기 중인 resolver가 있으면 호출
+      const resolver = this.preprocessingResolvers.get(jobId);
+      if (resolver) {
+        resolver(result);
+        this.preprocessingResolvers.delete(jobId);
+      }
+    } else if (status === "failed") {
+      // Bull job을 failed로 마킹
+      const job = await this.getJob(jobId);
+      if (job) {
+        await job
+          .moveToFailed(
+            { message: result?.filter_reason || "Preprocessing failed" },
+            true
+          )
+          .catch((error) => {
+            // 이미 failed 상태이거나 타이밍 이슈로 실패할 수 있음 (무시해도 됨)
+            logger.debug({ error, jobId }, "Job already failed or moved");
+          });
+      }
+
+      // 실패 시 resolver에게 에러 전달
+      const resolver = this.preprocessingResolvers.get(jobId);
+      if (resolver) {
+        // reject는 따로 관리하지 않으므로, filtered=true로 처리
+        const failedResult: PreprocessingResult = {
+          original_text: "",
+          preprocessed_text: "",
+          // detected_language: "unknown",
+          preprocessing_time_ms: 0,
+          filtered: true,
+          filter_reason: result?.filter_reason || "Preprocessing failed",
+        };
+        resolver(failedResult);
+        this.preprocessingResolvers.delete(jobId);
+      }
+    }
+  }
+
+  private setupStreams() {
+    const createClient = () =>
+      new Redis({
+        host: config.redis.host,
+        port: config.redis.port,
+        password: config.redis.password,
+        maxRetriesPerRequest: null,
+        enableReadyCheck: false,
+        lazyConnect: false,
+      });
+    this.streamClient = createClient();
+    this.streamReader = createClient();
+
+    this.consumeResultStream().catch((err) => {
+      logger.error({ err }, "Preprocessing result stream consumer stopped");
+    });
+  }
+
+  /**
+   * 결과 스트림을 XREAD BLOCK으로 읽기
+   * 마지막으로 읽은 ID부터 이어서 읽으므로 재연결 중에 추가된 결과도 놓치지 않음
+   */
+  private async consumeResultStream() {
+    const resultsKey = `stream:${config.queue.name}:results`;
+
+    // 시작 시점의 마지막 항목 이후부터 읽기 ("$"를 매번 쓰면 호출 사이의 항목을 놓침)
+    const last = await this.streamReader!.xrevrange(
+      resultsKey,
+      "+",
+      "-",
+      "COUNT",
+      1
+    );
+    let lastId = last.length > 0 ? last[0][0] : "0-0";
+    logger.info(`Consuming ${resultsKey} from ${lastId}`);
+
+    while (!this.closing) {
+      try {
+        const reply = await this.streamReader!.xreadBuffer(
+          "COUNT",
+          100,
+          "BLOCK",
+          1000,
+          "STREAMS",
+          resultsKey,
+          lastId
+        );
+        if (!reply) continue;
+
+        for (const [, entries] of reply) {
+          for (const [id, fields] of entries) {
+            lastId = id.toString();
+            const message: Record<string, Buffer> = {};
+            for (let i = 0; i < fields.length; i += 2) {
+              message[fields[i].toString()] = fields[i + 1];
+            }
+            await this.handlePreprocessingResult(
+              message.jobId.toString(),
+              decodePayload(message.result, config.queue.serializer),
+              message.status.toString()
+            );
           }
         }
       } catch (err) {
-        logger.error({ err }, "Error processing Python preprocessing message");
+        if (this.closing) break;
+        logger.error({ err }, "Error reading preprocessing result stream");
+        await new Promise((resolve) => setTimeout(resolve, 1000));
       }
-    });
+    }
   }
 
   async addJob(
     data: TranslationJob,
-    options?: JobOptions
-  ): Promise<Job<TranslationJob>> {
+    options?: JobOptions,
+    metadata?: BroadcastMetadata
+  ): Promise<{ id: Queue.JobId }> {
     this.queueAddCounter++; // RPS 카운터
 
     const startTime = performance.now();
-    const job = await this.queue.add(data, {
+
+    if (metadata && (metadata.bj_id || metadata.broadcast_index !== undefined)) {
+      data = {
+        ...data,
+        broadcast: { bj_id: metadata.bj_id, broadcast_index: metadata.broadcast_index },
+      };
+    }
+
+    // Streams 모드: 작업 스트림에 추가 (Bull job은 만들지 않음)
+    // MAXLEN으로 자르지 않음: 길이 제한은 아직 전달되지 않았거나 처리 중인 항목도 지움
+    // (워커가 처리한 항목은 XACK 후 XDEL하므로 스트림에는 남은 작업만 있음)
+    if (config.queue.transport === "streams") {
+      await this.streamClient!.xadd(
+        `stream:${config.queue.name}:jobs`,
+        "*",
+        "jobId",
+        data.id,
+        "data",
+        encodePayload(data, config.queue.serializer)
+      );
+      this.redisWriteTimeSum += performance.now() - startTime;
+      this.redisWriteCount++;
+
+      logger.debug({ jobId: data.id, text: data.text }, "Job added to stream");
+      return { id: data.id };
+    }
+
+    const queue = this.isPriority(metadata) ? this.priorityQueue! : this.queue;
+    const job = await queue.add(data, {
       jobId: data.id,
       ...options,
     });
@@ -264,7 +423,9 @@ class QueueService {
   }
 
   async getJob(jobId: string): Promise<Job<TranslationJob> | null> {
-    return this.queue.getJob(jobId);
+    const job = await this.queue.getJob(jobId);
+    if (job || !this.priorityQueue) return job;
+    return this.priorityQueue.getJob(jobId);
   }
 
   /**
@@ -292,15 +453,98 @@ class QueueService {
     ]);
   }
 
+  /**
+   * addJob이 넣을 수 있는 모든 Bull 큐 (기본 큐 + 우선순위 lane)
+   */
+  private get lanes(): Queue.Queue<TranslationJob>[] {
+    return this.priorityQueue ? [this.queue, this.priorityQueue] : [this.queue];
+  }
+
+  /**
+   * Python Worker가 처리 중인 작업 (bull:{queue}:leases sorted set, score = lease 만료 시각, 모든 lane 합계)
+   * Bull의 active 리스트에는 lease로 옮겨지기 전의 작업만 잠시 들어있으므로 둘을 합쳐서 active로 집계
+   */
+  private async getLeasedCount(): Promise<number> {
+    return this.countAcrossLanes((queue) =>
+      queue.client.zcard(queue.toKey("leases"))
+    );
+  }
+
+  /**
+   * 모든 lane의 작업 수 합계 (대기/완료/실패 등, getLeasedCount와 같은 lane 목록)
+   */
+  private async countAcrossLanes(
+    count: (queue: Queue.Queue<TranslationJob>) => Promise<number>
+  ): Promise<number> {
+    const counts = await Promise.all(this.lanes.map(count));
+    return counts.reduce((a, b) => a + b, 0);
+  }
+
+  /**
+   * 모든 lane의 작업 목록을 합침 (recent면 끝난 시각 최신순으로 정렬)
+   */
+  private async jobsAcrossLanes(
+    fetch: (queue: Queue.Queue<TranslationJob>) => Promise<Job<TranslationJob>[]>,
+    recent = false
+  ): Promise<Job<TranslationJob>[]> {
+    const jobs = (await Promise.all(this.lanes.map(fetch))).flat();
+    return recent
+      ? jobs.sort((a, b) => (b.finishedOn ?? 0) - (a.finishedOn ?? 0))
+      : jobs;
+  }
+
+  /**
+   * 모든 lane의 lease를 만료 시각 순으로 합쳐서 start~end 범위의 작업 반환
+   */
+  private async getLeasedJobs(
+    start: number,
+    end: number
+  ): Promise<Job<TranslationJob>[]> {
+    const leases = await Promise.all(
+      this.lanes.map(async (queue) => {
+        const reply = await queue.client.zrange(
+          queue.toKey("leases"),
+          0,
+          end,
+          "WITHSCORES"
+        );
+        const entries: {
+          queue: Queue.Queue<TranslationJob>;
+          id: string;
+          expiresAt: number;
+        }[] = [];
+        for (let i = 0; i < reply.length; i += 2) {
+          entries.push({
+            queue,
+            id: reply[i],
+            expiresAt: Number(reply[i + 1]),
+          });
+        }
+        return entries;
+      })
+    );
+    const merged = leases
+      .flat()
+      .sort((a, b) => a.expiresAt - b.expiresAt)
+      .slice(start, end + 1);
+    const jobs = await Promise.all(
+      merged.map(({ queue, id }) => queue.getJob(id))
+    );
+    return jobs.filter((job): job is Job<TranslationJob> => job !== null);
+  }
+
   async getQueueStats() {
     const startTime = performance.now();
-    const [waiting, active, completed, failed, delayed] = await Promise.all([
-      this.queue.getWaitingCount(),
-      this.queue.getActiveCount(),
-      this.queue.getCompletedCount(),
-      this.queue.getFailedCount(),
-      this.queue.getDelayedCount(),
-    ]);
+    const [waiting, activeList, leased, completed, failed, delayed] =
+      await Promise.all([
+        this.countAcrossLanes((queue) => queue.getWaitingCount()),
+        this.countAcrossLanes((queue) => queue.getActiveCount()),
+        this.getLeasedCount(),
+        this.countAcrossLanes((queue) => queue.getCompletedCount()),
+        this.countAcrossLanes((queue) => queue.getFailedCount()),
+        this.countAcrossLanes((queue) => queue.getDelayedCount()),
+      ]);
+    const active = activeList + leased;
     const duration = performance.now() - startTime;
 
     // Redis 읽기 시간 측정
@@ -321,28 +565,34 @@ class QueueService {
     const redisStartTime = performance.now();
     const [
       waiting,
-      active,
+      activeList,
+      leased,
       completed,
       failed,
       delayed,
       paused,
-      activeJobs,
+      activeListJobs,
+      leasedJobs,
       waitingJobs,
       completedJobs,
       failedJobs,
     ] = await Promise.all([
-      this.queue.getWaitingCount(),
-      this.queue.getActiveCount(),
-      this.queue.getCompletedCount(),
-      this.queue.getFailedCount(),
-      this.queue.getDelayedCount(),
-      this.queue.getPausedCount(),
-      this.queue.getActive(0, 50), // 최대 50개 active jobs 확인
-      this.queue.getWaiting(0, 50), // 최대 50개 waiting jobs 확인
-      this.queue.getCompleted(0, 10), // 최근 10개 completed jobs
-      this.queue.getFailed(0, 10), // 최근 10개 failed jobs
+      this.countAcrossLanes((queue) => queue.getWaitingCount()),
+      this.countAcrossLanes((queue) => queue.getActiveCount()),
+      this.getLeasedCount(),
+      this.countAcrossLanes((queue) => queue.getCompletedCount()),
+      this.countAcrossLanes((queue) => queue.getFailedCount()),
+      this.countAcrossLanes((queue) => queue.getDelayedCount()),
+      this.countAcrossLanes((queue) => queue.getPausedCount()),
+      this.jobsAcrossLanes((queue) => queue.getActive(0, 50)), // lane마다 최대 50개 active jobs 확인
+      this.getLeasedJobs(0, 49), // lease 만료가 가까운 순 (가장 오래 처리 중인 작업부터)
+      this.jobsAcrossLanes((queue) => queue.getWaiting(0, 50)), // lane마다 최대 50개 waiting jobs 확인
+      this.jobsAcrossLanes((queue) => queue.getCompleted(0, 10), true), // lane마다 최근 10개 completed jobs
+      this.jobsAcrossLanes((queue) => queue.getFailed(0, 10), true), // lane마다 최근 10개 failed jobs
     ]);
     const redisReadDuration = performance.now() - redisStartTime;
+    const active = activeList + leased;
+    const activeJobs = [...activeListJobs, ...leasedJobs];
 
     // Redis 읽기 시간 측정
     this.redisReadTimeSum += redisReadDuration;
@@ -485,7 +735,11 @@ class QueueService {
   }
 
   async close() {
+    this.closing = true;
+    this.streamClient?.disconnect();
+    this.streamReader?.disconnect();
     await this.queue.close();
+    await this.priorityQueue?.close();
     logger.info("Queue closed");
   }
 
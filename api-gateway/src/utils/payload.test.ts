@@ -0,0 +1,33 @@
+import { pack } from "msgpackr";
+import { decodeResultMessage, RESULT_BATCH_VERSION } from "./payload";
+
+describe("decodeResultMessage", () => {
+  const results = [
+    { jobId: "1", result: { preprocessed_text: "안녕하세요" }, status: "completed" },
+    { jobId: "2", result: { filter_reason: "Preprocessing failed" }, status: "failed" },
+  ];
+
+  it("배치 메시지(version 2)를 작업별 결과로 풀어냄 (JSON)", () => {
+    const message = Buffer.from(JSON.stringify({ version: RESULT_BATCH_VERSION, results }));
+    expect(decodeResultMessage(message, "json")).toEqual(results);
+  });
+
+  it("Python Worker가 직접 조립한 JSON 배치 메시지도 같은 결과", () => {
+    // python-worker/src/transports/bull.py의 _encode_results 형식 (공백 없음, returnvalue를 그대로 끼워 넣음)
+    const message = Buffer.from(
+      '{"version":2,"results":[{"jobId":"1","result":{"preprocessed_text":"안녕하세요"},"status":"completed"},' +
+        '{"jobId":"2","result":{"filter_reason":"Preprocessing failed"},"status":"failed"}]}'
+    );
+    expect(decodeResultMessage(message, "json")).toEqual(results);
+  });
+
+  it("버전 필드 없는 단건 메시지는 결과 하나 (JSON)", () => {
+    const message = Buffer.from(JSON.stringify(results[0]));
+    expect(decodeResultMessage(message, "json")).toEqual([results[0]]);
+  });
+
+  it("msgpack 배치 / 단건 메시지", () => {
+    expect(decodeResultMessage(pack({ version: RESULT_BATCH_VERSION, results }), "msgpack")).toEqual(results);
+    expect(decodeResultMessage(pack(results[1]), "msgpack")).toEqual([results[1]]);
+  });
+});
@@ -0,0 +1,34 @@
+import { pack, unpack } from "msgpackr";
+
+// Python Worker와 주고받는 메시지 직렬화 (QUEUE_SERIALIZER)
+// Bull 작업 hash(data/returnvalue)는 Bull이 관리하므로 항상 JSON
+export type PayloadSerializer = "json" | "msgpack";
+
+// Python Worker 결과 메시지 (pub/sub)
+export interface PreprocessingMessage {
+  jobId: string;
+  result: any;
+  status: string;
+}
+
+// 배치 결과 메시지 형식 버전 (python-worker/src/transports/bull.py의 RESULT_BATCH_VERSION과 같아야 함)
+export const RESULT_BATCH_VERSION = 2;
+
+export const encodePayload = (value: unknown, serializer: PayloadSerializer): string | Buffer =>
+  serializer === "msgpack" ? pack(value) : JSON.stringify(value);
+
+export const decodePayload = (buffer: Buffer, serializer: PayloadSerializer): any =>
+  serializer === "msgpack" ? unpack(buffer) : JSON.parse(buffer.toString("utf8"));
+
+/**
+ * 결과 채널 메시지를 작업별 결과 목록으로 디코딩
+ * - 배치 메시지 (RESULT_PUBLISH_BATCH_SIZE > 1): { version: 2, results: [{ jobId, result, status }, ...] }
+ * - 단건 메시지 (version 없음): { jobId, result, status }
+ */
+export const decodeResultMessage = (
+  message: Buffer,
+  serializer: PayloadSerializer
+): PreprocessingMessage[] => {
+  const payload = decodePayload(message, serializer);
+  return payload.version === RESULT_BATCH_VERSION ? payload.results : [payload];
+};
@@ -8,9 +8,18 @@ echo "Waiting jobs:"
 redis-cli LLEN bull:translation-jobs:wait
 
 echo ""
-echo "Active jobs:"
+echo "Active jobs (leases + active list):"
+redis-cli ZCARD bull:translation-jobs:leases
 redis-cli LLEN bull:translation-jobs:active
 
+echo ""
+echo "Expired leases (회수 대기, 워커가 죽은 작업):"
+redis-cli ZCOUNT bull:translation-jobs:leases -inf "$(date +%s)000"
+
+echo ""
+echo "Live workers (최근 heartbeat):"
+redis-cli ZRANGE bull:translation-jobs:workers 0 -1 WITHSCORES
+
 echo ""
 echo "Completed jobs (recent):"
 redis-cli ZCARD bull:translation-jobs:completed
@@ -18,9 +18,22 @@ for job_id in $active_jobs; do
     ((count++))
 done
 
+# Lease(처리 중 작업 sorted set)에 남은 job들도 completed로 이동
+leased_jobs=$(redis-cli ZRANGE bull:translation-jobs:leases 0 -1)
+
+for job_id in $leased_jobs; do
+    redis-cli ZREM bull:translation-jobs:leases "$job_id" > /dev/null
+
+    timestamp=$(date +%s)000
+    redis-cli ZADD bull:translation-jobs:completed "$timestamp" "$job_id" > /dev/null
+
+    ((count++))
+done
+
 echo "Cleaned up $count jobs"
 echo ""
 echo "=== New Queue Status ==="
 echo "Waiting: $(redis-cli LLEN bull:translation-jobs:wait)"
 echo "Active: $(redis-cli LLEN bull:translation-jobs:active)"
+echo "Leased: $(redis-cli ZCARD bull:translation-jobs:leases)"
 echo "Completed: $(redis-cli ZCARD bull:translation-jobs:completed)"
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+직렬화 벤치마크 (json / orjson / msgpack)
+실제 채팅을 전처리한 결과로 작업 data, 단건 결과 메시지, 배치 결과 메시지의
+인코딩/디코딩 시간과 크기를 비교
+
+실행: python benchmark_serialization.py [반복 횟수]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.degradation import LEVELS
+from src.preprocessor.text_processor import TextPreprocessor
+from src.serialization import available_serializers, get_serializer
+from src.transports.bull import RESULT_BATCH_VERSION
+from loguru import logger
+
+CHATS = [
+    "ㅋㅋㅋㅋㅋ",
+    "/웃음/ ㅋㅋ 개꿀잼 ㄹㅇ",
+    "ㄹㅈㄷ 이거 진짜 레게노 /오이루/",
+    "사무시레서 일해요 ㅠㅠㅠㅠ",
+    "오늘날씨가좋네요그래서산책갔어요",
+    "별풍 100개 감사합니다!!!!",
+    "hello world",
+    "ㅇㅈ 이번 판 미쳤다 ㄷㄷㄷ",
+    "방장님 목소리 너무 좋아요 ㅎㅎ",
+    "<b>안녕</b>하세요!!!!",
+    "아니 그걸 왜 거기서 쓰냐고 ㅋㅋㅋㅋ 진짜 답답하네",
+    "구독 눌렀어요~ 오늘도 화이팅",
+]
+
+
+def build_payloads(preprocessor: TextPreprocessor) -> dict:
+    """실제 전처리 결과로 Gateway ↔ Worker 메시지 구성"""
+    jobs, results = [], []
+    for i, text in enumerate(CHATS):
+        start = time.perf_counter()
+        preprocessed_text, filtered, filter_reason, emoticons = preprocessor.preprocess(text)
+        jobs.append({
+            "id": f"job-{i}",
+            "text": text,
+            "targetLanguages": ["en", "ja", "zh"],
+            "options": {"expandAbbreviations": True, "fixTypos": True},
+            "createdAt": int(time.time() * 1000),
+        })
+        results.append({
+            "jobId": f"job-{i}",
+            "result": {
+                "original_text": text,
+                "preprocessed_text": preprocessed_text,
+                "preprocessing_time_ms": (time.perf_counter() - start) * 1000,
+                "filtered": filtered,
+                "filter_reason": filter_reason if filtered else None,
+                "emoticons": [list(emoticon) for emoticon in emoticons],
+                "degradation_level": LEVELS[0],
+            },
+            "status": "completed",
+        })
+    return {
+        "job data": jobs,
+        "result message": results,
+        "batch message (32)": [{"version": RESULT_BATCH_VERSION, "results": (results * 3)[:32]}],
+    }
+
+
+def measure(serializer, messages: list, iterations: int) -> tuple[float, float, float]:
+    """메시지당 평균 인코딩 시간(µs), 디코딩 시간(µs), 크기(bytes)"""
+    encoded = [serializer.dumps(message) for message in messages]
+    for message, data in zip(messages, encoded):
+        assert serializer.loads(data) == message
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for message in messages:
+            serializer.dumps(message)
+    encode_us = (time.perf_counter() - start) * 1e6 / (iterations * len(messages))
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for data in encoded:
+            serializer.loads(data)
+    decode_us = (time.perf_counter() - start) * 1e6 / (iterations * len(messages))
+
+    return encode_us, decode_us, sum(len(data) for data in encoded) / len(encoded)
+
+
+def main(iterations: int = 2000):
+    logger.info("Preprocessing sample chats...")
+    payloads = build_payloads(TextPreprocessor())
+
+    names = available_serializers()
+    logger.info(f"Serializers: {names} (iterations: {iterations})\n")
+
+    for kind, messages in payloads.items():
+        logger.info(f"=== {kind} ===")
+        baseline = None
+        for name in names:
+            encode_us, decode_us, size = measure(get_serializer(name), messages, iterations)
+            baseline = baseline or (encode_us, decode_us, size)
+            logger.info(
+                f"{name:<8} encode={encode_us:7.2f}µs ({baseline[0] / encode_us:4.1f}x) | "
+                f"decode={decode_us:7.2f}µs ({baseline[1] / decode_us:4.1f}x) | "
+                f"size={size:7.1f}B ({size / baseline[2]:.0%})"
+            )
+        logger.info("")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
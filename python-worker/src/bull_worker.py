@@ -3,15 +3,26 @@ Bull 큐 호환 Worker
 Bull이 Redis에 저장하는 형식을 읽어서 처리
 """
 import asyncio
-import json
+import signal
 import time
 import sys
-from redis import Redis
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from redis.asyncio import BlockingConnectionPool, Redis
 from loguru import logger
 
+from src.concurrency import AdaptiveConcurrencyController, ConcurrencyLimiter
 from src.config import settings
+from src.degradation import LEVELS, DegradationPolicy, degrade_options
+from src.fair_queue import FairJobQueue
+from src.metrics import MetricsRegistry, start_metrics_server
 from src.models import TranslationJob, TranslationResult, PreprocessOptions
 from src.preprocessor.text_processor import TextPreprocessor
+from src.preprocessor.cache import PreprocessCache, SingleFlight
+from src.preprocessor.pool import PreprocessPool
+from src.preprocessor.stage_metrics import STAGE_BUCKETS, format_stage_summary
+from src.transports.bull import BullTransport
+from src.transports.streams import StreamsTransport
 
 # 번역 서비스는 더 이상 사용하지 않음 (API Gateway에서 처리)
 
@@ -23,18 +34,128 @@ logger.add(
     level=settings.log_level
 )
 
-# 전처리기 초기화 (번역은 API Gateway에서 처리)
-preprocessor = TextPreprocessor()
+# 전처리 실행 모드
+# - thread: 이 프로세스에서 모델 로드, 스레드 풀에서 실행 (동시 작업들이 배치 단계에서 합쳐짐)
+# - process: 프로세스 풀의 각 프로세스가 모델 로드, asyncio 쪽은 Redis I/O와 작업 전달만 담당
+# 엔진은 main()에서 생성 (spawn 자식 프로세스의 재귀 생성 방지, supervisor의 fork 이후 스레드 생성)
+preprocessor: TextPreprocessor | None = None
+preprocess_executor: ThreadPoolExecutor | None = None
+preprocess_pool: PreprocessPool | None = None
+# 방송별 공정 스케줄링 (FAIR_SCHEDULING일 때 main()에서 생성)
+fair_queue: FairJobQueue | None = None
+
+
+def init_thread_engine(instance: TextPreprocessor | None = None):
+    """
+    thread 모드 전처리 엔진 초기화
+
+    Args:
+        instance: 미리 로드된 전처리기 (supervisor가 fork 전에 로드한 것), 없으면 백그라운드 로드 시작
+    """
+    global preprocessor, preprocess_executor
+
+    # 전처리기 초기화 (번역은 API Gateway에서 처리)
+    # 모델은 백그라운드에서 동시에 로드, main()에서 준비 완료까지 대기
+    preprocessor = instance or TextPreprocessor(lazy=True)
+    preprocessor.stage_metrics.export_to(stage_latency)
+    preprocessor.enable_spacing_batching(
+        max_batch_size=settings.spacing_batch_size,
+        max_wait_ms=settings.spacing_batch_wait_ms,
+    )
+    preprocessor.enable_typo_batching(
+        max_batch_size=settings.typo_batch_size,
+        max_wait_ms=settings.typo_batch_wait_ms,
+    )
+
+    preprocess_executor = ThreadPoolExecutor(
+        max_workers=settings.worker_concurrency,
+        thread_name_prefix="preprocess",
+    )
+
+
+# 전처리 결과 캐시 (모든 worker_task가 공유)
+preprocess_cache = PreprocessCache(
+    maxsize=settings.preprocess_cache_size,
+    ttl=settings.preprocess_cache_ttl,
+)
+# 처리 중인 동일 입력(텍스트 + 옵션)은 한 번만 전처리하고 결과를 함께 받음 (작업 완료 처리는 작업마다)
+preprocess_flight = SingleFlight()
+
+# 대기열이 밀리면 비싼 전처리 단계부터 생략 (main()에서 DEGRADE_ENABLED일 때만 단계 조정 태스크 실행)
+degradation_policy = DegradationPolicy(
+    depth_thresholds=settings.degrade_depth_thresholds,
+    age_thresholds_ms=settings.degrade_age_thresholds_ms,
+    recover_ratio=settings.degrade_recover_ratio,
+    min_hold=settings.degrade_min_hold,
+    interval=settings.degrade_interval,
+)
+
+# 메트릭 (누적 카운터, HTTP /metrics로 노출, 큐 길이 등 수집 시점에 읽는 값은 main()에서 등록)
+metrics = MetricsRegistry()
+jobs_started = metrics.counter("preprocess_jobs_started_total", "Jobs taken from the queue")
+jobs_completed = metrics.counter("preprocess_jobs_completed_total", "Jobs completed and published", ("lane",))
+jobs_failed = metrics.counter("preprocess_jobs_failed_total", "Failed jobs by reason", ("reason",))
+jobs_per_second = metrics.gauge("preprocess_jobs_per_second", "Completed jobs in the last second (this process)")
+job_age = metrics.histogram(
+    "preprocess_job_age_seconds", "Time from job creation (gateway) to dequeue", labelnames=("lane",),
+)
+preprocess_latency = metrics.histogram("preprocess_latency_seconds", "Preprocessing time per job", labelnames=("lane",))
+stage_latency = metrics.histogram(
+    "preprocess_stage_seconds", "Preprocessing time per stage and text (batch waits are *_batch_wait stages)",
+    buckets=STAGE_BUCKETS, labelnames=("stage",),
+)
+
 
-# RPS 모니터링 카운터
-job_processing_counter = 0
-preprocessing_complete_counter = 0
+async def cached_preprocess(text: str, options: PreprocessOptions, level: int = 0) -> tuple:
+    """
+    캐시를 거쳐 전처리 수행 (키: 원문 텍스트 + 옵션 플래그)
+
+    부하 단계(level)가 있어도 전체 품질 결과가 캐시에 있으면 그대로 사용하고, 없을 때만 단계를 낮춰 실행
+
+    Returns:
+        (preprocessed_text, filtered, filter_reason, emoticons, 실제로 적용된 부하 단계)
+    """
+    cache_key = (text, options.cache_key())
+    cached = None
+    if level > 0:
+        cached = preprocess_cache.get(cache_key, count_miss=False)
+        if cached is None:
+            options = degrade_options(options, level)
+            cache_key = (text, options.cache_key())
+        else:
+            level = 0
+
+    if cached is None:
+        cached = preprocess_cache.get(cache_key)
+    if cached is None:
+        # 같은 입력을 처리 중이면 그 결과를 기다림 (채팅 도배 시 전처리 한 번)
+        cached = await preprocess_flight.do(cache_key, partial(run_preprocess, text, options, cache_key))
+
+    preprocessed_text, filtered, filter_reason, emoticons = cached
+    return preprocessed_text, filtered, filter_reason, list(emoticons), level
+
+
+async def run_preprocess(text: str, options: PreprocessOptions, cache_key: tuple) -> tuple:
+    """스레드/프로세스 풀에서 전처리 실행 후 캐시에 저장 (캐시와 같은 형식 반환)"""
+    # 필드명이 preprocess() 인자명과 동일
+    kwargs = options.model_dump()
+
+    if preprocess_pool is not None:
+        result = await preprocess_pool.preprocess(text, kwargs)
+    else:
+        result = await asyncio.get_running_loop().run_in_executor(
+            preprocess_executor, partial(preprocessor.preprocess, text, **kwargs)
+        )
 
+    preprocessed_text, filtered, filter_reason, emoticons = result
+    value = (preprocessed_text, filtered, filter_reason, tuple(emoticons))
+    preprocess_cache.put(cache_key, value)
+    return value
 
-def process_bull_job(job_id: str, job_data: dict) -> dict:
+
+async def process_bull_job(job_id: str, job_data: dict, lane: str = settings.queue_name) -> dict:
     """Bull 작업 처리 - 전처리 전용 (번역은 API Gateway에서 처리)"""
-    global job_processing_counter
-    job_processing_counter += 1  # RPS 카운터
+    jobs_started.inc()
 
     start_time = time.time()
 
@@ -48,19 +169,16 @@ def process_bull_job(job_id: str, job_data: dict) -> dict:
 
         logger.debug(f"Processing job {job_id}: '{job.text[:50]}...')")
 
-        # 옵션 설정
-        options = job.options or PreprocessOptions()
+        # 작업 대기 시간 (Gateway에서 생성된 뒤 처리 시작까지)
+        if job.created_at:
+            age_ms = start_time * 1000 - job.created_at
+            degradation_policy.observe_age(age_ms)
+            job_age.observe(age_ms / 1000, lane=lane)
 
-        # 1. 전처리
+        # 1. 전처리 (캐시 우선, 스레드/프로세스 풀에서 실행, 캐시에 없으면 부하 단계에 따라 모델 단계 생략)
         try:
-            preprocessed_text, filtered, filter_reason, emoticons = preprocessor.preprocess(
-                text=job.text,
-                expand_abbreviations=options.expand_abbreviations,
-                filter_profanity=options.filter_profanity,
-                normalize_repeats=options.normalize_repeats,
-                remove_emoticons=options.remove_emoticons,
-                fix_typos=options.fix_typos,
-                add_spacing=options.add_spacing,
+            preprocessed_text, filtered, filter_reason, emoticons, level = await cached_preprocess(
+                job.text, job.options or PreprocessOptions(), degradation_policy.level,
             )
         except Exception as e:
             print(e)
@@ -73,6 +191,7 @@ def process_bull_job(job_id: str, job_data: dict) -> dict:
         #     detected_lang = "ko"  # 기본값
 
         processing_time = (time.time() - start_time) * 1000  # ms
+        preprocess_latency.observe(processing_time / 1000, lane=lane)
 
         # 3. 전처리 결과 반환 (번역은 API Gateway에서 수행)
         result = {
@@ -82,8 +201,10 @@ def process_bull_job(job_id: str, job_data: dict) -> dict:
             "preprocessing_time_ms": processing_time,
             "filtered": filtered,
             "filter_reason": filter_reason if filtered else None,
-            "emoticons": emoticons
+            "emoticons": emoticons,
+            "degradation_level": LEVELS[level],
         }
+        degradation_policy.record_job(level)
 
         logger.debug(f"Job {job_id} preprocessing completed in {processing_time:.0f}ms")
 
@@ -94,220 +215,541 @@ def process_bull_job(job_id: str, job_data: dict) -> dict:
         raise
 
 
-async def get_waiting_jobs(redis_conn: Redis, queue_name: str):
-    """Bull 큐에서 대기 중인 작업 가져오기 (async 최적화)"""
-    # Bull은 bull:{queue_name}:wait 리스트에 작업 ID 저장
-    wait_key = f"bull:{queue_name}:wait"
-    active_key = f"bull:{queue_name}:active"
-
-    logger.debug(f"Polling queue: {wait_key}")
-
-    while True:
-        # BRPOPLPUSH를 별도 스레드에서 실행 (asyncio 이벤트 루프 블록 방지)
-        job_id = await asyncio.to_thread(
-            redis_conn.brpoplpush, wait_key, active_key, 0.1
-        )
-
-        if job_id:
-            decoded_id = job_id.decode('utf-8')
-            logger.debug(f"Received job ID: {decoded_id}")
-            yield decoded_id
-        # 타임아웃 시 로깅 제거 (성능 향상)
-
-
-def get_job_data(redis_conn: Redis, queue_name: str, job_id: str):
-    """작업 데이터 가져오기 (최적화됨)"""
-    job_key = f"bull:{queue_name}:{job_id}"
-
-    # Bull은 작업 데이터를 JSON으로 저장
-    job_data_raw = redis_conn.hget(job_key, 'data')
-
+def parse_job_data(job_id: str, job_data_raw, serializer) -> dict | None:
+    """작업 data 필드 파싱 (Bull은 JSON, Streams는 큐별 직렬화 방식)"""
     if not job_data_raw:
-        logger.error(f"Job {job_id} data not found in key: {job_key}")
+        logger.error(f"Job {job_id} data not found")
         return None
+    if isinstance(job_data_raw, dict):
+        # 공정 스케줄링에서 이미 파싱한 data
+        return job_data_raw
 
     try:
-        # JSON 파싱
-        if isinstance(job_data_raw, bytes):
-            job_data_raw = job_data_raw.decode('utf-8')
-
-        job_data = json.loads(job_data_raw)
-        return job_data
+        return serializer.loads(job_data_raw)
     except Exception as e:
         logger.error(f"Failed to parse job data: {e}", exc_info=True)
         return None
 
-def complete_job(redis_conn: Redis, queue_name: str, job_id: str, result: dict):
-    """전처리 완료 이벤트 발행 (API Gateway가 전처리 결과를 받아서 gRPC 호출)"""
-    global preprocessing_complete_counter
-    preprocessing_complete_counter += 1  # RPS 카운터
-
-    logger.debug(f"Publishing preprocessing result for job {job_id}")
 
-    job_key = f"bull:{queue_name}:{job_id}"
+def classify_job(transport, item: tuple) -> tuple:
+    """
+    공정 스케줄링 분류: 키 (lane, 방송), 비용 (텍스트 길이), 가중치 (lane 가중치)
+    파싱한 data를 작업에 담아 워커에서 다시 파싱하지 않음
+    """
+    job_id, job_data_raw, receipt = item
+    lane = transport.lane_name(receipt)
+    weight = transport.lane_weight(receipt)
+
+    job_data = parse_job_data(job_id, job_data_raw, transport.job_serializer)
+    if not isinstance(job_data, dict):
+        # 파싱 실패는 워커에서 실패 처리 (방송 정보 없는 작업과 같은 키)
+        return (lane, ""), 1, weight, item
+
+    broadcast = job_data.get("broadcast") or {}
+    key = broadcast.get("bj_id") or broadcast.get("broadcast_index")
+    text = job_data.get("text")
+    cost = len(text) if isinstance(text, str) else 1
+    return (lane, "" if key is None else str(key)), max(1, cost), weight, (job_id, job_data, receipt)
+
+
+async def shed_job(transport, buffer: ConcurrencyLimiter, item: tuple):
+    """방송별 상한을 넘어 버린 작업 실패 처리 (버퍼 자리 반환)"""
+    job_id, _, receipt = item
+    buffer.release()
+    jobs_failed.inc(reason="broadcast_backlog")
+    logger.debug(f"Job {job_id} shed (broadcast backlog limit)")
+    await transport.fail(job_id, "Broadcast backlog limit exceeded", receipt)
+
+
+async def handle_job(transport, limiter: ConcurrencyLimiter, worker_id: int, job_id: str, job_data_raw, receipt):
+    """작업 하나 처리 (전처리 후 완료/실패 처리)"""
+    job_start = time.time()
+    job_duration = None
+    try:
+        # 작업 데이터 파싱
+        job_data = parse_job_data(job_id, job_data_raw, transport.job_serializer)
 
-    # 1. 결과 저장 (Bull 호환)
-    redis_conn.hset(job_key, 'returnvalue', json.dumps(result, ensure_ascii=False))
+        if not job_data:
+            jobs_failed.inc(reason="invalid_data")
+            await transport.fail(job_id, "Failed to get job data", receipt)
+            return
 
-    # 2. 상태 업데이트
-    redis_conn.hset(job_key, 'finishedOn', int(time.time() * 1000))
+        # 전처리만 수행
+        result = await process_bull_job(job_id, job_data, transport.lane_name(receipt))
 
-    # 3. active에서 제거하고 completed로 이동
-    redis_conn.lrem(f"bull:{queue_name}:active", 0, job_id)
-    redis_conn.zadd(f"bull:{queue_name}:completed", {job_id: time.time() * 1000})
+        if not result:
+            jobs_failed.inc(reason="preprocessing_failed")
+            await transport.fail(job_id, "Preprocessing failed", receipt)
+            return
 
-    # 4. 전처리 결과를 API Gateway로 전달
-    redis_conn.publish(
-        "bull:preprocessing-results:jobId",
-        json.dumps({
-            'jobId': job_id,
-            'result': result,
-            'status': 'completed'
-        }, ensure_ascii=False)
-    )
-    logger.debug(f"Preprocessing result published for job {job_id}")
-# def complete_job(redis_conn: Redis, queue_name: str, job_id: str, result: dict):
-#     """작업 완료 처리"""
-#     job_key = f"bull:{queue_name}:{job_id}"
-
-#     # 결과 저장
-#     redis_conn.hset(job_key, 'returnvalue', json.dumps(result, ensure_ascii=False))
-
-#     # 상태 업데이트
-#     redis_conn.hset(job_key, 'finishedOn', int(time.time() * 1000))
-
-#     # active에서 제거하고 completed로 이동
-#     redis_conn.lrem(f"bull:{queue_name}:active", 0, job_id)
-#     redis_conn.zadd(f"bull:{queue_name}:completed", {job_id: time.time() * 1000})
-
-#     # 완료 이벤트 발행
-#     redis_conn.publish(f"bull:translation-results:completed", json.dumps({'jobId': job_id}, ensure_ascii=False))
-#     logger.info(f"Job {job_id} marked as completed")
-
-#     # 잡 완료 감지 이벤트 발행
-    # redis_conn.publish(f"bull:translation-results:completed:jobId", json.dumps({'jobId': job_id, 'result': result}, ensure_ascii=False))
-#     logger.info(f"Job {job_id} published event completed : {result}")
-
-def fail_job(redis_conn: Redis, queue_name: str, job_id: str, error: str):
-    """전처리 실패 처리"""
-    # ✨ active 리스트에서 제거 (중요! 안하면 계속 쌓임)
-    redis_conn.lrem(f"bull:{queue_name}:active", 0, job_id)
-
-    redis_conn.publish(
-        "bull:preprocessing-results:jobId",
-        json.dumps({
-            'jobId': job_id,
-            'result': {'filter_reason': error},
-            'status': 'failed'
-        }, ensure_ascii=False)
-    )
+        # 완료 처리 (전처리 결과 발행)
+        await transport.complete(job_id, result, receipt)
+        jobs_completed.inc(lane=transport.lane_name(receipt))
 
-    # job_key = f"bull:{queue_name}:{job_id}"
+        job_duration = (time.time() - job_start) * 1000
+        logger.debug(f"Job {job_id} completed in {job_duration:.0f}ms")
 
-    # # 에러 정보 저장
-    # redis_conn.hset(job_key, 'failedReason', error)
-    # redis_conn.hset(job_key, 'finishedOn', int(time.time() * 1000))
+    except Exception as e:
+        logger.error(f"[Worker-{worker_id}] Error processing job {job_id}: {e}", exc_info=True)
+        jobs_failed.inc(reason="error")
+        await transport.fail(job_id, str(e), receipt)
+    finally:
+        # 완료된 작업의 지연 시간만 동시 처리 제어에 반영 (실패는 자리만 반환)
+        limiter.release(job_duration)
 
-    # # active에서 제거하고 failed로 이동
-    # redis_conn.lrem(f"bull:{queue_name}:active", 0, job_id)
-    # redis_conn.zadd(f"bull:{queue_name}:failed", {job_id: time.time() * 1000})
 
-    # # 실패 이벤트 발행
-    # redis_conn.publish(f"bull:{queue_name}:failed", json.dumps({'jobId': job_id, 'error': error}, ensure_ascii=False))
+async def worker_task(worker_id: int, transport, limiter: ConcurrencyLimiter, jobs: asyncio.Queue):
+    """개별 워커 태스크 (전처리 전용, Redis 연결 풀은 모든 워커가 공유)"""
+    logger.info(f"Worker-{worker_id} started (preprocessing only)")
 
-    logger.error(f"Job {job_id} marked as failed: {error}")
+    while True:
+        job_id, job_data_raw, receipt = await jobs.get()
+        try:
+            await handle_job(transport, limiter, worker_id, job_id, job_data_raw, receipt)
+        except Exception as e:
+            # 실패 처리(transport.fail)까지 실패해도 워커는 계속 다음 작업 처리
+            # (작업은 lease 만료 후 reaper가 되돌림)
+            logger.error(f"[Worker-{worker_id}] Failed to settle job {job_id}: {e}", exc_info=True)
+
+
+async def drain(
+    transport,
+    limiter: ConcurrencyLimiter,
+    workers: list[asyncio.Task],
+    dispatcher: asyncio.Task | None,
+    timeout: float,
+):
+    """
+    종료 신호를 받은 뒤 작업을 잃지 않고 정리
+
+    1. 새 작업 가져오기 중단 (공정 스케줄링 버퍼에서 넘기는 것도 중단)
+    2. 가져온 작업(내부 큐 + 처리 중)이 끝날 때까지 최대 timeout초 대기
+    3. 끝나지 않은 작업은 취소하고, 발행 대기 중인 결과를 보낸 뒤 남은 작업을 대기열로 되돌림
+       (다른 워커가 lease 만료를 기다리지 않고 바로 가져감)
+    """
+    transport.stop_fetching()
+    if dispatcher is not None:
+        dispatcher.cancel()
+    logger.info(f"Draining {limiter.outstanding} in-flight jobs (timeout: {timeout:g}s)...")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while limiter.outstanding > 0 and loop.time() < deadline:
+        await asyncio.sleep(0.05)
+    unfinished = limiter.outstanding
+
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    requeued = await transport.requeue_inflight()
+    logger.info(f"Drain finished: unfinished={unfinished}, requeued={requeued}")
+
+
+def create_transport(redis_conn: Redis, queue_name: str):
+    """QUEUE_TRANSPORT 설정에 따라 작업 전달 방식 생성"""
+    if settings.queue_transport == "streams":
+        if settings.queue_lanes:
+            logger.warning("QUEUE_LANES is only supported by the bull transport, consuming QUEUE_NAME only")
+        return StreamsTransport(redis_conn, queue_name)
+    return BullTransport(redis_conn, queue_name, settings.queue_lanes or None)
+
+
+def log_concurrency_stats(limiter: ConcurrencyLimiter, controller: AdaptiveConcurrencyController | None):
+    """동시 처리 limit 및 컨트롤러 결정 통계 로그"""
+    if controller is None:
+        logger.info(f"[METRIC] CONCURRENCY | limit={limiter.limit} (fixed) | outstanding={limiter.outstanding}")
+        return
+
+    stats = controller.stats()
+    p50 = stats.get('p50_ms')
+    cpu = stats.get('cpu')
+    decisions = " | ".join(f"{name}={count}" for name, count in sorted(stats['decisions'].items()))
+    logger.info(
+        f"[METRIC] CONCURRENCY | limit={stats['limit']} ({controller.min_limit}~{controller.max_limit}) | "
+        f"outstanding={limiter.outstanding} | depth={stats.get('depth', 0)} | "
+        f"p50={'n/a' if p50 is None else f'{p50:.1f}ms'} | baseline={stats.get('baseline_ms') or 0:.1f}ms | "
+        f"cpu={'n/a' if cpu is None else f'{cpu:.0%}'} | {decisions or 'decisions=0'}"
+    )
 
 
-async def worker_task(worker_id: int, queue_name: str):
-    """개별 워커 태스크 (전처리 전용)"""
-    # 각 워커마다 독립적인 Redis 연결 생성
-    redis_conn = Redis(
-        host=settings.redis_host,
-        port=settings.redis_port,
-        password=settings.redis_password,
-        decode_responses=False  # Bull은 바이너리 데이터 사용
+def log_degradation_stats():
+    """부하 단계 및 단계별 처리 작업 수 로그"""
+    stats = degradation_policy.stats()
+    by_level = " | ".join(f"{name}={stats['jobs_by_level'].get(name, 0)}" for name in LEVELS)
+    logger.info(
+        f"[METRIC] DEGRADATION | level={stats['level']} | depth={stats.get('depth', 0)} | "
+        f"job_age_p90={stats.get('job_age_p90_ms') or 0:.0f}ms | {by_level}"
     )
 
-    logger.info(f"Worker-{worker_id} started (preprocessing only)")
 
-    try:
-        async for job_id in get_waiting_jobs(redis_conn, queue_name):
-            try:
-                # 작업 데이터 가져오기
-                job_data = get_job_data(redis_conn, queue_name, job_id)
+def log_preprocess_stats():
+    """전처리 캐시 및 배치 통계 로그"""
+    if preprocess_cache.enabled:
+        stats = preprocess_cache.stats()
+        logger.info(
+            f"[METRIC] PREPROCESS_CACHE | size={stats['size']}/{stats['maxsize']} | "
+            f"hits={stats['hits']} | misses={stats['misses']} | evictions={stats['evictions']} | "
+            f"expirations={stats['expirations']} | hit_rate={stats['hit_rate']:.2%}"
+        )
 
-                if not job_data:
-                    fail_job(redis_conn, queue_name, job_id, "Failed to get job data")
-                    continue
+    flight = preprocess_flight.stats()
+    logger.info(
+        f"[METRIC] SINGLE_FLIGHT | executed={flight['executed']} | coalesced={flight['coalesced']} | "
+        f"inflight={flight['inflight']}"
+    )
 
-                job_start = time.time()
+    if preprocessor is None:
+        return
 
-                # 전처리만 수행
-                result = process_bull_job(job_id, job_data)
+    stage_summary = format_stage_summary(preprocessor.stage_metrics.interval_snapshot(), TextPreprocessor.STAGES)
+    if stage_summary:
+        logger.info(f"[METRIC] PREPROCESS_STAGES | {stage_summary}")
 
-                if not result:
-                    fail_job(redis_conn, queue_name, job_id, "Preprocessing failed")
-                    continue
+    fast_path = preprocessor.fast_path_stats()
+    skipped = " | ".join(f"{stage}_skipped={count}" for stage, count in sorted(fast_path["skipped"].items()))
+    logger.info(f"[METRIC] FAST_PATH | messages={fast_path['messages']} | {skipped or 'skipped=0'}")
 
-                # 완료 처리 (전처리 결과 발행)
-                complete_job(redis_conn, queue_name, job_id, result)
+    for name, batcher in (("SPACING_BATCH", preprocessor.spacing_batcher), ("TYPO_BATCH", preprocessor.typo_batcher)):
+        if batcher is None:
+            continue
+        stats = batcher.stats()
+        logger.info(
+            f"[METRIC] {name} | batches={stats['batches']} | items={stats['items']} | "
+            f"avg_batch_size={stats['avg_batch_size']:.1f} | pending={stats['pending']}"
+        )
 
-                job_duration = (time.time() - job_start) * 1000
-                logger.debug(f"Job {job_id} completed in {job_duration:.0f}ms")
 
-            except Exception as e:
-                logger.error(f"[Worker-{worker_id}] Error processing job {job_id}: {e}", exc_info=True)
-                fail_job(redis_conn, queue_name, job_id, str(e))
+def log_transport_stats(transport):
+    """작업 전달 방식별 통계 로그 (처리 중 작업 수, 회수된 작업 수 등)"""
+    stats = " | ".join(
+        f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+        for key, value in transport.stats().items()
+    )
+    logger.info(f"[METRIC] TRANSPORT {transport.name} | {stats}")
+
+
+def readiness() -> dict:
+    """/health 준비 상태 (process 모드는 풀의 모든 프로세스 준비, thread 모드는 전처리기 모델 로드 + 워밍업)"""
+    if preprocess_pool is not None:
+        return {"ready": preprocess_pool.ready, "processes": preprocess_pool.processes}
+    if preprocessor is None:
+        return {"ready": False}
+    return preprocessor.readiness()
+
+
+def register_runtime_metrics(transport, limiter: ConcurrencyLimiter, controller: AdaptiveConcurrencyController | None):
+    """수집 시점에 읽는 메트릭 등록 (처리 중 작업 수, 큐 길이, 동시 처리 결정, 캐시/회수/부하 단계 카운터)"""
+    metrics.callback("preprocess_jobs_in_flight", "Jobs dequeued and not finished (this process)", lambda: limiter.outstanding)
+    metrics.callback("preprocess_concurrency_limit", "Current concurrency limit", lambda: limiter.limit)
+    if controller is not None:
+        metrics.callback(
+            "preprocess_concurrency_decision", "Last adaptive concurrency decision (1 = current)",
+            controller.decision_flags, labelname="decision",
+        )
+        metrics.callback(
+            "preprocess_concurrency_decisions_total", "Adaptive concurrency decisions",
+            lambda: dict(controller.decisions), kind="counter", labelname="decision",
+        )
+        metrics.callback(
+            "preprocess_concurrency_cpu", "CPU utilization seen by the concurrency controller (cgroup quota or host)",
+            lambda: controller.last.get("cpu") or 0,
+        )
+    metrics.callback(
+        "preprocess_queue_depth", "Jobs waiting / being processed (whole queue, all workers)",
+        transport.queue_depths, labelname="state",
+    )
+    metrics.callback("preprocess_lane_depth", "Jobs waiting per lane (queue)", transport.lane_depths, labelname="lane")
+
+    def cache_counter(key):
+        return lambda: preprocess_cache.stats()[key]
+
+    metrics.callback("preprocess_cache_hits_total", "Preprocess cache hits", cache_counter("hits"), kind="counter")
+    metrics.callback("preprocess_cache_misses_total", "Preprocess cache misses", cache_counter("misses"), kind="counter")
+    metrics.callback("preprocess_cache_evictions_total", "Preprocess cache evictions", cache_counter("evictions"), kind="counter")
+    metrics.callback("preprocess_cache_size", "Preprocess cache entries", cache_counter("size"))
+    metrics.callback(
+        "preprocess_coalesced_total", "Jobs that reused an identical in-flight preprocessing",
+        lambda: preprocess_flight.coalesced, kind="counter",
+    )
+
+    # 회수 카운터: bull은 requeued/stalled_failed, streams는 reclaimed
+    recovery_keys = ("requeued", "stalled_failed", "reclaimed")
+    metrics.callback(
+        "preprocess_jobs_recovered_total", "Stalled jobs recovered by this worker",
+        lambda: {key: value for key, value in transport.stats().items() if key in recovery_keys},
+        kind="counter", labelname="action",
+    )
+    if fair_queue is not None:
+        metrics.callback("preprocess_fair_buffered", "Jobs fetched ahead and waiting for their broadcast's turn", fair_queue.qsize)
+        metrics.callback(
+            "preprocess_fair_broadcasts", "Broadcasts with buffered jobs", lambda: fair_queue.stats()["keys"],
+        )
+    metrics.callback("preprocess_degradation_level", "Current degradation level (0=full)", lambda: degradation_policy.level)
+    metrics.callback(
+        "preprocess_jobs_by_level_total", "Jobs processed per degradation level",
+        lambda: dict(degradation_policy.jobs_by_level), kind="counter", labelname="level",
+    )
 
-    except KeyboardInterrupt:
-        logger.info(f"Worker-{worker_id} shutting down...")
-    except Exception as e:
-        logger.error(f"Worker-{worker_id} error: {e}", exc_info=True)
-    finally:
-        # Redis 연결 종료
-        redis_conn.close()
-        logger.info(f"Worker-{worker_id} Redis connection closed")
 
+def log_lane_stats():
+    """lane별 완료 수 / 대기 시간 / 전처리 시간 로그 (lane이 여러 개일 때)"""
+    lanes = list(settings.queue_lanes)
+    if len(lanes) < 2:
+        return
+    logger.info("[METRIC] LANES | " + " | ".join(
+        f"{lane}: completed={jobs_completed.value(lane=lane):.0f} "
+        f"age_p95={job_age.percentile(95, lane=lane) * 1000:.0f}ms "
+        f"latency_p95={preprocess_latency.percentile(95, lane=lane) * 1000:.0f}ms"
+        for lane in lanes
+    ))
+
+
+def log_fair_stats():
+    """방송별 공정 스케줄링 버퍼 로그 (버퍼에 가장 많이 쌓인 방송)"""
+    stats = fair_queue.stats()
+    top = ", ".join(f"{lane}/{broadcast or '-'}={count}" for (lane, broadcast), count in stats["top"])
+    logger.info(
+        f"[METRIC] FAIR | buffered={stats['buffered']} | broadcasts={stats['keys']} | "
+        f"shed={stats['shed']} | top={top or 'none'}"
+    )
 
-async def monitor_rps():
-    """RPS 모니터링 태스크"""
-    global job_processing_counter, preprocessing_complete_counter
 
+async def monitor_rps(transport, limiter: ConcurrencyLimiter, controller: AdaptiveConcurrencyController | None = None):
+    """RPS 모니터링 태스크 (누적 카운터의 차이로 초당 처리량 계산)"""
+    elapsed = 0
+    last_completed = jobs_completed.total()
+    interval_started, interval_completed = jobs_started.total(), last_completed
     while True:
         await asyncio.sleep(1)
-        # logger.info(f"[METRIC] PYTHON_WORKER | job_processing_rps={job_processing_counter} | preprocessing_complete_rps={preprocessing_complete_counter}")
-        job_processing_counter = 0
-        preprocessing_complete_counter = 0
-
+        completed = jobs_completed.total()
+        jobs_per_second.set(completed - last_completed)
+        last_completed = completed
+
+        # 캐시/배치 통계 (크기 조정용)
+        elapsed += 1
+        interval = settings.preprocess_stats_log_interval
+        if interval > 0 and elapsed % interval == 0:
+            started = jobs_started.total()
+            logger.info(
+                f"[METRIC] PYTHON_WORKER | job_processing_rps={(started - interval_started) / interval:.1f} | "
+                f"preprocessing_complete_rps={(completed - interval_completed) / interval:.1f} | "
+                f"failed={jobs_failed.total():.0f} | job_age_p95={job_age.percentile(95) * 1000:.0f}ms | "
+                f"latency_p95={preprocess_latency.percentile(95) * 1000:.0f}ms"
+            )
+            interval_started, interval_completed = started, completed
+            log_lane_stats()
+            log_preprocess_stats()
+            log_concurrency_stats(limiter, controller)
+            log_transport_stats(transport)
+            if fair_queue is not None:
+                log_fair_stats()
+            if settings.degrade_enabled:
+                log_degradation_stats()
+
+
+async def main(preprocessor_instance: TextPreprocessor | None = None):
+    """
+    메인 워커 루프 (전처리 전용)
+
+    Args:
+        preprocessor_instance: 미리 로드된 전처리기 (supervisor 자식 프로세스용, thread 모드 전용)
+    """
+    global preprocess_pool, fair_queue
 
-async def main():
-    """메인 워커 루프 (전처리 전용)"""
     queue_name = settings.queue_name
     concurrency = settings.worker_concurrency
 
     logger.info("Starting preprocessing worker...")
     logger.info(f"Redis: {settings.redis_host}:{settings.redis_port}")
-    logger.info(f"Queue: {queue_name}")
-    logger.info(f"Concurrency: {concurrency} workers")
+    logger.info(f"Queue: {queue_name} (transport: {settings.queue_transport})")
+    if settings.queue_lanes:
+        logger.info(f"Queue lanes (weight): {settings.queue_lanes}")
+    if settings.concurrency_adaptive:
+        logger.info(f"Concurrency: adaptive {settings.concurrency_min}~{concurrency} workers")
+    else:
+        logger.info(f"Concurrency: {concurrency} workers")
+    logger.info(f"Preprocess mode: {settings.preprocess_mode}")
+    logger.info(f"Preprocess cache: size={settings.preprocess_cache_size}, ttl={settings.preprocess_cache_ttl}s")
+    logger.info(f"Spacing batch: size={settings.spacing_batch_size}, wait={settings.spacing_batch_wait_ms}ms")
+    logger.info(f"Typo batch: size={settings.typo_batch_size}, wait={settings.typo_batch_wait_ms}ms")
+    logger.info(f"Dequeue batch: max={settings.dequeue_batch_size}, lease: {settings.job_lease_timeout}s")
+    logger.info(
+        f"Heartbeat: {settings.worker_heartbeat_interval}s, stalled check: {settings.stalled_check_interval}s "
+        f"(max stalled: {settings.job_max_stalled_count})"
+    )
+    if settings.fair_scheduling:
+        logger.info(
+            f"Fair scheduling: buffer={settings.fair_buffer_size}, quantum={settings.fair_quantum}, "
+            f"max per broadcast={settings.fair_max_pending_per_broadcast or 'unlimited'}"
+        )
+    logger.info(f"Redis max connections: {settings.redis_max_connections}")
+    logger.info(f"Metrics port: {settings.metrics_port or 'disabled'}")
     logger.info("Mode: Preprocessing only (translation handled by API Gateway)")
+
+    # 모델 로드 중에도 /health(503)와 /metrics에 응답하도록 먼저 시작 (런타임 메트릭은 아래에서 등록)
+    metrics_server = None
+    if settings.metrics_port > 0:
+        metrics_server = await start_metrics_server(
+            metrics, settings.metrics_host, settings.metrics_port, readiness=readiness,
+        )
+
+    if settings.preprocess_mode == "process":
+        preprocess_pool = PreprocessPool(
+            processes=settings.preprocess_processes or None,
+            log_level=settings.log_level,
+            stats_log_interval=settings.preprocess_stats_log_interval,
+            stage_histogram=stage_latency,
+        )
+        logger.info(f"Starting preprocess pool ({preprocess_pool.processes} processes)...")
+        await preprocess_pool.start(settings.preprocess_pool_start_timeout)
+    else:
+        init_thread_engine(preprocessor_instance)
+
+        # 모델 로드 + 워밍업이 끝나기 전에는 큐에서 작업을 가져오지 않음
+        logger.info("Waiting for preprocessing models...")
+        if not await asyncio.to_thread(preprocessor.wait_ready):
+            raise RuntimeError(f"Preprocessing models failed to load: {preprocessor.readiness()}")
+        logger.info(f"Preprocessor ready: {preprocessor.readiness()}")
+
+    # 공유 Redis 연결 풀 (연결 수 상한, 모두 사용 중이면 반환될 때까지 대기)
+    redis_conn = Redis(
+        connection_pool=BlockingConnectionPool(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_password,
+            max_connections=settings.redis_max_connections,
+        ),
+        decode_responses=False  # Bull은 바이너리 데이터 사용
+    )
+
+    transport = create_transport(redis_conn, queue_name)
+
+    # fetcher → 내부 큐 → 워커
+    # 가져온 뒤 끝나지 않은 작업 수는 limiter가 제한 (워커 태스크 수 = limit 상한)
+    jobs: asyncio.Queue = asyncio.Queue()
+    depth = transport.depth
+
+    # 공정 스케줄링: fetcher → 방송별 버퍼 (buffer가 제한) → dispatch (limiter가 제한) → 내부 큐 → 워커
+    fetch_queue, fetch_limiter = jobs, None
+    if settings.fair_scheduling:
+        buffer = ConcurrencyLimiter(settings.fair_buffer_size)
+        fair_queue = FairJobQueue(
+            partial(classify_job, transport),
+            partial(shed_job, transport, buffer),
+            quantum=settings.fair_quantum,
+            max_per_key=settings.fair_max_pending_per_broadcast,
+            # 방송 정보가 없는 작업(API 직접 호출 등)은 상한 없이 버퍼 크기까지만
+            capped=lambda key: bool(key[1]),
+        )
+        fetch_queue, fetch_limiter = fair_queue, buffer
+
+        # 버퍼에 미리 가져온 작업도 대기 중인 작업
+        async def depth() -> int:
+            return await transport.depth() + fair_queue.qsize()
+
+    controller = None
+    if settings.concurrency_adaptive:
+        limiter = ConcurrencyLimiter(min(settings.concurrency_min, concurrency))
+        controller = AdaptiveConcurrencyController(
+            limiter,
+            depth,
+            min_limit=settings.concurrency_min,
+            max_limit=concurrency,
+            interval=settings.concurrency_interval,
+            cpu_target=settings.concurrency_cpu_target,
+            latency_tolerance=settings.concurrency_latency_tolerance,
+            backoff=settings.concurrency_backoff,
+        )
+    else:
+        limiter = ConcurrencyLimiter(concurrency)
+    fetch_limiter = fetch_limiter or limiter
+
+    if metrics_server is not None:
+        register_runtime_metrics(transport, limiter, controller)
+
+    # SIGTERM(롤링 배포, docker stop) / SIGINT를 받으면 drain 후 종료
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def request_stop(signum: int):
+        name = signal.Signals(signum).name
+        if stopping.is_set():
+            logger.info(f"Received {name} again, already draining")
+            return
+        logger.info(f"Received {name}, stopping...")
+        stopping.set()
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, request_stop, signum)
+
     logger.info("Workers started, waiting for jobs...")
 
+    running: list[asyncio.Task] = []
+    fatal = False
     try:
         # 여러 워커를 병렬로 실행
         workers = [
-            worker_task(worker_id=i+1, queue_name=queue_name)
+            asyncio.create_task(
+                worker_task(worker_id=i+1, transport=transport, limiter=limiter, jobs=jobs), name=f"Worker-{i+1}"
+            )
             for i in range(concurrency)
         ]
-
-        # RPS 모니터링 태스크 추가
-        tasks = workers + [monitor_rps()]
-
-        await asyncio.gather(*tasks)
+        dispatcher = None
+        if fair_queue is not None:
+            dispatcher = asyncio.create_task(fair_queue.dispatch(fetch_limiter, limiter, jobs), name="dispatcher")
+
+        # 작업 가져오기 + RPS 모니터링 태스크 추가
+        tasks = [transport.fetch(fetch_queue, fetch_limiter), monitor_rps(transport, limiter, controller)]
+        tasks += transport.background_tasks(fetch_queue, fetch_limiter)
+        if controller is not None:
+            tasks.append(controller.run())
+        if settings.degrade_enabled:
+            tasks.append(degradation_policy.run(depth))
+
+        running = workers + [asyncio.create_task(task, name=task.__qualname__) for task in tasks]
+        running += [dispatcher] if dispatcher else []
+        stop_wait = asyncio.ensure_future(stopping.wait())
+        running.append(stop_wait)
+
+        # 종료 신호를 받거나 태스크가 끝날 때까지 실행
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        if not stopping.is_set():
+            # 워커/가져오기/분배 태스크는 종료 신호 전에 끝나지 않음: 끝났다면 처리가 멈춘 것이므로
+            # drain 후 0이 아닌 코드로 종료 (supervisor/컨테이너가 다시 띄움)
+            fatal = True
+            for task in done:
+                if task.cancelled():
+                    logger.error(f"Task {task.get_name()} was cancelled unexpectedly")
+                elif task.exception() is not None:
+                    logger.opt(exception=task.exception()).error(f"Task {task.get_name()} failed")
+                else:
+                    logger.error(f"Task {task.get_name()} exited unexpectedly")
+        await drain(transport, limiter, workers, dispatcher, settings.worker_drain_timeout)
 
     except KeyboardInterrupt:
         logger.info("All workers shutting down...")
     except Exception as e:
+        fatal = True
         logger.error(f"Main worker error: {e}", exc_info=True)
+    finally:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(signum)
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        if metrics_server is not None:
+            metrics_server.close()
+        await transport.close()
+        await redis_conn.aclose(close_connection_pool=True)
+        logger.info("Redis connection pool closed")
+        if preprocess_executor is not None:
+            preprocess_executor.shutdown(wait=False)
+        if preprocess_pool is not None:
+            preprocess_pool.shutdown()
+
+    if fatal:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
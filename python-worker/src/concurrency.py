@@ -0,0 +1,227 @@
+"""
+적응형 동시 처리 제어
+가져온 뒤 아직 끝나지 않은 작업 수(outstanding)를 limit 이하로 유지하고,
+limit은 대기열 길이 / 작업 지연 시간 / CPU 사용률을 보고 AIMD 방식으로 조정
+CPU 사용률은 컨테이너(cgroup v2) 할당량 대비 사용량, cgroup v2가 아니면 호스트 전체 값
+
+- 증가 (additive): 대기열이 밀려 있고 limit을 다 쓰고 있으며, 지연 시간과 CPU가 여유 있을 때 +sqrt(limit)
+- 감소 (multiplicative): CPU 포화 또는 지연 시간이 기준선 대비 tolerance배 이상 늘었을 때 ×backoff
+- 유지: 그 외 (수요가 없는데 limit을 늘리지 않음)
+"""
+import asyncio
+import math
+import os
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from src.preprocessor.stage_metrics import LatencyHistogram
+
+# CPU 사용률을 읽을 cgroup v2 디렉터리 (컨테이너 안에서는 자기 cgroup)
+CGROUP_DIR = "/sys/fs/cgroup"
+
+# 모든 결정 (메트릭에서 현재 결정만 1로 표시)
+DECISIONS = ("increase", "hold", "decrease_cpu", "decrease_latency")
+
+
+class ConcurrencyLimiter:
+    """가져온 뒤 아직 끝나지 않은 작업 수 제한 (fetcher가 가져오기 전에 자리를 기다림)"""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.outstanding = 0
+        self._room = asyncio.Event()
+        self._room.set()
+        # 컨트롤러가 주기마다 가져가는 지연 시간 구간 기록
+        self.window = LatencyHistogram()
+
+    async def wait_for_room(self) -> int:
+        """자리가 날 때까지 대기 후 지금 더 가져올 수 있는 작업 수 반환"""
+        while self.outstanding >= self.limit:
+            self._room.clear()
+            await self._room.wait()
+        return self.limit - self.outstanding
+
+    def acquire(self, count: int = 1):
+        """작업 count개를 가져옴 (작업 큐에 넣기 전에 호출)"""
+        self.outstanding += count
+
+    def release(self, latency_ms: Optional[float] = None):
+        """작업 하나 완료 (완료/실패 모두)"""
+        self.outstanding -= 1
+        if latency_ms is not None:
+            self.window.record(latency_ms)
+        self._room.set()
+
+    def set_limit(self, limit: int):
+        self.limit = max(1, limit)
+        self._room.set()
+
+    def take_window(self) -> LatencyHistogram:
+        """지난 주기의 지연 시간 기록을 가져가고 새로 시작"""
+        window, self.window = self.window, LatencyHistogram()
+        return window
+
+
+def read_cgroup_cpu_limit(cgroup_dir: str = CGROUP_DIR) -> Optional[float]:
+    """cgroup v2 cpu.max의 CPU 할당량 (quota / period, 코어 수 단위), 제한이 없거나 읽을 수 없으면 None"""
+    try:
+        with open(os.path.join(cgroup_dir, "cpu.max")) as f:
+            quota, period = f.read().split()[:2]
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        return None
+
+
+def read_cgroup_cpu_times(cgroup_dir: str = CGROUP_DIR) -> Optional[tuple[int, int]]:
+    """
+    컨테이너(cgroup v2)의 CPU 시간 (busy, total, μs), cgroup v2가 아니면 None
+
+    total은 경과 시간 × 쓸 수 있는 CPU 수 (cpu.max 할당량, 없으면 이 프로세스가 쓸 수 있는 코어 수)
+    → 다른 컨테이너의 부하는 빼고, 할당량만큼 썼을 때 1.0
+    """
+    try:
+        with open(os.path.join(cgroup_dir, "cpu.stat")) as f:
+            usage = next(int(line.split()[1]) for line in f if line.startswith("usage_usec "))
+    except (OSError, ValueError, StopIteration):
+        return None
+    cpus = read_cgroup_cpu_limit(cgroup_dir) or len(os.sched_getaffinity(0))
+    return usage, int(time.monotonic() * 1_000_000 * cpus)
+
+
+def read_host_cpu_times() -> Optional[tuple[int, int]]:
+    """/proc/stat 전체 CPU 시간 (busy, total), Linux가 아니면 None"""
+    try:
+        with open("/proc/stat") as f:
+            values = [int(v) for v in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+    total = sum(values[:8])  # guest는 user에 이미 포함
+    return total - idle, total
+
+
+def read_cpu_times(cgroup_dir: str = CGROUP_DIR) -> Optional[tuple[int, int]]:
+    """CPU 시간 (busy, total): 컨테이너 cgroup 값, 없으면 호스트 전체 값"""
+    return read_cgroup_cpu_times(cgroup_dir) or read_host_cpu_times()
+
+
+class AdaptiveConcurrencyController:
+    """대기열 길이 / 지연 시간 / CPU 사용률로 limiter.limit을 주기적으로 조정"""
+
+    def __init__(
+        self,
+        limiter: ConcurrencyLimiter,
+        depth_fn: Callable[[], Awaitable[int]],
+        min_limit: int = 4,
+        max_limit: int = 100,
+        interval: float = 1.0,
+        cpu_target: float = 0.9,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.8,
+        cgroup_dir: str = CGROUP_DIR,
+    ):
+        self.limiter = limiter
+        self.depth_fn = depth_fn
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.interval = interval
+        self.cpu_target = cpu_target
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+
+        # 지연 시간 기준선 (과부하가 아닐 때 p50의 느린 EWMA)
+        self.baseline_ms: Optional[float] = None
+        self.cgroup_dir = cgroup_dir
+        self.cpu_source = "cgroup" if read_cgroup_cpu_times(cgroup_dir) else "host"
+        self._cpu_times = read_cpu_times(cgroup_dir)
+
+        self.decisions: Counter = Counter()
+        self.last: dict = {}
+
+    def _read_cpu(self) -> Optional[float]:
+        """지난 주기의 CPU 사용률 (0~1)"""
+        current = read_cpu_times(self.cgroup_dir)
+        previous, self._cpu_times = self._cpu_times, current
+        if current is None or previous is None or current[1] <= previous[1]:
+            return None
+        return (current[0] - previous[0]) / (current[1] - previous[1])
+
+    def step(self, depth: int, latency: LatencyHistogram, cpu: Optional[float]) -> str:
+        """
+        한 주기 결정 (limit 조정 후 결정 이름 반환)
+
+        Args:
+            depth: 대기열 길이
+            latency: 지난 주기 작업 지연 시간
+            cpu: 지난 주기 CPU 사용률 (0~1, 모르면 None)
+        """
+        limit = self.limiter.limit
+        p50 = latency.percentile(50) if latency.count else None
+
+        if cpu is not None and cpu >= self.cpu_target:
+            decision = "decrease_cpu"
+        elif p50 is not None and self.baseline_ms and p50 > self.baseline_ms * self.latency_tolerance:
+            decision = "decrease_latency"
+        elif depth > 0 and self.limiter.outstanding >= limit:
+            decision = "increase"
+        else:
+            decision = "hold"
+
+        if decision.startswith("decrease"):
+            new_limit = max(self.min_limit, int(limit * self.backoff))
+        elif decision == "increase":
+            new_limit = min(self.max_limit, limit + max(1, int(math.sqrt(limit))))
+        else:
+            new_limit = limit
+
+        # 과부하가 아닐 때만 기준선 갱신 (기준선이 과부하 지연을 따라 올라가지 않도록)
+        if p50 is not None and not decision.startswith("decrease"):
+            self.baseline_ms = p50 if self.baseline_ms is None else self.baseline_ms * 0.95 + p50 * 0.05
+
+        if new_limit != limit:
+            self.limiter.set_limit(new_limit)
+            logger.info(
+                f"Concurrency {decision}: {limit} → {new_limit} "
+                f"(depth={depth}, p50={p50 or 0:.1f}ms, baseline={self.baseline_ms or 0:.1f}ms, "
+                f"cpu={'n/a' if cpu is None else f'{cpu:.0%}'})"
+            )
+
+        self.decisions[decision] += 1
+        self.last = {
+            "limit": new_limit,
+            "outstanding": self.limiter.outstanding,
+            "depth": depth,
+            "p50_ms": p50,
+            "baseline_ms": self.baseline_ms,
+            "cpu": cpu,
+            "decision": decision,
+        }
+        return decision
+
+    async def run(self):
+        logger.info(
+            f"Adaptive concurrency: {self.min_limit}~{self.max_limit} "
+            f"(start={self.limiter.limit}, cpu_target={self.cpu_target:.0%} of {self.cpu_source} CPU, "
+            f"latency_tolerance={self.latency_tolerance}x, interval={self.interval}s)"
+        )
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                depth = await self.depth_fn()
+            except Exception as e:
+                logger.warning(f"Concurrency controller: failed to read queue depth: {e}")
+                continue
+            self.step(depth, self.limiter.take_window(), self._read_cpu())
+
+    def decision_flags(self) -> dict:
+        """결정별 현재 여부 (마지막 결정만 1, 메트릭용)"""
+        last = self.last.get("decision")
+        return {decision: int(decision == last) for decision in DECISIONS}
+
+    def stats(self) -> dict:
+        return {**self.last, "limit": self.limiter.limit, "decisions": dict(self.decisions)}
@@ -7,10 +7,78 @@ class Settings(BaseSettings):
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_password: str | None = None
+    redis_max_connections: int = 16  # 워커 프로세스당 공유 연결 풀 크기 (작업 가져오기 1 + 완료 처리용)
 
     # Queue
     queue_name: str = "translation-jobs"
-    worker_concurrency: int = 100
+    queue_lanes: dict[str, int] = {}  # 여러 Bull 큐를 가중치 비율로 소비 ({"큐 이름": 가중치}, 비어 있으면 queue_name만)
+    queue_transport: str = "bull"  # bull: Bull 리스트 + pub/sub, streams: Redis Streams consumer group (ACK, 재처리 보장)
+    queue_serializer: str = "orjson"  # 결과 메시지/스트림 직렬화 (json, orjson, msgpack - msgpack은 Gateway도 같은 값으로)
+    queue_serializers: dict[str, str] = {}  # 큐별 직렬화 방식 ({"큐 이름": "msgpack"}, 없으면 queue_serializer)
+    worker_concurrency: int = 100  # 동시 처리 작업 수 (CONCURRENCY_ADAPTIVE=true면 상한)
+    job_lease_timeout: float = 30.0  # 처리 중인 작업의 lease 시간 (초, heartbeat 없이 이 시간이 지나면 회수)
+    worker_heartbeat_interval: float = 10.0  # 워커 생존 기록 + 처리 중인 작업 lease 연장 주기 (초, lease 시간보다 충분히 짧게)
+    stalled_check_interval: float = 5.0  # lease가 만료된 작업 회수 주기 (초)
+    job_max_stalled_count: int = 1  # 이 횟수를 넘게 회수된 작업은 대기열로 되돌리지 않고 실패 처리
+    worker_drain_timeout: float = 20.0  # 종료 신호(SIGTERM/SIGINT) 후 처리 중인 작업을 마칠 때까지 기다리는 시간 (초, 남은 작업은 대기열로 되돌림)
+    dequeue_batch_size: int = 16  # 한 번에 가져오는 최대 작업 수 (대기열 길이에 따라 1~N, 1이면 배치 비활성화)
+    result_publish_batch_size: int = 1  # 결과를 N개까지 모아서 배치 메시지 1건으로 발행 (1이면 작업마다 단건 발행)
+    result_publish_batch_wait_ms: float = 2.0  # 결과를 모으는 최대 대기 시간
+
+    # Adaptive Concurrency (대기열 길이 / 작업 지연 시간 / CPU 사용률로 동시 처리 수를 AIMD 조정)
+    concurrency_adaptive: bool = False  # True면 WORKER_CONCURRENCY를 상한으로 자동 조정 (기본은 고정)
+    concurrency_min: int = 4  # 하한 (시작 값)
+    concurrency_interval: float = 1.0  # 조정 주기 (초)
+    concurrency_cpu_target: float = 0.9  # 이 CPU 사용률 이상이면 감소
+    concurrency_latency_tolerance: float = 2.0  # 작업 지연 p50이 기준선의 N배를 넘으면 감소
+    concurrency_backoff: float = 0.8  # 감소 시 곱하는 비율
+
+    # Load Shedding (대기열이 밀리면 1: 띄어쓰기 생략 → 2: + 오타 교정 생략 → 3: 정규식 단계만, 비면 한 단계씩 복구)
+    degrade_enabled: bool = False  # 켜면 밀릴 때 띄어쓰기/오타 교정 등을 생략한 결과가 나감 (전체 품질 결과가 캐시에 있으면 그대로 사용)
+    degrade_depth_thresholds: list[int] = [200, 500, 1000]  # 단계 1~3 진입 대기열 길이
+    degrade_age_thresholds_ms: list[int] = [1000, 2000, 4000]  # 단계 1~3 진입 작업 대기 시간 p90 (ms)
+    degrade_recover_ratio: float = 0.5  # 현재 단계 임계값 × 이 비율 미만이면 한 단계 복구
+    degrade_min_hold: float = 5.0  # 단계를 바꾼 뒤 복구하기 전 최소 유지 시간 (초)
+    degrade_interval: float = 1.0  # 단계 결정 주기 (초)
+
+    # Fair Scheduling (방송별로 돌아가며 처리, 한 방송에 채팅이 몰려도 다른 방송이 뒤에서 기다리지 않도록)
+    fair_scheduling: bool = False
+    fair_buffer_size: int = 256  # 처리할 수 있는 것보다 미리 가져와 방송별로 나눠 두는 작업 수
+    fair_quantum: int = 100  # 방송이 한 차례에 받는 처리량 (텍스트 글자 수, lane 가중치를 곱함)
+    fair_max_pending_per_broadcast: int = 100  # 방송 하나가 버퍼에 쌓을 수 있는 작업 수 (넘으면 가장 오래된 작업 실패 처리, 0이면 제한 없음)
+
+    # Redis Streams (QUEUE_TRANSPORT=streams)
+    stream_group: str = "preprocess-workers"  # 모든 워커 복제본이 같은 consumer group 사용
+    stream_results_maxlen: int = 100000  # 결과 스트림 최대 길이 (근사값으로 잘라냄)
+    stream_reclaim_interval: float = 5.0  # JOB_LEASE_TIMEOUT 넘게 ACK 안 된 항목을 가져오는 주기 (초)
+
+    # Preprocessing Engine
+    preprocess_mode: str = "thread"  # thread: 스레드 풀 (단일 프로세스), process: 프로세스 풀 (코어 수만큼 확장)
+    preprocess_processes: int = 0  # process 모드의 프로세스 수 (0이면 CPU 코어 수)
+    preprocess_pool_start_timeout: float = 300.0  # process 모드에서 모든 프로세스의 모델 로드를 기다리는 시간 (초과 시 종료)
+
+    # Preprocessing Cache (텍스트 + 옵션 기준 LRU/TTL)
+    preprocess_cache_size: int = 10000  # 0이면 캐시 비활성화
+    preprocess_cache_ttl: float = 300.0  # 초
+    preprocess_stats_log_interval: int = 60  # 전처리 통계(캐시/배치/단계별) 로그 주기 (초, 0이면 비활성화)
+
+    # Metrics (HTTP /metrics: Prometheus 텍스트, /metrics.json)
+    metrics_host: str = "0.0.0.0"
+    metrics_port: int = 9108  # 0이면 비활성화, supervisor 자식은 포트 + (번호 - 1)
+
+    # PyKoSpacing Micro-batching (동시 작업들의 띄어쓰기 요청을 모아서 한 번에 추론)
+    spacing_batch_size: int = 32  # 1 이하면 배치 비활성화
+    spacing_batch_wait_ms: float = 5.0  # 배치를 모으는 최대 대기 시간
+
+    # Kiwi Typo Micro-batching (동시 작업들의 오타 교정 요청을 한 번의 tokenize 호출로 처리)
+    typo_batch_size: int = 32  # 1 이하면 배치 비활성화
+    typo_batch_wait_ms: float = 5.0
+
+    # Pre-fork Supervisor (python -m src.supervisor: 부모가 모델을 한 번 로드한 뒤 fork, 자식들이 copy-on-write로 공유)
+    supervisor_processes: int = 0  # 자식 워커 프로세스 수 (0이면 CPU 코어 수)
+    supervisor_share_spacing: bool = True  # PyKoSpacing(TensorFlow)도 fork 전에 로드할지 (False면 자식마다 로드)
+    supervisor_child_warmup_timeout: float = 120.0  # 자식 워밍업 제한 시간 (초과 시 fork 후 TF 멈춤으로 판단하고 종료)
+    supervisor_memory_log_interval: int = 60  # 자식별/전체 메모리(RSS/PSS) 로그 주기 (초, 0이면 비활성화)
 
     # VLLM
     vllm_url: str = "http://192.168.190.143:8000/v1/chat/completions"
@@ -0,0 +1,141 @@
+"""
+부하 단계별 전처리 품질 낮추기 (load shedding)
+채팅이 몰려 대기열이 밀리면 비싼 모델 단계부터 하나씩 끄고, 대기열이 비면 한 단계씩 되돌림
+
+단계:
+- 0 full: 전체 파이프라인
+- 1 no_spacing: 띄어쓰기 교정(PyKoSpacing) 생략
+- 2 no_typos: + 오타 교정(Kiwi) 생략
+- 3 regex_only: + 문장 분리(KSS) 생략 → 정규식 단계만 실행
+"""
+import asyncio
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from src.models import PreprocessOptions
+from src.preprocessor.stage_metrics import LatencyHistogram
+
+LEVELS = ("full", "no_spacing", "no_typos", "regex_only")
+
+# 단계별로 끄는 옵션 (누적)
+_DISABLED_OPTIONS = (
+    {},
+    {"add_spacing": False},
+    {"add_spacing": False, "fix_typos": False},
+    {"add_spacing": False, "fix_typos": False, "split_sentences": False},
+)
+
+
+def degrade_options(options: PreprocessOptions, level: int) -> PreprocessOptions:
+    """단계에 맞게 모델 단계를 끈 옵션 (원래 꺼져 있던 단계는 그대로, 결과 캐시 키도 달라짐)"""
+    if level <= 0:
+        return options
+    return options.model_copy(update=_DISABLED_OPTIONS[min(level, len(LEVELS) - 1)])
+
+
+class DegradationPolicy:
+    """
+    대기열 길이와 작업 대기 시간(job age)으로 전처리 단계 수준 결정
+
+    한 주기에 한 단계씩만 올리고 내림 (갑자기 품질이 바뀌지 않도록)
+    - 올림: 대기열 길이 또는 작업 대기 시간 p90이 다음 단계 임계값 이상
+    - 내림: 둘 다 현재 단계 임계값 × recover_ratio 미만이고, 현재 단계를 min_hold초 이상 유지했을 때
+    """
+
+    def __init__(
+        self,
+        depth_thresholds: list[int],
+        age_thresholds_ms: list[int],
+        recover_ratio: float = 0.5,
+        min_hold: float = 5.0,
+        interval: float = 1.0,
+    ):
+        # 단계 1~3의 진입 임계값
+        self.depth_thresholds = list(depth_thresholds)[:len(LEVELS) - 1]
+        self.age_thresholds_ms = list(age_thresholds_ms)[:len(LEVELS) - 1]
+        self.recover_ratio = recover_ratio
+        self.min_hold = min_hold
+        self.interval = interval
+
+        self.level = 0
+        self._changed_at = time.monotonic()
+        self._ages = LatencyHistogram()
+
+        self.jobs_by_level: Counter = Counter()
+        self.last: dict = {}
+
+    def observe_age(self, age_ms: float):
+        """작업을 가져왔을 때 대기 시간 기록 (생성 시각 → 처리 시작)"""
+        self._ages.record(max(0.0, age_ms))
+
+    def record_job(self, level: int):
+        """작업이 처리된 단계 기록"""
+        self.jobs_by_level[LEVELS[level]] += 1
+
+    def _pressure(self, value: float, thresholds: list, level: int, ratio: float = 1.0) -> bool:
+        """value가 단계 level 진입 임계값(× ratio) 이상인지"""
+        return level > 0 and level <= len(thresholds) and value >= thresholds[level - 1] * ratio
+
+    def update(self, depth: int, age_ms: Optional[float] = None, now: Optional[float] = None) -> int:
+        """
+        한 주기 결정 (새 단계 반환)
+
+        Args:
+            depth: 대기열 길이
+            age_ms: 작업 대기 시간 (없으면 지난 주기 기록의 p90)
+        """
+        now = time.monotonic() if now is None else now
+        if age_ms is None:
+            ages, self._ages = self._ages, LatencyHistogram()
+            age_ms = ages.percentile(90)
+
+        level = self.level
+        up = level + 1
+        if up < len(LEVELS) and (
+            self._pressure(depth, self.depth_thresholds, up)
+            or self._pressure(age_ms, self.age_thresholds_ms, up)
+        ):
+            level = up
+        elif (
+            level > 0
+            and now - self._changed_at >= self.min_hold
+            and not self._pressure(depth, self.depth_thresholds, self.level, self.recover_ratio)
+            and not self._pressure(age_ms, self.age_thresholds_ms, self.level, self.recover_ratio)
+        ):
+            level -= 1
+
+        if level != self.level:
+            log = logger.warning if level > self.level else logger.info
+            log(
+                f"Degradation level {LEVELS[self.level]} → {LEVELS[level]} "
+                f"(depth={depth}, job_age_p90={age_ms:.0f}ms)"
+            )
+            self.level = level
+            self._changed_at = now
+
+        self.last = {"depth": depth, "job_age_p90_ms": age_ms}
+        return self.level
+
+    async def run(self, depth_fn: Callable[[], Awaitable[int]]):
+        logger.info(
+            f"Degradation policy: depth thresholds={self.depth_thresholds}, "
+            f"age thresholds={self.age_thresholds_ms}ms, recover ratio={self.recover_ratio}"
+        )
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                depth = await depth_fn()
+            except Exception as e:
+                logger.warning(f"Degradation policy: failed to read queue depth: {e}")
+                continue
+            self.update(depth)
+
+    def stats(self) -> dict:
+        return {
+            "level": LEVELS[self.level],
+            **self.last,
+            "jobs_by_level": dict(self.jobs_by_level),
+        }
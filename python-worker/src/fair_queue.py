@@ -0,0 +1,137 @@
+"""
+방송별 공정 스케줄링 (deficit round-robin)
+
+대기열(Redis)은 들어온 순서대로 쌓이므로 시청자가 많은 방송 하나에 채팅이 몰리면 다른 방송의 채팅이
+그 뒤에서 기다림. fetcher가 처리할 수 있는 것보다 조금 더(버퍼 크기만큼) 미리 가져와 방송별로 나눠 담고,
+워커에는 방송을 돌아가며 텍스트 길이 기준으로 같은 양씩 넘겨줌
+
+- 방송 하나가 버퍼에 쌓을 수 있는 작업 수 제한 (넘으면 그 방송의 가장 오래된 작업을 실패 처리)
+  → 몰린 방송의 밀린 채팅 때문에 다른 방송의 채팅을 가져오지 못하는 일이 없음
+- 방송 안에서는 들어온 순서 유지
+"""
+import asyncio
+from collections import Counter, deque
+from typing import Awaitable, Callable, Hashable
+
+from src.concurrency import ConcurrencyLimiter
+
+# (키, 비용, 가중치, 작업)
+Classified = tuple[Hashable, float, float, tuple]
+
+
+class FairJobQueue:
+    """
+    방송(키)별 작업 큐 + deficit round-robin 선택
+
+    asyncio.Queue처럼 put()/get()으로 사용 (transport.fetch가 put, dispatch()가 get)
+    """
+
+    def __init__(
+        self,
+        classify: Callable[[tuple], Classified],
+        on_shed: Callable[[tuple], Awaitable[None]],
+        quantum: float = 100.0,
+        max_per_key: int = 0,
+        capped: Callable[[Hashable], bool] = lambda key: True,
+    ):
+        """
+        Args:
+            classify: 작업 → (키, 비용, 가중치, 작업) - 작업을 바꿔서 넘길 수 있음 (파싱한 data 재사용)
+            on_shed: 키별 상한을 넘어 버린 작업 처리 (실패 처리)
+            quantum: 키가 한 차례에 받는 비용 (× 가중치)
+            max_per_key: 키 하나가 쌓을 수 있는 작업 수 (0이면 제한 없음)
+            capped: max_per_key를 적용할 키인지
+        """
+        self.classify = classify
+        self.on_shed = on_shed
+        self.quantum = quantum
+        self.max_per_key = max_per_key
+        self.capped = capped
+
+        self._queues: dict[Hashable, deque] = {}  # 키 -> deque[(비용, 작업)]
+        self._weights: dict[Hashable, float] = {}
+        self._deficit: dict[Hashable, float] = {}
+        self._active: deque = deque()  # 작업이 있는 키 (돌아가는 순서)
+        self._size = 0
+        self._not_empty = asyncio.Event()
+
+        self.shed: Counter = Counter()
+
+    def qsize(self) -> int:
+        return self._size
+
+    def depth(self, key: Hashable) -> int:
+        queue = self._queues.get(key)
+        return len(queue) if queue else 0
+
+    async def put(self, item: tuple):
+        key, cost, weight, item = self.classify(item)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._deficit[key] = 0.0
+            self._active.append(key)
+        self._weights[key] = weight
+        queue.append((max(cost, 1e-9), item))
+        self._size += 1
+        self._not_empty.set()
+
+        if self.max_per_key > 0 and len(queue) > self.max_per_key and self.capped(key):
+            _, oldest = queue.popleft()
+            self._size -= 1
+            self.shed[key] += 1
+            await self.on_shed(oldest)
+
+    def _pop(self) -> tuple:
+        """deficit round-robin으로 다음 작업 선택 (맨 앞 키가 비용만큼 deficit이 있으면 꺼내고, 없으면 다음 키에 quantum)"""
+        while True:
+            key = self._active[0]
+            queue = self._queues[key]
+            cost, item = queue[0]
+            if self._deficit[key] >= cost:
+                self._deficit[key] -= cost
+                queue.popleft()
+                self._size -= 1
+                if not queue:
+                    # 비면 deficit을 버림 (쉬던 키가 나중에 몰아서 받지 않도록), 다음 키 차례
+                    self._active.popleft()
+                    del self._queues[key], self._deficit[key], self._weights[key]
+                    if self._active:
+                        self._grant(self._active[0])
+                return item
+
+            self._active.rotate(-1)
+            self._grant(self._active[0])
+
+    def _grant(self, key: Hashable):
+        self._deficit[key] += self.quantum * self._weights[key]
+
+    async def get(self) -> tuple:
+        while not self._size:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._pop()
+
+    async def dispatch(self, buffer: ConcurrencyLimiter, limiter: ConcurrencyLimiter, jobs: asyncio.Queue):
+        """
+        처리할 자리가 날 때마다 다음 작업을 워커 큐(jobs)로 넘김
+
+        Args:
+            buffer: fetcher가 미리 가져오는 작업 수 제한 (넘길 때 자리 반환)
+            limiter: 동시 처리 제한 (워커가 작업을 끝낼 때 자리 반환)
+        """
+        while True:
+            await limiter.wait_for_room()
+            item = await self.get()
+            buffer.release()
+            limiter.acquire(1)
+            await jobs.put(item)
+
+    def stats(self, top: int = 3) -> dict:
+        backlog = sorted(((len(queue), key) for key, queue in self._queues.items()), reverse=True)
+        return {
+            "buffered": self._size,
+            "keys": len(self._queues),
+            "shed": sum(self.shed.values()),
+            "top": [(key, count) for count, key in backlog[:top]],
+        }
@@ -20,8 +20,8 @@ logger.add(
     level=settings.log_level
 )
 
-# 전처리기 및 번역 서비스 초기화
-preprocessor = TextPreprocessor()
+# 전처리기 및 번역 서비스 초기화 (모델은 백그라운드에서 로드, /health로 준비 상태 확인)
+preprocessor = TextPreprocessor(lazy=True)
 vllm_service = VLLMService()
 
 
@@ -104,11 +104,13 @@ async def translate_handler(request):
 
 
 async def health_handler(request):
-    """헬스 체크"""
+    """헬스 체크 (모델 로드 + 워밍업 전에는 503)"""
+    readiness = preprocessor.readiness()
     return web.json_response({
-        'status': 'healthy',
+        'status': 'healthy' if readiness['ready'] else 'loading',
+        'preprocessor': readiness,
         'vllm_url': settings.vllm_url
-    })
+    }, status=200 if readiness['ready'] else 503)
 
 
 async def init_app():
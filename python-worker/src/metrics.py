@@ -0,0 +1,364 @@
+"""
+워커 메트릭 (HTTP /metrics, Prometheus 텍스트 형식)
+
+카운터와 히스토그램은 초기화하지 않고 계속 증가하는 누적 값
+- 코루틴/스레드에서 동시에 올려도 안전 (락)
+- 여러 프로세스/복제본의 값을 그대로 더하면 전체 값 (supervisor 자식, docker replicas)
+- 초당 처리량은 두 시점의 차이로 계산 (Prometheus rate())
+- 백분위는 버킷을 합친 뒤 계산 (Prometheus histogram_quantile())
+
+엔드포인트:
+- GET /metrics: Prometheus 텍스트 형식
+- GET /metrics.json: 사람이 보기 위한 JSON (히스토그램은 p50/p95/p99)
+"""
+import asyncio
+import bisect
+import inspect
+import threading
+from typing import Any, Callable
+
+from loguru import logger
+
+from src.serialization import json_serializer
+
+# 기본 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터 (레이블별)"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def total(self) -> float:
+        """모든 레이블 합계"""
+        with self._lock:
+            return sum(self._values.values())
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0)]
+        return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in items]
+
+
+class Gauge(Counter):
+    """현재 값 (증가/감소 가능, 프로세스 간 합산 여부는 값의 의미에 따름)"""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (초 단위, Prometheus histogram과 같은 형식, 레이블별)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: tuple = DEFAULT_BUCKETS, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.bounds = tuple(sorted(buckets))
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, list] = {}  # 레이블 값 -> [버킷별 개수 (마지막은 상한 초과), 합계]
+        self._lock = threading.Lock()
+
+    _key = Counter._key
+
+    def observe(self, value: float, count: int = 1, **labels):
+        """value를 count번 기록"""
+        value = max(0.0, value)
+        i = bisect.bisect_left(self.bounds, value)
+        key = self._key(labels)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [[0] * (len(self.bounds) + 1), 0.0]
+            values[0][i] += count
+            values[1] += value * count
+
+    def take(self) -> dict:
+        """기록을 가져가고 비움 (다른 프로세스의 히스토그램에 merge로 더할 때)"""
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: dict):
+        """take()로 가져온 기록 더하기 (버킷이 같아야 함)"""
+        with self._lock:
+            for key, (counts, total_sum) in values.items():
+                current = self._values.get(key)
+                if current is None:
+                    current = self._values[key] = [[0] * (len(self.bounds) + 1), 0.0]
+                current[0] = [a + b for a, b in zip(current[0], counts)]
+                current[1] += total_sum
+
+    def _merged(self, labels: dict) -> tuple[list, float]:
+        """labels가 있으면 해당 레이블 값, 없으면 전체 합계 (버킷별 개수, 합계)"""
+        with self._lock:
+            if labels:
+                selected = [self._values.get(self._key(labels))]
+            else:
+                selected = list(self._values.values())
+            counts = [0] * (len(self.bounds) + 1)
+            total_sum = 0.0
+            for values in selected:
+                if values is None:
+                    continue
+                counts = [a + b for a, b in zip(counts, values[0])]
+                total_sum += values[1]
+        return counts, total_sum
+
+    def count(self, **labels) -> int:
+        return sum(self._merged(labels)[0])
+
+    def percentile(self, p: float, **labels) -> float:
+        """p(0~100) 백분위 값 (해당 버킷의 상한, 상한 초과 버킷이면 마지막 상한)"""
+        counts, _ = self._merged(labels)
+        total = sum(counts)
+        if total == 0:
+            return 0.0
+        target = total * p / 100
+        seen = 0
+        for i, n in enumerate(counts):
+            seen += n
+            if seen >= target and n:
+                return self.bounds[min(i, len(self.bounds) - 1)]
+        return self.bounds[-1]
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        with self._lock:
+            items = sorted((key, list(values[0]), values[1]) for key, values in self._values.items())
+        if not items and not self.labelnames:
+            items = [((), [0] * (len(self.bounds) + 1), 0.0)]
+
+        samples = []
+        for key, counts, total_sum in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, n in zip(self.bounds + (float("inf"),), counts):
+                cumulative += n
+                samples.append((f"{self.name}_bucket", {**labels, "le": _format_value(float(bound))}, cumulative))
+            samples.append((f"{self.name}_sum", labels, total_sum))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+    def summary(self, **labels) -> dict:
+        counts, total_sum = self._merged(labels)
+        count = sum(counts)
+        return {
+            "count": count,
+            "mean": total_sum / count if count else 0.0,
+            "p50": self.percentile(50, **labels),
+            "p95": self.percentile(95, **labels),
+            "p99": self.percentile(99, **labels),
+        }
+
+
+class CallbackMetric:
+    """
+    수집할 때 값을 읽어 오는 메트릭 (다른 객체가 이미 가진 카운터/상태 노출용)
+
+    fn은 숫자 또는 {레이블 값: 숫자}를 반환 (async 함수도 가능)
+    """
+
+    def __init__(self, name: str, help: str, fn: Callable[[], Any], kind: str = "gauge", labelname: str | None = None):
+        self.name = name
+        self.help = help
+        self.fn = fn
+        self.kind = kind
+        self.labelname = labelname
+        self._last: list = []
+
+    async def collect(self):
+        try:
+            value = self.fn()
+            if inspect.isawaitable(value):
+                value = await value
+        except Exception as e:
+            # 실패하면 이번 수집에서만 제외 (Redis 일시 장애 등으로 엔드포인트 전체가 실패하지 않도록)
+            logger.warning(f"Metrics: failed to collect {self.name}: {e}")
+            self._last = []
+            return
+
+        if isinstance(value, dict):
+            self._last = [(self.name, {self.labelname: key}, v) for key, v in sorted(value.items())]
+        else:
+            self._last = [(self.name, {}, value)]
+
+    def samples(self) -> list[tuple[str, dict, float]]:
+        return self._last
+
+
+class MetricsRegistry:
+    """메트릭 모음 (등록 순서대로 출력)"""
+
+    def __init__(self):
+        self._metrics: dict[str, Any] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric '{metric.name}' already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, buckets: tuple = DEFAULT_BUCKETS, labelnames: tuple = ()) -> Histogram:
+        return self._register(Histogram(name, help, buckets, labelnames))
+
+    def callback(self, name: str, help: str, fn: Callable[[], Any], kind: str = "gauge", labelname: str | None = None):
+        """수집 시점에 fn()으로 값을 읽는 메트릭 (이미 있으면 교체, main()이 다시 실행될 때용)"""
+        self._metrics.pop(name, None)
+        return self._register(CallbackMetric(name, help, fn, kind, labelname))
+
+    async def collect(self):
+        callbacks = [metric for metric in self._metrics.values() if isinstance(metric, CallbackMetric)]
+        await asyncio.gather(*(metric.collect() for metric in callbacks))
+
+    async def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        await self.collect()
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    async def snapshot(self) -> dict:
+        """JSON용 현재 값 (레이블이 있으면 {레이블 값: 값}, 히스토그램은 요약)"""
+        await self.collect()
+        snapshot = {}
+        for metric in self._metrics.values():
+            if isinstance(metric, Histogram):
+                snapshot[metric.name] = metric.summary()
+                if metric.labelnames:
+                    with metric._lock:
+                        keys = sorted(metric._values)
+                    snapshot[metric.name][f"by_{'_'.join(metric.labelnames)}"] = {
+                        ",".join(key): metric.summary(**dict(zip(metric.labelnames, key))) for key in keys
+                    }
+                continue
+            samples = metric.samples()
+            if samples and all(not labels for _, labels, _ in samples):
+                snapshot[metric.name] = samples[0][2]
+            else:
+                snapshot[metric.name] = {",".join(labels.values()): value for _, labels, value in samples}
+        return snapshot
+
+
+async def _handle_request(
+    registry: MetricsRegistry,
+    readiness: Callable[[], dict] | None,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+):
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+        # 헤더는 읽고 버림
+        while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+            pass
+
+        parts = request_line.decode("latin-1").split()
+        method, path = (parts[0], parts[1].split("?", 1)[0]) if len(parts) >= 2 else ("", "")
+
+        if method != "GET":
+            status, content_type, body = "405 Method Not Allowed", "text/plain", b"method not allowed\n"
+        elif path == "/metrics":
+            status, content_type = "200 OK", "text/plain; version=0.0.4; charset=utf-8"
+            body = (await registry.render()).encode("utf-8")
+        elif path == "/metrics.json":
+            status, content_type = "200 OK", "application/json"
+            body = json_serializer().dumps(await registry.snapshot())
+        elif path == "/health":
+            # 준비 전(모델 로드 중 / 로드 실패)에는 503 (readiness probe가 트래픽/롤링 배포를 기다림)
+            state = readiness() if readiness is not None else {"ready": True}
+            status = "200 OK" if state.get("ready") else "503 Service Unavailable"
+            content_type, body = "application/json", json_serializer().dumps(state)
+        else:
+            status, content_type, body = "404 Not Found", "text/plain", b"not found\n"
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+    except Exception as e:
+        logger.debug(f"Metrics request failed: {e}")
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(
+    registry: MetricsRegistry,
+    host: str,
+    port: int,
+    readiness: Callable[[], dict] | None = None,
+) -> asyncio.Server:
+    """
+    메트릭 HTTP 서버 시작 (표준 라이브러리만 사용, 워커 이벤트 루프에서 실행)
+
+    Args:
+        port: 0이면 임의의 빈 포트 (테스트용)
+        readiness: /health 응답 ({"ready": bool, ...}, ready가 아니면 503)
+    """
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle_request(registry, readiness, reader, writer), host, port,
+    )
+    bound = server.sockets[0].getsockname()[1]
+    logger.info(f"Metrics endpoint: http://{host}:{bound}/metrics")
+    return server
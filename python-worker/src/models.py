@@ -9,10 +9,23 @@ class PreprocessOptions(BaseModel):
     remove_emoticons: bool = Field(default=True, alias='removeEmoticons')
     fix_typos: bool = Field(default=True, alias='fixTypos')
     add_spacing: bool = Field(default=True, alias='addSpacing')
+    split_sentences: bool = Field(default=True, alias='splitSentences')
 
     class Config:
         populate_by_name = True
 
+    def cache_key(self) -> tuple:
+        """전처리 결과 캐시 키에 사용할 옵션 플래그 튜플"""
+        return (
+            self.expand_abbreviations,
+            self.filter_profanity,
+            self.normalize_repeats,
+            self.remove_emoticons,
+            self.fix_typos,
+            self.add_spacing,
+            self.split_sentences,
+        )
+
 
 class TranslationJob(BaseModel):
     id: str
@@ -20,6 +33,7 @@ class TranslationJob(BaseModel):
     target_languages: List[str] = Field(alias='targetLanguages')
     options: Optional[PreprocessOptions] = Field(default_factory=PreprocessOptions)
     created_at: int = Field(alias='createdAt')
+    broadcast: Optional[dict] = None  # 방송 정보 (bj_id, broadcast_index - 공정 스케줄링용)
 
     class Config:
         populate_by_name = True
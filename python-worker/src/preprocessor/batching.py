@@ -0,0 +1,112 @@
+"""
+마이크로 배치 처리기
+여러 작업(스레드)에서 동시에 들어오는 단건 요청을 짧은 시간 동안 모아서 한 번의 배치 호출로 처리
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Sequence
+
+from loguru import logger
+
+
+class MicroBatcher:
+    """
+    단건 요청을 최대 max_batch_size개 또는 max_wait_ms까지 모아서 batch_fn 한 번으로 처리
+
+    batch_fn은 입력 리스트와 같은 순서/길이의 결과 리스트를 반환해야 함
+    batch_fn은 전용 스레드 하나에서만 호출되므로 모델 호출이 직렬화됨
+    요청별 대기 시간(등록 → 배치 실행 시작)은 호출한 스레드에서 take_wait_ms()로 확인
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        name: str = "batcher",
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.name = name
+
+        self._queue: queue.Queue = queue.Queue()
+        # 호출 스레드별 마지막 요청의 대기 시간 (ms)
+        self._local = threading.local()
+        self._thread = threading.Thread(target=self._run, name=f"{name}-batcher", daemon=True)
+        self._thread.start()
+
+        # 배치 크기 조정용 통계
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, item: Any) -> Future:
+        """요청 등록 (결과는 Future로 전달)"""
+        future: Future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    def __call__(self, item: Any) -> Any:
+        """요청 등록 후 결과가 나올 때까지 대기 (호출 스레드 블록)"""
+        future = self.submit(item)
+        try:
+            return future.result()
+        finally:
+            self._local.wait_ms = getattr(future, "wait_ms", None)
+
+    def take_wait_ms(self) -> float | None:
+        """이 스레드의 마지막 __call__ 요청이 배치를 기다린 시간 (ms, 가져가면 비움, 요청이 없었으면 None)"""
+        wait_ms = getattr(self._local, "wait_ms", None)
+        self._local.wait_ms = None
+        return wait_ms
+
+    def _collect(self) -> list:
+        """첫 요청이 올 때까지 대기 후, 최대 대기 시간 안에 들어온 요청들을 모음"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            items = [item for item, _, _ in batch]
+            started = time.perf_counter()
+            for _, future, submitted in batch:
+                future.wait_ms = (started - submitted) * 1000
+
+            try:
+                results = self.batch_fn(items)
+                if len(results) != len(items):
+                    raise ValueError(f"{self.name}: expected {len(items)} results, got {len(results)}")
+            except Exception as e:
+                logger.warning(f"[{self.name}] batch of {len(items)} failed: {e}")
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+
+            self.batches += 1
+            self.items += len(items)
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+            "pending": self._queue.qsize(),
+        }
@@ -0,0 +1,131 @@
+"""
+전처리 결과 캐시 (LRU + TTL) + 처리 중인 동일 입력 합치기 (single-flight)
+채팅은 같은 문장이 반복되는 경우가 많아서 동일 입력의 Kiwi/PyKoSpacing/KSS 재실행을 피함
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class PreprocessCache:
+    """스레드 안전한 LRU + TTL 캐시 (hit/miss/eviction 카운터 포함)"""
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300.0):
+        """
+        Args:
+            maxsize: 최대 항목 수 (0 이하면 캐시 비활성화)
+            ttl: 항목 유효 시간 (초, 0 이하면 만료 없음)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # 용량 초과로 밀려난 항목
+        self.expirations = 0  # TTL 만료로 제거된 항목
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: Hashable, count_miss: bool = True) -> Optional[tuple]:
+        """
+        캐시 조회 (없거나 만료되었으면 None)
+
+        Args:
+            count_miss: False면 없을 때 miss로 세지 않음 (이어서 다른 키를 조회할 때, 작업당 한 번만 세도록)
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += count_miss
+                return None
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += count_miss
+                return None
+
+            # 최근 사용으로 이동 (LRU)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: tuple) -> None:
+        """캐시 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """캐시 크기 조정용 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class SingleFlight:
+    """
+    같은 키의 작업이 처리 중이면 새로 실행하지 않고 그 결과를 함께 기다림 (한 이벤트 루프 안에서 사용)
+
+    캐시는 처리가 끝난 뒤에야 채워지므로, 같은 채팅이 동시에 몰리면(도배) 모두 캐시 miss로 각자 전처리함
+    → 처리 중인 키를 기록해 두고 나중에 온 호출은 먼저 시작한 호출의 결과를 받음
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.executed = 0  # 실제로 실행한 횟수
+        self.coalesced = 0  # 처리 중인 결과를 함께 받은 횟수
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key로 처리 중인 작업이 있으면 그 결과, 없으면 fn() 실행 결과 반환 (예외도 함께 받음)
+
+        fn()은 별도 태스크로 실행하므로 먼저 시작한 호출이 취소되어도 기다리는 호출은 결과를 받음
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
@@ -0,0 +1,160 @@
+"""
+프로세스 풀 전처리 엔진
+각 워커 프로세스가 시작 시 TextPreprocessor를 한 번만 생성하고, 이후 전처리는 해당 인스턴스로 수행
+asyncio 쪽은 Redis I/O와 작업 전달만 담당하므로 처리량이 CPU 코어 수에 비례해서 늘어남
+"""
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from loguru import logger
+
+from src.metrics import Histogram
+from src.preprocessor.stage_metrics import STAGE_BUCKETS, format_stage_summary
+
+# 워커 프로세스별 전처리기 (initializer에서 생성)
+_preprocessor = None
+
+# 시작 확인용 barrier: 프로세스마다 ping 하나씩 잡고 모두 모일 때까지 대기 (먼저 뜬 프로세스가 ping을 여러 개 처리하지 않도록)
+_start_barrier = None
+
+# 워커 프로세스별 단계 통계 로그 주기
+_stats_log_interval = 0
+_last_stats_log = 0.0
+
+# 워커 프로세스별 단계 지연 시간 (부모의 preprocess_stage_seconds에 STAGE_EXPORT_INTERVAL마다 결과와 함께 전달)
+STAGE_EXPORT_INTERVAL = 1.0
+_stage_histogram: Optional[Histogram] = None
+_last_stage_export = 0.0
+
+
+def _init_process(log_level: str, stats_log_interval: int = 0, start_barrier=None):
+    """워커 프로세스 초기화: 로깅 설정 + 전처리기 1회 생성"""
+    global _preprocessor, _stats_log_interval, _last_stats_log, _stage_histogram, _start_barrier
+
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+        level=log_level
+    )
+
+    from src.preprocessor.text_processor import TextPreprocessor
+
+    logger.info(f"Initializing TextPreprocessor in pool process (PID: {os.getpid()})...")
+    _preprocessor = TextPreprocessor()
+    _stage_histogram = Histogram("preprocess_stage_seconds", "", STAGE_BUCKETS, ("stage",))
+    _preprocessor.stage_metrics.export_to(_stage_histogram)
+    _stats_log_interval = stats_log_interval
+    _last_stats_log = time.monotonic()
+    _start_barrier = start_barrier
+
+
+def _ping(timeout: float) -> tuple[int, dict]:
+    """
+    프로세스 준비 확인용 (initializer 완료 후 실행됨)
+    모든 프로세스가 ping을 하나씩 잡을 때까지 대기한 뒤 (PID, 준비 상태) 반환
+    """
+    if _start_barrier is not None:
+        _start_barrier.wait(timeout)
+    return os.getpid(), _preprocessor.readiness()
+
+
+def _log_stage_stats():
+    """단계별 통계를 주기적으로 로그 (프로세스마다 각자 기록)"""
+    global _last_stats_log
+
+    now = time.monotonic()
+    if _stats_log_interval <= 0 or now - _last_stats_log < _stats_log_interval:
+        return
+    _last_stats_log = now
+
+    summary = format_stage_summary(_preprocessor.stage_metrics.interval_snapshot(), _preprocessor.STAGES)
+    if summary:
+        logger.info(f"[METRIC] PREPROCESS_STAGES pid={os.getpid()} | {summary}")
+
+
+def _take_stage_export() -> Optional[dict]:
+    """마지막 전달 이후 STAGE_EXPORT_INTERVAL이 지났으면 그동안의 단계 기록을 가져감"""
+    global _last_stage_export
+
+    now = time.monotonic()
+    if now - _last_stage_export < STAGE_EXPORT_INTERVAL:
+        return None
+    _last_stage_export = now
+    return _stage_histogram.take()
+
+
+def _preprocess(text: str, options: dict) -> tuple:
+    """워커 프로세스에서 전처리 실행 (결과, 단계 기록 또는 None)"""
+    result = _preprocessor.preprocess(text, **options)
+    _log_stage_stats()
+    return result, _take_stage_export()
+
+
+class PreprocessPool:
+    """TextPreprocessor를 프로세스별로 보유한 전처리 프로세스 풀"""
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        log_level: str = "INFO",
+        stats_log_interval: int = 0,
+        stage_histogram: Optional[Histogram] = None,
+    ):
+        """
+        Args:
+            stage_histogram: 프로세스들의 단계별 지연 시간을 모을 히스토그램 (버킷 STAGE_BUCKETS, 레이블 stage)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.stage_histogram = stage_histogram
+        self.ready = False  # start()가 모든 프로세스의 준비를 확인하면 True
+        # TensorFlow는 fork 안전하지 않으므로 spawn으로 새 인터프리터에서 모델 로드
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=context,
+            initializer=_init_process,
+            initargs=(log_level, stats_log_interval, context.Barrier(self.processes)),
+        )
+
+    async def start(self, timeout: float = 300.0):
+        """
+        모든 프로세스를 미리 띄우고 각 프로세스의 모델 로드가 끝날 때까지 대기
+
+        timeout초 안에 모든 프로세스가 준비되지 않거나 준비에 실패한 프로세스가 있으면 풀을 종료하고 RuntimeError
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            replies = await asyncio.wait_for(
+                asyncio.gather(*[
+                    loop.run_in_executor(self._executor, _ping, timeout)
+                    for _ in range(self.processes)
+                ]),
+                timeout,
+            )
+        except Exception as e:
+            self.shutdown()
+            raise RuntimeError(f"Preprocess pool did not start within {timeout:g}s: {e!r}") from e
+
+        not_ready = {pid: readiness for pid, readiness in replies if not readiness["ready"]}
+        if len({pid for pid, _ in replies}) != self.processes or not_ready:
+            self.shutdown()
+            raise RuntimeError(f"Preprocess pool processes not ready: {not_ready or replies}")
+        self.ready = True
+        logger.info(f"Preprocess pool ready: {self.processes} processes")
+
+    async def preprocess(self, text: str, options: dict) -> tuple:
+        """전처리를 풀에 전달하고 결과 대기"""
+        loop = asyncio.get_running_loop()
+        result, stages = await loop.run_in_executor(self._executor, _preprocess, text, options)
+        if stages and self.stage_histogram is not None:
+            self.stage_histogram.merge(stages)
+        return result
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
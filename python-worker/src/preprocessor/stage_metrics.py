@@ -0,0 +1,173 @@
+"""
+전처리 단계별 지연 시간 히스토그램 및 변경 횟수
+고정 로그 버킷을 사용해서 기록 비용이 작고 (bisect 1회) 운영 환경에서 항상 켜둘 수 있음
+"""
+import bisect
+import threading
+from collections import Counter
+from typing import Optional
+
+# 버킷 상한 (ms): 0.005ms ~ 약 30초, 1.25배 간격
+_BUCKET_BOUNDS = []
+_bound = 0.005
+while _bound < 30000:
+    _BUCKET_BOUNDS.append(round(_bound, 6))
+    _bound *= 1.25
+
+
+class LatencyHistogram:
+    """로그 버킷 지연 시간 히스토그램 (ms)"""
+
+    BOUNDS = _BUCKET_BOUNDS
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS) + 1)  # 마지막 버킷은 상한 초과
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms: float, count: int = 1):
+        """value_ms 값을 count번 기록"""
+        self.buckets[bisect.bisect_left(self.BOUNDS, value_ms)] += count
+        self.count += count
+        self.total += value_ms * count
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "LatencyHistogram"):
+        """다른 히스토그램 합치기 (프로세스/코루틴 간 집계용)"""
+        for i, n in enumerate(other.buckets):
+            self.buckets[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram()
+        clone.merge(self)
+        return clone
+
+    def subtract(self, previous: "LatencyHistogram") -> "LatencyHistogram":
+        """previous 이후 구간만의 히스토그램 (max는 누적값 유지)"""
+        window = LatencyHistogram()
+        window.buckets = [a - b for a, b in zip(self.buckets, previous.buckets)]
+        window.count = self.count - previous.count
+        window.total = self.total - previous.total
+        window.max = self.max
+        return window
+
+    def percentile(self, p: float) -> float:
+        """p(0~100) 백분위 값 (해당 버킷의 상한)"""
+        if self.count == 0:
+            return 0.0
+        target = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target and n:
+                return min(self.BOUNDS[i], self.max) if i < len(self.BOUNDS) else self.max
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max,
+        }
+
+
+# /metrics의 preprocess_stage_seconds{stage} 버킷 상한 (초, 정규식 단계는 수 μs, 모델 단계는 수십 ms)
+STAGE_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class StageMetrics:
+    """전처리 단계별 지연 시간 + 텍스트를 실제로 바꾼 횟수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.changed: Counter = Counter()
+        self._last_interval: dict[str, LatencyHistogram] = {}
+        self._last_changed: Counter = Counter()
+        # 함께 기록할 메트릭 히스토그램 (src.metrics.Histogram, 레이블: stage)
+        self.exporter = None
+        self.exporting = True  # 워밍업 중에는 False (워밍업 기록은 내보내지 않음)
+
+    def export_to(self, histogram):
+        """단계 기록을 메트릭 히스토그램(초 단위, stage 레이블)에도 기록"""
+        self.exporter = histogram
+
+    def reset(self):
+        """누적 통계 초기화 (exporter는 유지)"""
+        with self._lock:
+            self.histograms = {}
+            self.changed = Counter()
+            self._last_interval = {}
+            self._last_changed = Counter()
+
+    def record(self, stage: str, elapsed_ms: float, items: int = 1, changed: int = 0):
+        """
+        단계 실행 결과 기록
+
+        Args:
+            elapsed_ms: 단계 전체 소요 시간 (배치면 배치 전체)
+            items: 처리한 텍스트 수 (텍스트당 평균 시간으로 items번 기록)
+            changed: 텍스트가 바뀐 수
+        """
+        if items <= 0:
+            return
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.record(elapsed_ms / items, items)
+            if changed:
+                self.changed[stage] += changed
+        if self.exporter is not None and self.exporting:
+            self.exporter.observe(elapsed_ms / items / 1000, items, stage=stage)
+
+    def _summaries(self, histograms: dict[str, LatencyHistogram], changed: Counter) -> dict:
+        result = {}
+        for stage, histogram in histograms.items():
+            summary = histogram.summary()
+            summary["changed"] = changed.get(stage, 0)
+            summary["changed_ratio"] = summary["changed"] / histogram.count if histogram.count else 0.0
+            result[stage] = summary
+        return result
+
+    def snapshot(self) -> dict:
+        """시작 이후 누적 단계별 통계"""
+        with self._lock:
+            return self._summaries(self.histograms, self.changed)
+
+    def interval_snapshot(self) -> dict:
+        """마지막 interval_snapshot 호출 이후 구간의 단계별 통계 (주기 로그용)"""
+        with self._lock:
+            windows = {}
+            for stage, histogram in self.histograms.items():
+                previous = self._last_interval.get(stage)
+                windows[stage] = histogram.subtract(previous) if previous else histogram.copy()
+                self._last_interval[stage] = histogram.copy()
+            changed = self.changed - self._last_changed
+            self._last_changed = self.changed.copy()
+            return self._summaries(windows, changed)
+
+
+def format_stage_summary(summary: dict, stages: Optional[list] = None) -> str:
+    """단계별 통계를 한 줄 로그 문자열로 변환"""
+    parts = []
+    for stage in stages or summary.keys():
+        stats = summary.get(stage)
+        if not stats or not stats["count"]:
+            continue
+        parts.append(
+            f"{stage}: n={stats['count']} p50={stats['p50_ms']:.2f} p95={stats['p95_ms']:.2f} "
+            f"p99={stats['p99_ms']:.2f} max={stats['max_ms']:.2f}ms changed={stats['changed_ratio']:.0%}"
+        )
+    return " | ".join(parts)
@@ -1,23 +1,27 @@
+import importlib.util
 import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from langdetect import detect, LangDetectException
 from loguru import logger
 
+from src.preprocessor.batching import MicroBatcher
+from src.preprocessor.stage_metrics import StageMetrics
 
-# PyKoSpacing import (띄어쓰기 교정)
-try:
-    from pykospacing import Spacing
-    PYKOSPACING_AVAILABLE = True
-except ImportError:
-    PYKOSPACING_AVAILABLE = False
+
+# 무거운 모듈(TensorFlow, Kiwi 모델, KSS)은 import 시점이 아니라 모델 로더에서 import
+# 여기서는 설치 여부만 확인
+
+# PyKoSpacing (띄어쓰기 교정)
+PYKOSPACING_AVAILABLE = importlib.util.find_spec("pykospacing") is not None
+if not PYKOSPACING_AVAILABLE:
     logger.warning("PyKoSpacing not available. Spacing correction will be disabled.")
 
-# kiwipiepy import (형태소 분석 + 오타 교정)
-try:
-    from kiwipiepy import Kiwi
-    KIWI_AVAILABLE = True
-except ImportError:
-    KIWI_AVAILABLE = False
+# kiwipiepy (형태소 분석 + 오타 교정)
+KIWI_AVAILABLE = importlib.util.find_spec("kiwipiepy") is not None
+if not KIWI_AVAILABLE:
     logger.warning("kiwipiepy not available. Morpheme analysis and typo correction will be disabled.")
 
 # symspellpy-ko import (맞춤법 교정) - kiwipiepy로 대체됨
@@ -29,17 +33,51 @@ except ImportError:
 #     SYMSPELL_AVAILABLE = False
 #     logger.warning("symspellpy-ko not available. Advanced spell checking will be disabled.")
 
-try:
-    import kss
-
-    KSS_AVAILABLE = True
-except ImportError:
-    KSS_AVAILABLE = False
+# kss (문장 분리)
+KSS_AVAILABLE = importlib.util.find_spec("kss") is not None
+if not KSS_AVAILABLE:
     logger.warning("kss not available. Sentence segmentation will be disabled.")
 
+
+def _compile_word_matcher(words) -> Optional[re.Pattern]:
+    """
+    사전 키들을 단어 경계(\\b) 기준의 단일 정규식으로 컴파일
+
+    긴 키를 먼저 두어 접두어가 겹치는 경우(개꿀 / 개꿀잼) 가장 긴 항목이 매칭되도록 함
+    """
+    if not words:
+        return None
+    alternation = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    return re.compile(rf'\b(?:{alternation})\b')
+
+
 class TextPreprocessor:
     """채팅 텍스트 전처리 클래스"""
 
+    # 빠른 경로 판별용 패턴
+    # - 한글 음절이 없으면 오타/띄어쓰기 교정이 바꿀 것이 없음 (ㅋㅋ, 영문, 숫자 등)
+    # - 문장 중간에 종결 부호가 없고 공백 없는 짧은 한 덩어리면 문장 분리가 필요 없음
+    HANGUL_SYLLABLE_PATTERN = re.compile(r'[가-힣]')
+    INNER_TERMINATOR_PATTERN = re.compile(r'[.!?…]+\s*[^\s.!?…]')
+    FAST_PATH_MAX_CLAUSE_LEN = 6
+
+    # 워밍업용 대표 채팅 (모든 단계를 한 번씩 거치도록 구성)
+    WARMUP_CORPUS = [
+        "안녕하세요 반갑습니다",
+        "ㅋㅋㅋㅋ 이거 ㄹㅈㄷ",
+        "오늘 방송 진짜 재밌네요!! 내일도 봐요",
+        "사무시레서 일하다가 왔어요",
+        "/웃음/ 개꿀잼 ㄹㅇ",
+        "gg",
+    ]
+
+    # 단계별 메트릭 이름 (로그/메트릭 출력 순서)
+    STAGES = [
+        "remove_html", "remove_emoticons", "normalize_repeats", "expand_abbreviations", "expand_slang",
+        "fix_typos_batch_wait", "fix_typos", "add_spacing_batch_wait", "add_spacing",
+        "filter_profanity", "normalize_whitespace", "split_sentences", "total",
+    ]
+
     # 띄어쓰기 교정 후 다시 붙일 패턴 (붙여쓰기 강제)
     # 예: 복합어, 고유명사, 특정 용어 등
     # 주의: 띄어쓰기된 형태로 매칭해야 함 (예: "오늘 날씨" → "오늘날씨")
@@ -182,36 +220,64 @@ class TextPreprocessor:
         r'ㅂ신'
     ]
 
-    def __init__(self):
+    def __init__(
+        self,
+        fast_path: bool = True,
+        lazy: bool = False,
+        warmup: bool = True,
+        defer_models: tuple = (),
+    ):
+        """
+        Args:
+            fast_path: 사소한 메시지에 대해 무거운 단계 생략
+            lazy: True면 모델을 백그라운드에서 로드하고 즉시 반환 (준비 여부는 ready / wait_ready로 확인)
+            warmup: 모델 로드 후 대표 문장으로 워밍업 실행
+            defer_models: 처음에 로드하지 않을 모델 ("spacing", "kiwi", "kss"), load_deferred_models로 나중에 로드
+        """
+        self.fast_path = fast_path
+        # 빠른 경로로 건너뛴 단계별 횟수
+        self._fast_path_lock = threading.Lock()
+        self.fast_path_messages = 0
+        self.fast_path_skips: Counter = Counter()
+        # 단계별 지연 시간 히스토그램 + 변경 횟수
+        self.stage_metrics = StageMetrics()
+
         self.profanity_regex = re.compile('|'.join(self.PROFANITY_PATTERNS), re.IGNORECASE)
+        # 축약어/신조어 사전은 한 번만 컴파일 (메시지당 한 번의 좌→우 스캔)
+        self.abbr_regex = _compile_word_matcher(self.CONSONANT_ABBR)
+        self.slang_regex = _compile_word_matcher(self.SLANG_DICT)
         # 오타 패턴 컴파일
         # self.typo_patterns = [(re.compile(pattern), replacement) for pattern, replacement in self.TYPO_PATTERNS.items()]
 
-        # PyKoSpacing 초기화 (사용 가능한 경우)
-        if PYKOSPACING_AVAILABLE:
-            try:
-                self.spacing_model = Spacing()
-                logger.info("✅ PyKoSpacing model loaded successfully")
-            except Exception as e:
-                logger.error(f"Failed to load PyKoSpacing: {e}")
-                self.spacing_model = None
+        # 모델은 로더가 채움 (로드 전/실패 시 해당 단계는 입력을 그대로 반환)
+        self.spacing_model = None
+        self._encoding_and_padding = None  # PyKoSpacing 배치 추론용 인코딩 함수
+        self.kiwi = None
+        self._kss = None
+
+        # 마이크로 배처 (enable_spacing_batching / enable_typo_batching 호출 시 설정)
+        self.spacing_batcher: Optional[MicroBatcher] = None
+        self.typo_batcher: Optional[MicroBatcher] = None
+
+        # 준비 상태: 모델별 loading / ready / failed / unavailable / deferred
+        # 로드 + 워밍업이 끝나고 (_loaded_event) 실패하거나 로드되지 않은 모델이 없으면 ready
+        self.model_states = {
+            "spacing": "loading" if PYKOSPACING_AVAILABLE else "unavailable",
+            "kiwi": "loading" if KIWI_AVAILABLE else "unavailable",
+            "kss": "loading" if KSS_AVAILABLE else "unavailable",
+        }
+        for name in defer_models:
+            if self.model_states[name] == "loading":
+                self.model_states[name] = "deferred"
+        self.warmup_state = "pending" if warmup else "skipped"
+        self._warmup = warmup
+        self._loaded_event = threading.Event()
+
+        if lazy:
+            # 백그라운드에서 로드 (각 단계는 자기 모델이 준비되는 즉시 사용됨)
+            threading.Thread(target=self._load_models, name="model-loader", daemon=True).start()
         else:
-            self.spacing_model = None
-
-        # kiwipiepy 초기화 (형태소 분석 + 오타 교정)
-        if KIWI_AVAILABLE:
-            try:
-                # typos='basic_with_continual': 기본 오타 + 연철 오타 교정
-                # model_type 미지정: 기본 모델 사용 (knlm)
-                self.kiwi = Kiwi(
-                    typos='basic_with_continual'
-                )
-                logger.info("✅ kiwipiepy morpheme analyzer loaded successfully (typos=basic_with_continual)")
-            except Exception as e:
-                logger.error(f"Failed to load kiwipiepy: {e}")
-                self.kiwi = None
-        else:
-            self.kiwi = None
+            self._load_models()
 
         # symspellpy-ko 초기화 (사용 가능한 경우) - kiwipiepy로 대체됨
         # if SYMSPELL_AVAILABLE:
@@ -241,8 +307,123 @@ class TextPreprocessor:
     #             self._kss_splitter = False  # 실패 표시
     #     return self._kss_splitter if self._kss_splitter is not False else None
 
+    def _load_spacing(self):
+        """PyKoSpacing 로드 (TensorFlow import 포함)"""
+        from pykospacing import Spacing
+
+        try:
+            # 배치 추론용 인코딩 함수 (없으면 문장 단위 호출로 대체)
+            from pykospacing.embedding_maker import encoding_and_padding
+            self._encoding_and_padding = encoding_and_padding
+        except ImportError:
+            self._encoding_and_padding = None
+
+        self.spacing_model = Spacing()
+        logger.info("✅ PyKoSpacing model loaded successfully")
+
+    def _load_kiwi(self):
+        """kiwipiepy 로드 (형태소 분석 + 오타 교정)"""
+        from kiwipiepy import Kiwi
+
+        # typos='basic_with_continual': 기본 오타 + 연철 오타 교정
+        # model_type 미지정: 기본 모델 사용 (knlm)
+        self.kiwi = Kiwi(
+            typos='basic_with_continual'
+        )
+        logger.info("✅ kiwipiepy morpheme analyzer loaded successfully (typos=basic_with_continual)")
+
+    def _load_kss(self):
+        """KSS 로드 (문장 분리)"""
+        import kss
+
+        self._kss = kss
+        logger.info("✅ KSS sentence splitter loaded successfully")
+
+    def _load_model(self, name: str, loader):
+        start = time.perf_counter()
+        try:
+            loader()
+            self.model_states[name] = "ready"
+            logger.info(f"Model '{name}' ready in {(time.perf_counter() - start) * 1000:.0f}ms")
+        except Exception as e:
+            logger.error(f"Failed to load {name}: {e}")
+            self.model_states[name] = "failed"
+
+    def _load_models_concurrently(self, state: str):
+        """state 상태인 모델들을 동시에 로드"""
+        loaders = {"spacing": self._load_spacing, "kiwi": self._load_kiwi, "kss": self._load_kss}
+        loaders = {name: loader for name, loader in loaders.items() if self.model_states[name] == state}
+        if not loaders:
+            return
+
+        for name in loaders:
+            self.model_states[name] = "loading"
+
+        with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="model-loader") as executor:
+            for name, loader in loaders.items():
+                executor.submit(self._load_model, name, loader)
+
+    def load_deferred_models(self):
+        """defer_models로 미뤄둔 모델 로드 (예: supervisor 자식 프로세스에서 fork 이후)"""
+        self._load_models_concurrently("deferred")
+
+    def _load_models(self):
+        """모델들을 동시에 로드한 뒤 워밍업하고 준비 완료 표시"""
+        start = time.perf_counter()
+        self._load_models_concurrently("loading")
+
+        if self._warmup:
+            self.warmup()
+
+        logger.info(f"TextPreprocessor loaded in {(time.perf_counter() - start) * 1000:.0f}ms (models: {self.model_states})")
+        self._loaded_event.set()
+
+    def warmup(self):
+        """대표 문장으로 전체 파이프라인 실행 (첫 요청의 지연 제거), 워밍업 통계는 버림"""
+        self.warmup_state = "running"
+        self.stage_metrics.exporting = False
+        try:
+            self.preprocess_batch(self.WARMUP_CORPUS)
+            for text in self.WARMUP_CORPUS[:2]:
+                self.preprocess(text)
+            self.warmup_state = "done"
+        except Exception as e:
+            logger.warning(f"Warm-up failed: {e}")
+            self.warmup_state = "failed"
+
+        self.stage_metrics.reset()
+        self.stage_metrics.exporting = True
+        with self._fast_path_lock:
+            self.fast_path_messages = 0
+            self.fast_path_skips.clear()
+
+    @property
+    def ready(self) -> bool:
+        """로드가 끝났고 모든 모델이 ready 또는 unavailable (설치되지 않은 선택 모델)"""
+        return self._loaded_event.is_set() and all(
+            state in ("ready", "unavailable") for state in self.model_states.values()
+        )
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        모델 로드 + 워밍업이 끝날 때까지 대기하고 준비 여부 반환
+        모델 로드가 실패해도 끝나면 바로 반환 (False, 기다리지 않음)
+        """
+        self._loaded_event.wait(timeout)
+        return self.ready
+
+    def readiness(self) -> dict:
+        """헬스 체크용 준비 상태"""
+        return {
+            "ready": self.ready,
+            "models": dict(self.model_states),
+            "warmup": self.warmup_state,
+        }
+
     def detect_language(self, text: str) -> Optional[str]:
         """언어 감지"""
+        from langdetect import detect, LangDetectException
+
         try:
             # 특수문자와 공백 제거 후 감지
             clean_text = re.sub(r'[^\w\s]', '', text)
@@ -364,22 +545,109 @@ class TextPreprocessor:
         return text.strip()
 
     def expand_abbreviations(self, text: str) -> str:
-        """자음 축약어 확장"""
-        for abbr, full in self.CONSONANT_ABBR.items():
-            # 단어 경계에서만 매칭
-            text = re.sub(rf'\b{re.escape(abbr)}\b', full, text)
-        return text
+        """자음 축약어 확장 (단어 경계에서만 매칭, 단일 패스)"""
+        if self.abbr_regex is None:
+            return text
+        return self.abbr_regex.sub(lambda m: self.CONSONANT_ABBR[m.group()], text)
 
     def expand_slang(self, text: str) -> str:
-        """신조어 확장"""
-        for slang, full in self.SLANG_DICT.items():
-            text = re.sub(rf'\b{re.escape(slang)}\b', full, text)
-        return text.strip()
+        """신조어 확장 (단어 경계에서만 매칭, 단일 패스)"""
+        if self.slang_regex is None:
+            return text.strip()
+        return self.slang_regex.sub(lambda m: self.SLANG_DICT[m.group()], text).strip()
 
     def filter_profanity(self, text: str) -> str:
         """욕설 필터링"""
         return self.profanity_regex.sub('***', text)
 
+    def _join_eojeols(self, tokens) -> str:
+        """원본 띄어쓰기를 유지하면서 교정된 형태소로 어절 재조합"""
+        words = []
+        current_word_forms = [tokens[0].form]  # 교정된 형태소 저장
+        prev_end = tokens[0].start + tokens[0].len
+
+        for i in range(1, len(tokens)):
+            token = tokens[i]
+            curr_start = token.start
+
+            # 원본에 공백이 있으면 (위치가 떨어져 있으면) 어절 종료
+            if curr_start > prev_end:
+                # 이전 어절 저장 (교정된 형태소들 결합)
+                word = ''.join(current_word_forms)
+                words.append(word)
+
+                # 새 어절 시작
+                current_word_forms = [token.form]
+            else:
+                # 붙어있으면 현재 어절에 형태소 추가
+                current_word_forms.append(token.form)
+
+            prev_end = curr_start + token.len
+
+        # 마지막 어절 저장
+        if current_word_forms:
+            word = ''.join(current_word_forms)
+            words.append(word)
+
+        return ' '.join(words)
+
+    def _fix_typos_one(self, text: str) -> str:
+        """kiwipiepy 단건 오타 교정"""
+        try:
+            # kiwipiepy로 형태소 분석 + 오타 교정
+            tokens = self.kiwi.tokenize(text)
+
+            if not tokens:
+                return text
+
+            return self._join_eojeols(tokens)
+
+        except Exception as e:
+            logger.warning(f"Typo correction failed with kiwipiepy: {e}")
+            return text
+
+    def enable_typo_batching(self, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        fix_typos 호출을 동시 작업들과 모아서 한 번의 Kiwi 호출로 처리하도록 설정
+        (여러 스레드에서 preprocess를 호출하는 경우에만 효과 있음)
+        """
+        if not KIWI_AVAILABLE or max_batch_size <= 1:
+            return
+        self.typo_batcher = MicroBatcher(
+            self.fix_typos_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="typos",
+        )
+        logger.info(f"Typo micro-batching enabled (max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms})")
+
+    def fix_typos_batch(self, texts: list[str]) -> list[str]:
+        """
+        여러 문장의 오타를 한 번의 Kiwi 호출로 교정 (Kiwi 내부 워커 스레드 사용)
+        문장별 결과는 fix_typos와 동일
+        """
+        if not self.kiwi or not texts:
+            return list(texts)
+
+        try:
+            token_lists = list(self.kiwi.tokenize(texts))
+        except Exception as e:
+            logger.warning(f"Batched typo correction failed, falling back to per-sentence: {e}")
+            return [self._fix_typos_one(text) for text in texts]
+
+        results = []
+        for text, tokens in zip(texts, token_lists):
+            if not tokens:
+                results.append(text)
+                continue
+            try:
+                results.append(self._join_eojeols(tokens))
+            except Exception as e:
+                logger.warning(f"Typo correction failed with kiwipiepy: {e}")
+                results.append(text)
+
+        return results
+
     def fix_typos(self, text: str) -> str:
         """
         오타 및 맞춤법 교정 (kiwipiepy)
@@ -388,73 +656,201 @@ class TextPreprocessor:
         - basic: 기본 오타 (외않됀대? → 왜 안 되는대?)
         - continual: 연철 오타 (사무시레서 → 사무실에서)
         - lengthening: 장음화 (지이인짜 → 진짜)
+
+        배처가 설정되어 있으면 동시 요청들과 함께 배치 처리
         """
         if not self.kiwi:
             return text
 
-        try:
-            # kiwipiepy로 형태소 분석 + 오타 교정
-            tokens = self.kiwi.tokenize(text)
-
-            if not tokens:
+        if self.typo_batcher is not None:
+            try:
+                return self.typo_batcher(text)
+            except Exception as e:
+                logger.warning(f"Typo correction failed with kiwipiepy: {e}")
                 return text
 
-            # 원본 띄어쓰기를 유지하면서 교정된 형태소로 재조합
-            words = []
-            current_word_forms = [tokens[0].form]  # 교정된 형태소 저장
-            prev_end = tokens[0].start + tokens[0].len
+        return self._fix_typos_one(text)
 
-            for i in range(1, len(tokens)):
-                token = tokens[i]
-                curr_start = token.start
+    def enable_spacing_batching(self, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        add_spacing 호출을 동시 작업들과 모아서 배치 추론하도록 설정
+        (여러 스레드에서 preprocess를 호출하는 경우에만 효과 있음)
+        """
+        if not PYKOSPACING_AVAILABLE or max_batch_size <= 1:
+            return
+        self.spacing_batcher = MicroBatcher(
+            self.add_spacing_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="spacing",
+        )
+        logger.info(f"Spacing micro-batching enabled (max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms})")
+
+    def _apply_spacing_protect(self, text: str) -> str:
+        """보호 패턴 적용 (띄어쓰기된 것을 다시 붙임)"""
+        for spaced_pattern, joined_pattern in self.SPACING_PROTECT_PATTERNS:
+            text = re.sub(spaced_pattern, joined_pattern, text)
+        return text
 
-                # 원본에 공백이 있으면 (위치가 떨어져 있으면) 어절 종료
-                if curr_start > prev_end:
-                    # 이전 어절 저장 (교정된 형태소들 결합)
-                    word = ''.join(current_word_forms)
-                    words.append(word)
+    def _add_spacing_one(self, text: str) -> str:
+        """PyKoSpacing 단건 띄어쓰기 교정"""
+        try:
+            # 1. PyKoSpacing 실행
+            text = self.spacing_model(text)
 
-                    # 새 어절 시작
-                    current_word_forms = [token.form]
-                else:
-                    # 붙어있으면 현재 어절에 형태소 추가
-                    current_word_forms.append(token.form)
+            # 2. 보호 패턴 적용 (띄어쓰기된 것을 다시 붙임)
+            return self._apply_spacing_protect(text)
 
-                prev_end = curr_start + token.len
+        except Exception as e:
+            logger.warning(f"Spacing correction failed: {e}")
+            return text
 
-            # 마지막 어절 저장
-            if current_word_forms:
-                word = ''.join(current_word_forms)
-                words.append(word)
+    def _predict_spacing_batch(self, texts: list[str]) -> list[str]:
+        """
+        PyKoSpacing 모델을 직접 사용한 배치 추론
+        Spacing.__call__과 같은 인코딩(«문장», 공백→^)으로 패딩한 뒤 한 번의 forward pass로 예측
+        """
+        model = self.spacing_model
+        keras_model = getattr(model, '_model', None)
+        w2idx = getattr(model, '_w2idx', None)
+        max_len = getattr(model, 'max_len', 198)
+
+        encoding_and_padding = self._encoding_and_padding
 
-            corrected_text = ' '.join(words)
-            return corrected_text
+        # 내부 구조가 다르거나 규칙이 설정된 경우 문장 단위 호출로 대체
+        if encoding_and_padding is None or keras_model is None or w2idx is None or getattr(model, 'rules', None):
+            return [model(text) for text in texts]
 
+        results: list[Optional[str]] = [None] * len(texts)
+        batch_indices = []
+        batch_inputs = []
+
+        for i, text in enumerate(texts):
+            if len(text) > max_len:
+                # 긴 문장은 Spacing이 직접 분할 처리
+                results[i] = model(text)
+            else:
+                batch_indices.append(i)
+                batch_inputs.append(("«" + text + "»").replace(' ', '^'))
+
+        if batch_inputs:
+            mat_in = encoding_and_padding(
+                word2idx_dic=w2idx,
+                sequences=batch_inputs,
+                maxlen=max_len + 2,
+                padding='post',
+                truncating='post',
+            )
+            preds = keras_model.predict_on_batch(mat_in)
+
+            for row, (i, raw_sent) in enumerate(zip(batch_indices, batch_inputs)):
+                labels = ['1' if p > 0.5 else '0' for p in preds[row][:len(raw_sent)]]
+                results[i] = model.make_pred_sents(raw_sent, labels).strip()
+
+        return results
+
+    def add_spacing_batch(self, texts: list[str]) -> list[str]:
+        """
+        여러 문장의 띄어쓰기를 한 번의 배치 추론으로 교정 (결과는 add_spacing과 동일)
+        """
+        if not self.spacing_model or not texts:
+            return list(texts)
+
+        try:
+            spaced = self._predict_spacing_batch(texts)
         except Exception as e:
-            logger.warning(f"Typo correction failed with kiwipiepy: {e}")
-            return text
+            logger.warning(f"Batched spacing correction failed, falling back to per-sentence: {e}")
+            return [self._add_spacing_one(text) for text in texts]
+
+        return [self._apply_spacing_protect(text) for text in spaced]
 
     def add_spacing(self, text: str) -> str:
         """
         PyKoSpacing을 사용한 띄어쓰기 교정
         보호 패턴은 PyKoSpacing 후 다시 붙여짐
+        배처가 설정되어 있으면 동시 요청들과 함께 배치 추론
         """
         if not self.spacing_model:
             return text
 
-        try:
-            # 1. PyKoSpacing 실행
-            text = self.spacing_model(text)
+        if self.spacing_batcher is not None:
+            try:
+                return self.spacing_batcher(text)
+            except Exception as e:
+                logger.warning(f"Spacing correction failed: {e}")
+                return text
 
-            # 2. 보호 패턴 적용 (띄어쓰기된 것을 다시 붙임)
-            for spaced_pattern, joined_pattern in self.SPACING_PROTECT_PATTERNS:
-                text = re.sub(spaced_pattern, joined_pattern, text)
+        return self._add_spacing_one(text)
 
-            return text
+    def classify_fast_path(self, text: str) -> tuple[bool, bool]:
+        """
+        무거운 단계가 결과를 바꿀 수 있는지 빠르게 판별
 
+        Returns:
+            (needs_morphology, needs_sentence_split)
+            needs_morphology: 오타 교정(Kiwi)/띄어쓰기 교정(PyKoSpacing) 필요 여부
+            needs_sentence_split: KSS 문장 분리 필요 여부
+        """
+        if self.INNER_TERMINATOR_PATTERN.search(text):
+            has_hangul = self.HANGUL_SYLLABLE_PATTERN.search(text) is not None
+            return has_hangul, True
+
+        if not self.HANGUL_SYLLABLE_PATTERN.search(text):
+            return False, False
+
+        single_clause = len(text) <= self.FAST_PATH_MAX_CLAUSE_LEN and ' ' not in text
+        return True, not single_clause
+
+    def stage_stats(self) -> dict:
+        """단계별 누적 지연 시간 백분위 (p50/p95/p99/max) 및 변경 비율"""
+        return self.stage_metrics.snapshot()
+
+    def fast_path_stats(self) -> dict:
+        """빠른 경로 통계 (검사한 메시지 수 + 단계별 건너뛴 횟수)"""
+        with self._fast_path_lock:
+            return {
+                "messages": self.fast_path_messages,
+                "skipped": dict(self.fast_path_skips),
+            }
+
+    def _count_fast_path_skips(self, messages: int, **skipped: int):
+        with self._fast_path_lock:
+            self.fast_path_messages += messages
+            for stage, count in skipped.items():
+                if count:
+                    self.fast_path_skips[stage] += count
+
+    def _fix_typos_many(self, texts: list[str]) -> list[str]:
+        """오타 교정 단계 (1건이면 배처 경유, 여러 건이면 한 번의 Kiwi 호출)"""
+        if len(texts) == 1:
+            return [self.fix_typos(texts[0])]
+        return self.fix_typos_batch(texts)
+
+    def _add_spacing_many(self, texts: list[str]) -> list[str]:
+        """띄어쓰기 교정 단계 (1건이면 배처 경유, 여러 건이면 한 번의 배치 추론)"""
+        if len(texts) == 1:
+            return [self.add_spacing(texts[0])]
+        return self.add_spacing_batch(texts)
+
+    def _split_sentences_many(self, texts: list[str]) -> list[str]:
+        """KSS로 문장 분리 + ||| 구분자로 연결 (실패 시 문장별로 재시도)"""
+        kss = self._kss
+        if kss is None:
+            # 아직 로드 전이거나 사용 불가
+            return list(texts)
+
+        try:
+            if len(texts) == 1:
+                sentences_list = [kss.split_sentences(texts[0])]
+            else:
+                sentences_list = kss.split_sentences(texts)
+            return ["|||".join(sentences) for sentences in sentences_list]
         except Exception as e:
-            logger.warning(f"Spacing correction failed: {e}")
-            return text
+            if len(texts) == 1:
+                logger.warning(f"Sentence splitting failed: {e}, using original text")
+                return list(texts)
+            logger.warning(f"Batched sentence splitting failed: {e}, splitting one by one")
+            return [self._split_sentences_many([text])[0] for text in texts]
 
     def preprocess(
         self,
@@ -465,6 +861,7 @@ class TextPreprocessor:
         remove_emoticons: bool = True,
         fix_typos: bool = True,
         add_spacing: bool = True,  # PyKoSpacing 띄어쓰기 교정
+        split_sentences: bool = True,  # KSS 문장 분리
     ) -> tuple[str, bool, Optional[str], list]:
         """
         전체 전처리 파이프라인
@@ -473,56 +870,146 @@ class TextPreprocessor:
             (preprocessed_text, filtered, filter_reason, emoticons)
             emoticons: [(position, emoticon_text), ...] 이모티콘 위치 정보
         """
-        original = text
-        emoticons_info = []  # 이모티콘 정보 저장
+        return self.preprocess_batch(
+            [text],
+            expand_abbreviations=expand_abbreviations,
+            filter_profanity=filter_profanity,
+            normalize_repeats=normalize_repeats,
+            remove_emoticons=remove_emoticons,
+            fix_typos=fix_typos,
+            add_spacing=add_spacing,
+            split_sentences=split_sentences,
+        )[0]
+
+    def preprocess_batch(
+        self,
+        texts: list[str],
+        expand_abbreviations: bool = True,
+        filter_profanity: bool = False,
+        normalize_repeats: bool = True,
+        remove_emoticons: bool = True,
+        fix_typos: bool = True,
+        add_spacing: bool = True,  # PyKoSpacing 띄어쓰기 교정
+        split_sentences: bool = True,  # KSS 문장 분리
+    ) -> list[tuple[str, bool, Optional[str], list]]:
+        """
+        여러 텍스트에 대한 전체 전처리 파이프라인 (단계별로 리스트 전체를 처리)
+        오타 교정, 띄어쓰기 교정, 문장 분리는 남은 텍스트 전체를 한 번에 처리
+
+        Returns:
+            텍스트별 (preprocessed_text, filtered, filter_reason, emoticons) 리스트 (preprocess와 동일)
+        """
+        batch_start = time.perf_counter()
+        results: list[Optional[tuple]] = [None] * len(texts)
+        current = list(texts)
+        emoticons_list = [[] for _ in texts]  # 이모티콘 정보 저장
+        pending = list(range(len(texts)))  # 아직 필터링되지 않은 텍스트 인덱스
+        metrics = self.stage_metrics
+
+        def apply(name, stage, indices):
+            """텍스트별 단계 실행 + 소요 시간/변경 횟수 기록"""
+            if not indices:
+                return
+            start = time.perf_counter()
+            changed = 0
+            for i in indices:
+                before = current[i]
+                current[i] = stage(before)
+                changed += current[i] != before
+            metrics.record(name, (time.perf_counter() - start) * 1000, len(indices), changed)
+
+        def apply_many(name, stage_many, indices, batcher=None):
+            """
+            리스트 단위 단계 실행 (한 번의 배치 호출) + 소요 시간/변경 횟수 기록
+            마이크로 배처를 거쳤으면 배치를 기다린 시간은 {name}_batch_wait 단계로 따로 기록
+            """
+            if not indices:
+                return
+            if batcher is not None:
+                batcher.take_wait_ms()  # 이전 호출의 대기 시간이 섞이지 않도록
+            start = time.perf_counter()
+            changed = 0
+            for i, value in zip(indices, stage_many([current[i] for i in indices])):
+                changed += value != current[i]
+                current[i] = value
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            wait_ms = batcher.take_wait_ms() if batcher is not None else None
+            if wait_ms is not None:
+                metrics.record(f"{name}_batch_wait", wait_ms, len(indices))
+                elapsed_ms = max(0.0, elapsed_ms - wait_ms)
+            metrics.record(name, elapsed_ms, len(indices), changed)
 
         # 1. HTML 제거
-        text = self.remove_html(text)
+        apply("remove_html", self.remove_html, pending)
 
         # 2. 기본 필터링 체크 (너무 짧거나 길거나 특수문자만) - 50자이하
-        if 50 < len(text.strip()) < 1:
-            return text, True, "Too short or long", emoticons_info
-
-        if re.match(r'^[^\w가-힣]+$', text):
-            return text, True, "Only special characters", emoticons_info
+        remaining = []
+        for i in pending:
+            text = current[i]
+            if 50 < len(text.strip()) < 1:
+                results[i] = (text, True, "Too short or long", emoticons_list[i])
+            elif re.match(r'^[^\w가-힣]+$', text):
+                results[i] = (text, True, "Only special characters", emoticons_list[i])
+            else:
+                remaining.append(i)
+        pending = remaining
 
         # 3. 이모티콘 제거 및 위치 정보 저장
-        if remove_emoticons:
-            text, emoticons_info = self.remove_emoticons(text)
+        if remove_emoticons and pending:
+            start = time.perf_counter()
+            for i in pending:
+                current[i], emoticons_list[i] = self.remove_emoticons(current[i])
+            changed = sum(1 for i in pending if emoticons_list[i])
+            metrics.record("remove_emoticons", (time.perf_counter() - start) * 1000, len(pending), changed)
 
         # 3-1. 이모티콘만 있는 경우 원본 그대로 반환 (번역 불필요)
-        if emoticons_info and len(text.strip()) == 0:
-            return original, True, "Only emoticons", emoticons_info
+        remaining = []
+        for i in pending:
+            if emoticons_list[i] and len(current[i].strip()) == 0:
+                results[i] = (texts[i], True, "Only emoticons", emoticons_list[i])
+            else:
+                remaining.append(i)
+        pending = remaining
 
         # 4. 특수 패턴 제거
-        # text = self.remove_special_patterns(text)
+        # apply("remove_special_patterns", self.remove_special_patterns, pending)
 
         # 5. 반복 문자열 정규화 (필터링 전에 먼저!)
         if normalize_repeats:
-            text = self.normalize_repeats(text)
+            apply("normalize_repeats", self.normalize_repeats, pending)
 
         # 6. 자음 축약어 확장 및 신조어 변환
         if expand_abbreviations:
-            text = self.expand_abbreviations(text)
-            text = self.expand_slang(text)
+            apply("expand_abbreviations", self.expand_abbreviations, pending)
+            apply("expand_slang", self.expand_slang, pending)
+
+        # 6-1. 빠른 경로: 한글 음절이 없는 텍스트는 오타/띄어쓰기 교정 생략
+        morph_pending = pending
+        if self.fast_path:
+            morph_pending = [i for i in pending if self.classify_fast_path(current[i])[0]]
+            self._count_fast_path_skips(
+                len(pending),
+                fix_typos=(len(pending) - len(morph_pending)) if fix_typos else 0,
+                add_spacing=(len(pending) - len(morph_pending)) if add_spacing else 0,
+            )
 
         # 7. 오타 및 맞춤법 교정 - 쓰읍 애매하긴해 할래말래할래말래
         if fix_typos:
-            text = self.fix_typos(text)
+            apply_many("fix_typos", self._fix_typos_many, morph_pending, self.typo_batcher)
 
         # 8. 띄어쓰기 교정 (PyKoSpacing)
         if add_spacing:
             # PyKoSpacing을 사용한 띄어쓰기 교정
-            text = self.add_spacing(text)
+            apply_many("add_spacing", self._add_spacing_many, morph_pending, self.spacing_batcher)
             # kss를 사용한 띄어쓰기 교저
             # text = kss.correct_spacing(text)
 
         # 9. 욕설 필터링
         if filter_profanity:
-            text = self.filter_profanity(text)
+            apply("filter_profanity", self.filter_profanity, pending)
 
         # 10. 공백 정리
-        text = re.sub(r'\s+', ' ', text).strip()
+        apply("normalize_whitespace", lambda text: re.sub(r'\s+', ' ', text).strip(), pending)
 
         # 일단 넘겨
         # 11. 전처리 후 자음/모음만 남았는지 체크
@@ -530,17 +1017,25 @@ class TextPreprocessor:
         #     return text, True, "Only consonants/vowels after preprocessing"
 
         # 12. 전처리 후 너무 짧아진 경우
-        if len(text) < 1:
-            return text, True, "Too short after preprocessing", emoticons_info
+        remaining = []
+        for i in pending:
+            if len(current[i]) < 1:
+                results[i] = (current[i], True, "Too short after preprocessing", emoticons_list[i])
+            else:
+                remaining.append(i)
+        pending = remaining
 
-        # 13. KSS로 문장 분리 + ||| 구분자로 연결
-        try:
-            sentences = kss.split_sentences(text)
-            text = "|||".join(sentences)
-            # logger.info(f"Preprocessed: '{original}' → '{text}' ({len(sentences)} sentences)")
+        # 13. KSS로 문장 분리 + ||| 구분자로 연결 (빠른 경로: 짧은 한 문장은 생략)
+        split_pending = pending if split_sentences else []
+        if self.fast_path and split_pending:
+            split_pending = [i for i in pending if self.classify_fast_path(current[i])[1]]
+            self._count_fast_path_skips(0, split_sentences=len(pending) - len(split_pending))
+        apply_many("split_sentences", self._split_sentences_many, split_pending)
 
-        except Exception as e:
-            logger.warning(f"Sentence splitting failed: {e}, using original text")
-            logger.info(f"Preprocessed: '{original}' → '{text}'")
+        for i in pending:
+            results[i] = (current[i], False, None, emoticons_list[i])
+
+        # 전체 파이프라인 (텍스트당 평균)
+        metrics.record("total", (time.perf_counter() - batch_start) * 1000, len(texts))
 
-        return text, False, None, emoticons_info
+        return results
@@ -0,0 +1,109 @@
+"""
+작업 데이터 / 결과 직렬화
+- json: 표준 라이브러리 (의존성 없음)
+- orjson: 빠른 JSON (json과 같은 형식이라 Gateway 변경 없이 사용 가능)
+- msgpack: 바이너리 (크기가 작음, Gateway도 QUEUE_SERIALIZER=msgpack 필요)
+
+큐마다 형식 선택: QUEUE_SERIALIZERS={"큐 이름": "msgpack"}, 없으면 QUEUE_SERIALIZER
+"""
+import json
+from typing import Any
+
+from loguru import logger
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+class JsonSerializer:
+    """표준 라이브러리 JSON (UTF-8, 한글을 이스케이프하지 않음)"""
+
+    name = "json"
+    is_json = True
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+    """orjson (결과는 json과 같은 UTF-8 JSON)"""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer:
+    """MessagePack 바이너리"""
+
+    name = "msgpack"
+    is_json = False
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True)
+
+    def loads(self, data: bytes | str) -> Any:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return msgpack.unpackb(data, raw=False)
+
+
+SERIALIZERS = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
+
+_AVAILABLE = {
+    "json": True,
+    "orjson": ORJSON_AVAILABLE,
+    "msgpack": MSGPACK_AVAILABLE,
+}
+
+
+def available_serializers() -> list[str]:
+    return [name for name in SERIALIZERS if _AVAILABLE[name]]
+
+
+def get_serializer(name: str):
+    """
+    이름으로 직렬화 방식 생성
+
+    orjson이 설치되지 않았으면 같은 형식인 json으로 대신하고,
+    msgpack은 형식이 다르므로 설치되지 않았으면 오류
+    """
+    name = name.lower()
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{name}' (available: {', '.join(SERIALIZERS)})")
+    if name == "orjson" and not ORJSON_AVAILABLE:
+        logger.warning("orjson not available, using standard json serializer")
+        return JsonSerializer()
+    if not _AVAILABLE[name]:
+        raise ValueError(f"Serializer '{name}' is not installed (pip install {name})")
+    return SERIALIZERS[name]()
+
+
+def json_serializer():
+    """가장 빠른 JSON 직렬화 (Bull 작업 hash처럼 형식이 JSON으로 정해진 곳용)"""
+    return get_serializer("orjson")
+
+
+def serializer_for_queue(queue_name: str, default: str, overrides: dict[str, str]):
+    """큐별 직렬화 방식 (overrides에 없으면 default)"""
+    return get_serializer(overrides.get(queue_name, default))
@@ -0,0 +1,292 @@
+"""
+Pre-fork Supervisor
+부모 프로세스가 전처리 모델을 한 번만 로드한 뒤 워커 프로세스들을 fork
+자식들은 모델 메모리를 copy-on-write로 공유하므로 프로세스 수를 늘려도 메모리가 거의 늘지 않음
+
+실행: python -m src.supervisor
+"""
+import asyncio
+import gc
+import os
+import signal
+import sys
+import threading
+import time
+
+from loguru import logger
+
+from src.config import settings
+from src.preprocessor.text_processor import TextPreprocessor
+
+# 자식이 워밍업 제한 시간 안에 끝내지 못했을 때의 종료 코드 (fork 후 TensorFlow 멈춤 의심)
+EXIT_WARMUP_TIMEOUT = 75
+
+# 비정상 종료한 자식을 다시 띄우기 전 대기 시간 (초, 연속 실패 시 2배씩 증가)
+RESPAWN_BACKOFF_MIN = 1.0
+RESPAWN_BACKOFF_MAX = 30.0
+# 워밍업을 마치고 이 시간(초) 넘게 실행된 뒤 종료한 자식은 연속 실패 횟수를 처음부터 셈
+# (가끔 죽는 자식이 최대 대기 시간에 머물지 않도록, 워밍업 제한 시간 초과는 안정 실행으로 보지 않음)
+RESPAWN_STABLE_AFTER = 60.0
+# 워밍업 제한 시간 초과가 연속 이 횟수만큼 나면 PyKoSpacing 공유를 끄고 자식마다 fork 이후 로드
+WARMUP_TIMEOUTS_BEFORE_UNSHARE = 2
+
+
+def read_memory(pid: int) -> dict | None:
+    """
+    /proc/<pid>/smaps_rollup에서 메모리 사용량 읽기 (KB)
+
+    Rss: 공유 페이지까지 모두 포함 (프로세스별로 더하면 공유분이 중복 집계됨)
+    Pss: 공유 페이지를 공유 프로세스 수로 나눈 값 (더하면 실제 물리 메모리 사용량)
+    """
+    fields = {"Rss": "rss", "Pss": "pss", "Shared_Clean": "shared", "Shared_Dirty": "shared",
+              "Private_Clean": "private", "Private_Dirty": "private"}
+    memory = {"rss": 0, "pss": 0, "shared": 0, "private": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in fields:
+                    memory[fields[key]] += int(value.split()[0])
+    except (OSError, ValueError):
+        return None
+    return memory
+
+
+def _format_mb(kb: int) -> str:
+    return f"{kb / 1024:.0f}MB"
+
+
+class Supervisor:
+    """모델을 로드한 부모 프로세스에서 워커 자식 프로세스들을 fork하고 관리"""
+
+    def __init__(self, processes: int = 0):
+        self.processes = processes or os.cpu_count() or 1
+        self.preprocessor: TextPreprocessor | None = None
+        self.children: dict[int, int] = {}  # pid → 슬롯 번호
+        self.ready_pipes: dict[int, int] = {}  # pid → 워밍업 완료 알림 pipe (읽기 쪽)
+        self.ready_at: dict[int, float] = {}  # pid → 워밍업 완료 시각 (monotonic)
+        self.failures: dict[int, int] = {}  # 슬롯 번호 → 연속 비정상 종료 횟수
+        self.warmup_timeouts = 0  # 연속 워밍업 제한 시간 초과 횟수 (자식 하나라도 준비되면 초기화)
+        self.share_spacing = settings.supervisor_share_spacing
+        self._stopping = False
+
+    def load(self):
+        """
+        fork 전에 모델 로드
+
+        워밍업(추론)은 하지 않음: TensorFlow는 추론 시 스레드 풀을 만들고, 스레드는 fork로 복제되지 않음
+        SUPERVISOR_SHARE_SPACING=false면 PyKoSpacing은 자식마다 fork 이후 로드
+        """
+        defer = () if self.share_spacing else ("spacing",)
+        start = time.perf_counter()
+        self.preprocessor = TextPreprocessor(warmup=False, defer_models=defer)
+        logger.info(
+            f"Models loaded in supervisor in {(time.perf_counter() - start) * 1000:.0f}ms: "
+            f"{self.preprocessor.readiness()['models']}"
+        )
+
+        # 이후 생성되는 객체만 GC 대상으로 삼아, GC가 공유 페이지의 참조 카운트/헤더를 건드려 복사되는 것을 줄임
+        gc.collect()
+        gc.freeze()
+
+    def spawn(self, slot: int):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self._run_child(slot, write_fd)  # 반환하지 않음
+        os.close(write_fd)
+        os.set_blocking(read_fd, False)
+        self.children[pid] = slot
+        self.ready_pipes[pid] = read_fd
+        logger.info(f"Forked worker #{slot} (PID: {pid})")
+
+    def _run_child(self, slot: int, ready_fd: int):
+        """자식 프로세스: 남은 모델 로드 + 워밍업 후 부모에 알리고 bull_worker 실행"""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        # 다른 자식들의 알림 pipe는 부모만 읽음
+        for fd in self.ready_pipes.values():
+            os.close(fd)
+        code = 0
+        try:
+            if not self.share_spacing and self.preprocessor.model_states["spacing"] == "ready":
+                # 공유 모델로 워밍업이 계속 멈춰서 공유를 끈 경우: 물려받은 모델 대신 fork 이후 새로 로드
+                self.preprocessor.spacing_model = None
+                self.preprocessor.model_states["spacing"] = "deferred"
+            self.preprocessor.load_deferred_models()
+
+            # fork 이전에 초기화된 TensorFlow가 자식에서 멈추는 경우를 감지
+            warmup = threading.Thread(target=self.preprocessor.warmup, name="warmup", daemon=True)
+            warmup.start()
+            warmup.join(settings.supervisor_child_warmup_timeout)
+            if warmup.is_alive():
+                logger.error(
+                    f"Worker #{slot} (PID: {os.getpid()}) warmup did not finish in "
+                    f"{settings.supervisor_child_warmup_timeout:.0f}s; "
+                    f"set SUPERVISOR_SHARE_SPACING=false to load PyKoSpacing after fork"
+                )
+                code = EXIT_WARMUP_TIMEOUT
+                return
+            os.write(ready_fd, b"1")
+            os.close(ready_fd)
+
+            # 자식은 항상 thread 모드로 실행 (프로세스 병렬화는 supervisor가 담당)
+            settings.preprocess_mode = "thread"
+            # 자식마다 메트릭 포트 분리 (9108, 9109, ...)
+            if settings.metrics_port > 0:
+                settings.metrics_port += slot - 1
+            from src import bull_worker
+            asyncio.run(bull_worker.main(preprocessor_instance=self.preprocessor))
+        except KeyboardInterrupt:
+            pass
+        except BaseException as e:
+            logger.error(f"Worker #{slot} (PID: {os.getpid()}) crashed: {e}")
+            code = 1
+        finally:
+            sys.stdout.flush()
+            os._exit(code)
+
+    def _forward_signal(self, signum, frame):
+        logger.info(f"Supervisor received signal {signum}, stopping {len(self.children)} workers...")
+        self._stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def _poll_ready(self):
+        """워밍업을 마친 자식 확인 (자식이 pipe에 1바이트 쓰면 준비 완료, 쓰지 않고 닫히면 종료)"""
+        for pid, fd in list(self.ready_pipes.items()):
+            try:
+                data = os.read(fd, 1)
+            except BlockingIOError:
+                continue
+            os.close(fd)
+            del self.ready_pipes[pid]
+            if data:
+                self.ready_at[pid] = time.monotonic()
+                self.warmup_timeouts = 0
+
+    def _reap(self) -> list[tuple[int, float]]:
+        """종료된 자식 정리, 다시 띄울 (슬롯, 대기 시간) 반환"""
+        self._poll_ready()
+        respawn = []
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                break
+            if pid == 0:
+                break
+            slot = self.children.pop(pid, None)
+            fd = self.ready_pipes.pop(pid, None)
+            if fd is not None:
+                os.close(fd)
+            ready_at = self.ready_at.pop(pid, None)
+            if slot is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if self._stopping:
+                logger.info(f"Worker #{slot} (PID: {pid}) exited ({code})")
+                continue
+            # 안정 실행 시간은 워밍업을 마친 시점부터 셈 (워밍업 전에 죽었으면 0)
+            uptime = time.monotonic() - ready_at if ready_at is not None else 0.0
+            logger.warning(
+                f"Worker #{slot} (PID: {pid}) exited unexpectedly ({code}) "
+                f"after {uptime:.0f}s since warmup, respawning..."
+            )
+            respawn.append((slot, self.record_failure(slot, code, uptime)))
+        return respawn
+
+    def record_failure(self, slot: int, code: int, uptime: float) -> float:
+        """
+        슬롯의 비정상 종료 기록 후 다시 띄우기 전 대기 시간 반환
+
+        워밍업 후 RESPAWN_STABLE_AFTER초 넘게 실행된 뒤 종료했으면 이전 실패는 잊고 1회째로 셈
+        워밍업 제한 시간 초과(EXIT_WARMUP_TIMEOUT)는 안정 실행으로 보지 않고,
+        WARMUP_TIMEOUTS_BEFORE_UNSHARE번 연속이면 이후 자식은 PyKoSpacing을 fork 이후 로드
+        """
+        if code == EXIT_WARMUP_TIMEOUT:
+            self.warmup_timeouts += 1
+            if self.share_spacing and self.warmup_timeouts >= WARMUP_TIMEOUTS_BEFORE_UNSHARE:
+                self.share_spacing = False
+                logger.warning(
+                    f"{self.warmup_timeouts} consecutive warmup timeouts, "
+                    f"new workers will load PyKoSpacing after fork"
+                )
+        elif uptime >= RESPAWN_STABLE_AFTER:
+            self.failures[slot] = 0
+        self.failures[slot] = self.failures.get(slot, 0) + 1
+        return min(RESPAWN_BACKOFF_MIN * 2 ** (self.failures[slot] - 1), RESPAWN_BACKOFF_MAX)
+
+    def log_memory(self):
+        """자식별 + 전체 메모리 사용량 로그 (RSS 합계 vs PSS 합계로 공유 효과 확인)"""
+        total = {"rss": 0, "pss": 0, "shared": 0, "private": 0}
+        parts = []
+        for pid, slot in sorted(self.children.items(), key=lambda item: item[1]):
+            memory = read_memory(pid)
+            if memory is None:
+                continue
+            for key in total:
+                total[key] += memory[key]
+            parts.append(
+                f"#{slot}(pid={pid}) rss={_format_mb(memory['rss'])} pss={_format_mb(memory['pss'])} "
+                f"shared={_format_mb(memory['shared'])} private={_format_mb(memory['private'])}"
+            )
+
+        parent = read_memory(os.getpid())
+        if parent is None:
+            return
+        # 전체 = supervisor + 자식들 (RSS 합계는 공유 페이지를 중복 집계, PSS 합계가 실제 사용량)
+        logger.info(
+            f"[METRIC] MEMORY total({len(parts)} workers + supervisor): "
+            f"rss_sum={_format_mb(total['rss'] + parent['rss'])} pss_sum={_format_mb(total['pss'] + parent['pss'])} "
+            f"private={_format_mb(total['private'] + parent['private'])} | "
+            f"supervisor: rss={_format_mb(parent['rss'])} pss={_format_mb(parent['pss'])}"
+        )
+        if parts:
+            logger.info("[METRIC] MEMORY per worker | " + " | ".join(parts))
+
+    def run(self):
+        logger.info(f"Starting pre-fork supervisor (PID: {os.getpid()}, workers: {self.processes})")
+        self.load()
+
+        signal.signal(signal.SIGTERM, self._forward_signal)
+        signal.signal(signal.SIGINT, self._forward_signal)
+
+        for slot in range(1, self.processes + 1):
+            self.spawn(slot)
+
+        respawn_at: dict[int, float] = {}
+        last_memory_log = time.monotonic()
+        interval = settings.supervisor_memory_log_interval
+
+        while self.children or (respawn_at and not self._stopping):
+            self._poll_ready()
+            now = time.monotonic()
+            for slot, backoff in self._reap():
+                respawn_at[slot] = now + backoff
+
+            if not self._stopping:
+                for slot, at in list(respawn_at.items()):
+                    if now >= at:
+                        del respawn_at[slot]
+                        self.spawn(slot)
+
+            if interval > 0 and now - last_memory_log >= interval:
+                last_memory_log = now
+                self.log_memory()
+
+            time.sleep(0.5)
+
+        logger.info("Supervisor stopped")
+
+
+if __name__ == "__main__":
+    # 로깅 설정은 bull_worker와 동일 (import 시 적용)
+    from src import bull_worker  # noqa: F401
+
+    Supervisor(settings.supervisor_processes).run()
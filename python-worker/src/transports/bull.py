@@ -0,0 +1,630 @@
+"""
+Bull 리스트 + pub/sub 전달 방식
+Bull이 Redis에 저장하는 형식(bull:{queue}:wait, bull:{queue}:{id})을 읽고,
+결과는 bull:preprocessing-results:jobId 채널로 발행 (API Gateway가 구독)
+
+여러 Bull 큐(우선순위 lane)를 가중치 비율로 함께 소비할 수 있음 (QUEUE_LANES)
+"""
+import asyncio
+import os
+import socket
+import time
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.concurrency import ConcurrencyLimiter
+from src.config import settings
+from src.serialization import json_serializer, serializer_for_queue
+
+# 처리 중인 작업은 active 리스트 대신 lease sorted set(bull:{queue}:leases, score = 만료 시각 ms)으로 관리
+# 완료/실패 시 ZREM은 O(log N) (active 리스트의 LREM은 O(N))
+# 워커는 heartbeat마다 자기가 처리 중인 작업의 lease를 연장하고,
+# 워커가 죽어서 lease가 만료된 작업은 reaper가 대기열로 되돌리거나 실패 처리함
+
+
+def lease_key(queue_name: str) -> str:
+    return f"bull:{queue_name}:leases"
+
+
+def workers_key(queue_name: str) -> str:
+    """살아 있는 워커 (member = 워커 ID, score = 마지막 heartbeat 시각 ms)"""
+    return f"bull:{queue_name}:workers"
+
+
+# lane(대기열) 순서표대로 최대 N개 작업을 꺼내 lease를 잡고 각 작업의 data를 함께 반환 (한 번의 왕복, 원자적)
+# 순서표의 lane이 비어 있으면 가중치 순으로 다른 lane에서 꺼냄 (처리할 수 있는 자리를 비워두지 않음)
+# KEYS: wait_1..wait_n, leases_1..leases_n / ARGV: 현재 시각(ms), lease 시간(ms), n, 작업 키 접두사_1..n, 순서표(lane 번호)...
+# 반환: {{lane별 남은 대기열 길이}, lane1, id1, data1, lane2, id2, data2, ...}
+DEQUEUE_BATCH_SCRIPT = """
+local n = tonumber(ARGV[3])
+local deadline = tonumber(ARGV[1]) + tonumber(ARGV[2])
+local result = {}
+for i = 4 + n, #ARGV do
+    local lane = tonumber(ARGV[i])
+    local job_id = redis.call('RPOP', KEYS[lane])
+    if not job_id then
+        for j = 1, n do
+            job_id = redis.call('RPOP', KEYS[j])
+            if job_id then
+                lane = j
+                break
+            end
+        end
+        if not job_id then
+            break
+        end
+    end
+    redis.call('ZADD', KEYS[n + lane], deadline, job_id)
+    local job_key = ARGV[3 + lane] .. job_id
+    local data = redis.call('HGET', job_key, 'data')
+    if data then
+        redis.call('HSET', job_key, 'processedOn', ARGV[1])
+    end
+    result[#result + 1] = lane
+    result[#result + 1] = job_id
+    result[#result + 1] = data
+end
+local depths = {}
+for j = 1, n do
+    depths[j] = redis.call('LLEN', KEYS[j])
+end
+table.insert(result, 1, depths)
+return result
+"""
+
+RESULT_CHANNEL = "bull:preprocessing-results:jobId"
+
+# 대기열이 비어 있을 때 새 작업을 확인하는 주기 (초)
+WAIT_POLL_INTERVAL = 0.05
+
+# 작업 가져오기 실패 시 재시도 간격 (초, 실패할 때마다 2배, 최대 FETCH_RETRY_MAX)
+FETCH_RETRY_MIN = 0.1
+FETCH_RETRY_MAX = 5.0
+
+# 결과 메시지 형식 (인코딩은 큐의 직렬화 방식: JSON 또는 msgpack)
+# - 단건 (버전 필드 없음): {"jobId", "result", "status"}
+# - 배치 (RESULT_PUBLISH_BATCH_SIZE > 1): {"version": 2, "results": [{"jobId", "result", "status"}, ...]}
+RESULT_BATCH_VERSION = 2
+
+# lease가 만료된 작업을 최대 N개 회수 (만료 시각 순, 전체 lease를 훑지 않음)
+# stalledCounter(Bull과 같은 필드)가 최대 횟수 이하면 대기열 맨 앞으로 되돌리고, 넘으면 실패 이벤트 발행
+# KEYS: leases, wait / ARGV: 현재 시각(ms), 최대 개수, 작업 키 접두사, 최대 stalled 횟수, 결과 채널, 메시지 형식
+# 반환: {되돌린 수, 실패 처리한 수}
+REAP_SCRIPT = """
+local encode = ARGV[6] == 'msgpack' and cmsgpack.pack or cjson.encode
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+local requeued, failed = 0, 0
+for _, job_id in ipairs(expired) do
+    redis.call('ZREM', KEYS[1], job_id)
+    local job_key = ARGV[3] .. job_id
+    if redis.call('EXISTS', job_key) == 1 then
+        local stalled = redis.call('HINCRBY', job_key, 'stalledCounter', 1)
+        if stalled > tonumber(ARGV[4]) then
+            local reason = 'job stalled more than allowable limit'
+            redis.call('HSET', job_key, 'failedReason', reason, 'finishedOn', ARGV[1])
+            redis.call('PUBLISH', ARGV[5], encode({
+                jobId = job_id, result = {filter_reason = reason}, status = 'failed'
+            }))
+            failed = failed + 1
+        else
+            redis.call('RPUSH', KEYS[2], job_id)
+            requeued = requeued + 1
+        end
+    end
+end
+return {requeued, failed}
+"""
+
+# 종료(drain) 시 이 워커가 lease를 잡고 있는 작업을 대기열 맨 앞으로 되돌림 (stalledCounter는 올리지 않음)
+# lease가 이미 없으면(완료/회수됨) 되돌리지 않음
+# KEYS: leases, wait / ARGV: 작업 ID...
+# 반환: 되돌린 수
+REQUEUE_SCRIPT = """
+local requeued = 0
+for _, job_id in ipairs(ARGV) do
+    if redis.call('ZREM', KEYS[1], job_id) == 1 then
+        redis.call('RPUSH', KEYS[2], job_id)
+        requeued = requeued + 1
+    end
+end
+return requeued
+"""
+
+
+def dequeue_batch_size(depth: int, max_size: int) -> int:
+    """
+    대기열 길이에 따른 다음 배치 크기
+
+    대기열이 비어 있으면 1 (지연 우선), 밀려 있으면 크게 (처리량 우선, 최대 max_size)
+    """
+    if max_size <= 1 or depth <= 0:
+        return 1
+    return min(max_size, depth + 1)
+
+
+class WeightedRoundRobin:
+    """
+    가중치 비율대로 고르게 섞인 순서 (smooth weighted round-robin)
+
+    가중치 {A: 3, B: 1}이면 A A B A 처럼 한 lane이 몰아서 나오지 않고 비율대로 섞임
+    """
+
+    def __init__(self, weights: list[int]):
+        self.weights = [max(1, weight) for weight in weights]
+        self.total = sum(self.weights)
+        self._current = [0] * len(self.weights)
+
+    def next(self) -> int:
+        for i, weight in enumerate(self.weights):
+            self._current[i] += weight
+        chosen = max(range(len(self.weights)), key=self._current.__getitem__)
+        self._current[chosen] -= self.total
+        return chosen
+
+
+class BullLane:
+    """lane 하나 = Bull 큐 하나의 키와 이 워커가 처리 중인 작업"""
+
+    def __init__(self, queue_name: str, weight: int = 1):
+        self.name = queue_name
+        self.weight = weight
+        # Bull은 bull:{queue_name}:wait 리스트에 작업 ID 저장
+        self.wait_key = f"bull:{queue_name}:wait"
+        self.job_key_prefix = f"bull:{queue_name}:"
+        self.completed_key = f"bull:{queue_name}:completed"
+        self.leases = lease_key(queue_name)
+        self.workers = workers_key(queue_name)
+        # 이 워커가 lease를 잡고 있는 작업 (heartbeat마다 lease 연장)
+        self.inflight: set[str] = set()
+        self.depth = 0
+
+
+class BullTransport:
+    """
+    Bull 큐 호환 작업 전달 (wait 리스트 → lease, 결과는 pub/sub 발행)
+
+    lanes를 주면 여러 Bull 큐를 가중치 비율로 소비 (예: {"translation-jobs-priority": 4, "translation-jobs": 1})
+    - 모든 lane에 작업이 밀려 있으면 가져오는 작업 수가 가중치 비율 (낮은 lane도 굶지 않음)
+    - 한 lane이 비어 있으면 다른 lane이 그 몫을 가져감
+    작업의 receipt는 lane(큐) 이름 (완료/실패 처리할 큐)
+    """
+
+    name = "bull"
+
+    def __init__(self, redis_conn: Redis, queue_name: str, lanes: dict[str, int] | None = None):
+        self.redis = redis_conn
+        self.queue_name = queue_name
+        # 가중치가 큰 lane부터 (순서표의 lane이 비었을 때 이 순서로 다른 lane에서 꺼냄)
+        self.lanes = sorted(
+            (BullLane(name, weight) for name, weight in (lanes or {queue_name: 1}).items()),
+            key=lambda lane: -lane.weight,
+        )
+        self._lanes_by_name = {lane.name: lane for lane in self.lanes}
+        self._schedule = WeightedRoundRobin([lane.weight for lane in self.lanes])
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_ms = int(settings.job_lease_timeout * 1000)
+        self._dequeue_script = redis_conn.register_script(DEQUEUE_BATCH_SCRIPT)
+        self._reap_script = redis_conn.register_script(REAP_SCRIPT)
+        self._requeue_script = redis_conn.register_script(REQUEUE_SCRIPT)
+        self.fetching = True
+
+        # Bull 작업 hash의 data/returnvalue는 Bull(Gateway)이 JSON으로 읽으므로 항상 JSON,
+        # 결과 메시지(pub/sub)만 큐별 직렬화 방식 사용 (모든 lane이 같은 결과 채널을 쓰므로 QUEUE_NAME 기준)
+        self.job_serializer = json_serializer()
+        self.message_serializer = serializer_for_queue(
+            queue_name, settings.queue_serializer, settings.queue_serializers,
+        )
+
+        self.requeued = 0
+        self.stalled_failed = 0
+        self.fetch_retries = 0
+
+        # 결과 배치 발행 (1이면 작업마다 바로 발행)
+        # 대기열 항목: (lane, job_id, status, result, 발행 완료 시 결과를 받을 future)
+        self.publish_batch_size = max(1, settings.result_publish_batch_size)
+        self.publish_batch_wait = settings.result_publish_batch_wait_ms / 1000
+        self._pending: list[tuple] = []
+        self._pending_event = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()  # 발행 중인 배치의 작업을 종료 시 되돌리지 않도록
+        self.publishes = 0
+        self.published = 0
+
+    def lane(self, receipt) -> BullLane:
+        """작업의 lane (receipt가 없으면 첫 번째 lane)"""
+        return self._lanes_by_name.get(receipt, self.lanes[0])
+
+    def lane_name(self, receipt) -> str:
+        return self.lane(receipt).name
+
+    def lane_weight(self, receipt) -> int:
+        return self.lane(receipt).weight
+
+    @property
+    def inflight(self) -> int:
+        return sum(len(lane.inflight) for lane in self.lanes)
+
+    async def depth(self) -> int:
+        """대기열 길이 (모든 lane 합계)"""
+        if len(self.lanes) == 1:
+            return await self.redis.llen(self.lanes[0].wait_key)
+        return sum((await self.lane_depths()).values())
+
+    async def lane_depths(self) -> dict:
+        """lane별 대기열 길이"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for lane in self.lanes:
+                pipe.llen(lane.wait_key)
+            return dict(zip((lane.name for lane in self.lanes), await pipe.execute()))
+
+    async def queue_depths(self) -> dict:
+        """대기 중 / 처리 중(lease를 잡은) 작업 수 (모든 lane, 모든 워커 합계)"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for lane in self.lanes:
+                pipe.llen(lane.wait_key)
+                pipe.zcard(lane.leases)
+            counts = await pipe.execute()
+        return {"wait": sum(counts[0::2]), "active": sum(counts[1::2])}
+
+    async def dequeue(self, count: int) -> list[tuple[BullLane, str, bytes]]:
+        """
+        가중치 순서표대로 최대 count개 작업의 lease를 잡고 가져옴 (lane별 남은 길이는 lane.depth에 갱신)
+
+        Returns:
+            [(lane, job_id, data 원본), ...]
+        """
+        schedule = [self._schedule.next() + 1 for _ in range(count)]
+        reply = await self._dequeue_script(
+            keys=[lane.wait_key for lane in self.lanes] + [lane.leases for lane in self.lanes],
+            args=[int(time.time() * 1000), self.lease_ms, len(self.lanes)]
+            + [lane.job_key_prefix for lane in self.lanes]
+            + schedule,
+        )
+        depths, items = reply[0], reply[1:]
+        for lane, depth in zip(self.lanes, depths):
+            lane.depth = depth
+
+        jobs = []
+        for i in range(0, len(items), 3):
+            lane = self.lanes[items[i] - 1]
+            job_id = items[i + 1].decode('utf-8')
+            lane.inflight.add(job_id)
+            jobs.append((lane, job_id, items[i + 2]))
+        return jobs
+
+    async def wait_for_jobs(self):
+        """
+        모든 lane이 비어 있으면 작업이 들어올 때까지 대기 (최대 1초, 이벤트 루프는 블록되지 않음)
+
+        작업은 꺼내지 않고 다음 dequeue()가 lease를 잡고 가져감 (다른 워커가 먼저 가져가도 무방)
+        lane 수와 관계없이 WAIT_POLL_INTERVAL마다 LLEN으로 확인
+        - 여러 키를 기다리면서 꺼내지 않는 블로킹 명령이 없음 (BRPOP으로 꺼냈다가 되돌리면 그 사이 작업이
+          어느 리스트에도 없고, 되돌릴 때 다른 유휴 워커를 깨움)
+        - lane 1개에서도 BRPOPLPUSH wait wait로 기다리면 가장 오래된 작업이 맨 뒤로 가서 FIFO 순서가 깨짐
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 1
+        while loop.time() < deadline:
+            if await self.depth():
+                return
+            await asyncio.sleep(WAIT_POLL_INTERVAL)
+
+    async def fetch(self, jobs: asyncio.Queue, limiter: ConcurrencyLimiter):
+        """
+        Bull 큐에서 대기 중인 작업을 배치로 가져와 프로세스 내부 큐(jobs)에 전달
+
+        fetcher 하나만 대기열을 확인하므로 Redis 연결 하나만 사용하고 스레드를 쓰지 않음
+        limiter에 자리가 없으면 대기 (처리할 수 있는 만큼만 lease를 잡고 가져옴)
+        Redis 오류는 FETCH_RETRY_MIN~FETCH_RETRY_MAX 간격으로 재시도 (응답을 못 받은 dequeue가 잡은 lease는
+        만료 후 reaper가 되돌림)
+        jobs 항목: (job_id, data 원본, receipt) - Bull은 receipt = lane(큐) 이름
+        """
+        logger.debug(f"Polling queues: {', '.join(f'{lane.wait_key} (weight {lane.weight})' for lane in self.lanes)}")
+
+        batch_size = 1
+        retry_delay = FETCH_RETRY_MIN
+        while self.fetching:
+            room = await limiter.wait_for_room()
+            if not self.fetching:
+                break
+            try:
+                items = await self.dequeue(min(batch_size, room))
+                if not items:
+                    # 대기열이 비어 있으면 작업이 들어올 때까지 대기
+                    await self.wait_for_jobs()
+                retry_delay = FETCH_RETRY_MIN
+            except (RedisError, OSError) as e:
+                logger.error(f"Fetch error (retrying in {retry_delay:g}s): {e}")
+                self.fetch_retries += 1
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, FETCH_RETRY_MAX)
+                continue
+
+            depth = sum(lane.depth for lane in self.lanes)
+            batch_size = dequeue_batch_size(depth, settings.dequeue_batch_size)
+
+            if items:
+                logger.debug(f"Received {len(items)} jobs (wait depth: {depth})")
+                limiter.acquire(len(items))
+                for lane, job_id, data in items:
+                    await jobs.put((job_id, data, lane.name))
+
+    def stop_fetching(self):
+        """새 작업 가져오기 중단 (종료 시, 진행 중인 dequeue는 끝까지 실행되어 lease를 잃지 않음)"""
+        self.fetching = False
+
+    async def requeue_inflight(self) -> int:
+        """
+        종료 시 끝내지 못한 작업을 대기열 맨 앞으로 되돌림 (다른 워커가 lease 만료를 기다리지 않고 바로 가져감)
+
+        발행 대기 중인 결과를 먼저 발행해서 이미 완료된 작업은 되돌리지 않음
+        """
+        while self._pending:
+            await self._flush()
+
+        requeued = 0
+        async with self._flush_lock:
+            for lane in self.lanes:
+                if not lane.inflight:
+                    continue
+                requeued += await self._requeue_script(keys=[lane.leases, lane.wait_key], args=list(lane.inflight))
+                lane.inflight.clear()
+        return requeued
+
+    async def heartbeat(self):
+        """
+        주기적으로 워커 생존 기록 + 처리 중인 작업의 lease 연장
+
+        lease는 작업 처리 시간이 아니라 워커 생존 여부로 만료됨 (오래 걸리는 작업도 회수되지 않음)
+        이미 회수된 작업은 다시 lease를 잡지 않음 (ZADD XX)
+        """
+        while True:
+            try:
+                await self.extend_leases(int(time.time() * 1000))
+            except Exception as e:
+                logger.warning(f"Heartbeat failed: {e}")
+            await asyncio.sleep(settings.worker_heartbeat_interval)
+
+    async def extend_leases(self, now_ms: int):
+        """워커 생존 기록 + 처리 중인 작업의 lease를 now_ms + lease 시간으로 연장 (lease가 남아 있는 작업만)"""
+        pipe = self.redis.pipeline(transaction=False)
+        deadline = now_ms + self.lease_ms
+        for lane in self.lanes:
+            pipe.zadd(lane.workers, {self.worker_id: now_ms})
+            if lane.inflight:
+                pipe.zadd(lane.leases, {job_id: deadline for job_id in lane.inflight}, xx=True)
+        await pipe.execute()
+
+    async def reap(self):
+        """
+        lease가 만료된 작업 회수 (처리 도중 죽은 워커의 작업)
+
+        모든 워커가 실행해도 스크립트가 원자적이라 같은 작업을 중복 회수하지 않음
+        만료 시각 순으로 배치 단위로만 가져오므로 처리 중인 작업 수와 무관하게 가벼움
+        """
+        while True:
+            await asyncio.sleep(settings.stalled_check_interval)
+            now_ms = int(time.time() * 1000)
+            for lane in self.lanes:
+                try:
+                    await self.reap_lane(lane, now_ms)
+                    # heartbeat가 끊긴 워커 정리
+                    await self.redis.zremrangebyscore(lane.workers, "-inf", now_ms - 3 * self.lease_ms)
+                except Exception as e:
+                    logger.error(f"Stalled job reaper error ({lane.name}): {e}")
+
+    async def reap_lane(self, lane: BullLane, now_ms: int) -> tuple[int, int]:
+        """lane에서 now_ms까지 lease가 만료된 작업을 모두 회수, (되돌린 수, 실패 처리한 수) 반환"""
+        batch = max(1, settings.dequeue_batch_size)
+        total_requeued = total_failed = 0
+        while True:
+            requeued, failed = await self._reap_script(
+                keys=[lane.leases, lane.wait_key],
+                args=[
+                    now_ms, batch, lane.job_key_prefix, settings.job_max_stalled_count,
+                    RESULT_CHANNEL, self.message_serializer.name,
+                ],
+            )
+            if requeued or failed:
+                self.requeued += requeued
+                self.stalled_failed += failed
+                total_requeued += requeued
+                total_failed += failed
+                logger.warning(f"Reaped stalled jobs from {lane.name}: requeued={requeued}, failed={failed}")
+            if requeued + failed < batch:
+                return total_requeued, total_failed
+
+    def _encode_results(self, entries: list[tuple], batch: bool) -> bytes:
+        """
+        결과 메시지 인코딩
+
+        Args:
+            entries: [(job_id, status, result, returnvalue), ...] - returnvalue는 hash에 저장한 JSON 인코딩 (없으면 None)
+            batch: 배치 메시지(version 2)로 인코딩할지
+        """
+        serializer = self.message_serializer
+        if not serializer.is_json:
+            items = [{'jobId': job_id, 'result': result, 'status': status} for job_id, status, result, _ in entries]
+            return serializer.dumps({'version': RESULT_BATCH_VERSION, 'results': items} if batch else items[0])
+
+        # JSON이면 returnvalue로 저장한 인코딩을 그대로 끼워 넣음 (결과를 작업마다 한 번만 직렬화)
+        items = [
+            b'{"jobId":%s,"result":%s,"status":%s}' % (
+                serializer.dumps(job_id),
+                returnvalue if returnvalue is not None else serializer.dumps(result),
+                serializer.dumps(status),
+            )
+            for job_id, status, result, returnvalue in entries
+        ]
+        if not batch:
+            return items[0]
+        return b'{"version":%d,"results":[%s]}' % (RESULT_BATCH_VERSION, b",".join(items))
+
+    async def complete(self, job_id: str, result: dict, receipt=None):
+        """전처리 완료 이벤트 발행 (API Gateway가 전처리 결과를 받아서 gRPC 호출)"""
+        logger.debug(f"Publishing preprocessing result for job {job_id}")
+
+        lane = self.lane(receipt)
+        if self.publish_batch_size > 1:
+            await self._enqueue(lane, job_id, 'completed', result)
+            return
+
+        job_key = f"{lane.job_key_prefix}{job_id}"
+        now_ms = int(time.time() * 1000)
+
+        # MULTI/EXEC 파이프라인: 아래 명령들을 한 번의 왕복으로 원자적으로 실행
+        pipe = self.redis.pipeline(transaction=True)
+
+        # 1. 결과 저장 + 상태 업데이트 (Bull 호환)
+        returnvalue = self.job_serializer.dumps(result)
+        pipe.hset(job_key, mapping={
+            'returnvalue': returnvalue,
+            'finishedOn': now_ms,
+        })
+
+        # 2. lease 해제하고 completed로 이동
+        pipe.zrem(lane.leases, job_id)
+        pipe.zadd(lane.completed_key, {job_id: now_ms})
+
+        # 3. 전처리 결과를 API Gateway로 전달
+        pipe.publish(
+            RESULT_CHANNEL,
+            self._encode_results([(job_id, 'completed', result, returnvalue)], batch=False),
+        )
+        await pipe.execute()
+        lane.inflight.discard(job_id)
+        logger.debug(f"Preprocessing result published for job {job_id}")
+
+    async def fail(self, job_id: str, error: str, receipt=None):
+        """전처리 실패 처리"""
+        lane = self.lane(receipt)
+        if self.publish_batch_size > 1:
+            await self._enqueue(lane, job_id, 'failed', {'filter_reason': error})
+            logger.error(f"Job {job_id} marked as failed: {error}")
+            return
+
+        # lease 해제 + 실패 이벤트 발행을 한 번의 왕복으로 원자적으로 실행
+        pipe = self.redis.pipeline(transaction=True)
+
+        # ✨ lease 해제 (중요! 안하면 계속 쌓임)
+        pipe.zrem(lane.leases, job_id)
+
+        pipe.publish(
+            RESULT_CHANNEL,
+            self._encode_results([(job_id, 'failed', {'filter_reason': error}, None)], batch=False),
+        )
+        await pipe.execute()
+        lane.inflight.discard(job_id)
+
+        logger.error(f"Job {job_id} marked as failed: {error}")
+
+    async def _enqueue(self, lane: BullLane, job_id: str, status: str, result: dict):
+        """결과를 배치 발행 대기열에 넣고 발행될 때까지 대기"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((lane, job_id, status, result, future))
+        self._pending_event.set()
+        if len(self._pending) >= self.publish_batch_size:
+            self._batch_full.set()
+        await future
+
+    async def _publish_batch(self, batch: list[tuple]):
+        """
+        모은 결과를 한 번의 MULTI/EXEC로 처리
+        (완료 작업 결과 저장 + lease 일괄 해제 + completed 일괄 추가 + 배치 메시지 1건 발행)
+        """
+        now_ms = int(time.time() * 1000)
+        pipe = self.redis.pipeline(transaction=True)
+
+        # lane별 lease 해제 / completed 추가
+        leased: dict[BullLane, list] = {}
+        completed: dict[BullLane, dict] = {}
+        entries = []
+        for lane, job_id, status, result, _ in batch:
+            returnvalue = None
+            leased.setdefault(lane, []).append(job_id)
+            if status == 'completed':
+                returnvalue = self.job_serializer.dumps(result)
+                pipe.hset(f"{lane.job_key_prefix}{job_id}", mapping={
+                    'returnvalue': returnvalue,
+                    'finishedOn': now_ms,
+                })
+                completed.setdefault(lane, {})[job_id] = now_ms
+            entries.append((job_id, status, result, returnvalue))
+
+        for lane, job_ids in leased.items():
+            pipe.zrem(lane.leases, *job_ids)
+        for lane, finished in completed.items():
+            pipe.zadd(lane.completed_key, finished)
+
+        pipe.publish(RESULT_CHANNEL, self._encode_results(entries, batch=True))
+        await pipe.execute()
+
+        for lane, job_ids in leased.items():
+            lane.inflight.difference_update(job_ids)
+        self.publishes += 1
+        self.published += len(batch)
+
+    async def _flush(self):
+        """대기 중인 결과를 최대 RESULT_PUBLISH_BATCH_SIZE개 발행하고 기다리는 작업들에 결과 전달"""
+        batch = self._pending[:self.publish_batch_size]
+        self._pending = self._pending[self.publish_batch_size:]
+        if len(self._pending) < self.publish_batch_size:
+            self._batch_full.clear()
+        if not self._pending:
+            self._pending_event.clear()
+        if not batch:
+            return
+
+        try:
+            async with self._flush_lock:
+                await self._publish_batch(batch)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def publish_loop(self):
+        """
+        결과를 최대 RESULT_PUBLISH_BATCH_WAIT_MS 동안 또는 RESULT_PUBLISH_BATCH_SIZE개가 찰 때까지 모아서 발행
+        (pub/sub 메시지 수 = 작업 수 / 배치 크기, Gateway 구독자마다 전달되는 메시지도 그만큼 줄어듦)
+        """
+        while True:
+            await self._pending_event.wait()
+            if len(self._pending) < self.publish_batch_size:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.publish_batch_wait)
+                except asyncio.TimeoutError:
+                    pass
+            await self._flush()
+
+    def background_tasks(self, jobs: asyncio.Queue, limiter: ConcurrencyLimiter) -> list:
+        """fetch 외에 함께 실행할 태스크"""
+        tasks = [self.heartbeat(), self.reap()]
+        if self.publish_batch_size > 1:
+            tasks.append(self.publish_loop())
+        return tasks
+
+    def stats(self) -> dict:
+        stats = {
+            "inflight": self.inflight,
+            "requeued": self.requeued,
+            "stalled_failed": self.stalled_failed,
+            "fetch_retries": self.fetch_retries,
+        }
+        if self.publish_batch_size > 1:
+            stats["publishes"] = self.publishes
+            stats["avg_publish_batch"] = self.published / self.publishes if self.publishes else 0.0
+        return stats
+
+    async def close(self):
+        """남은 결과 발행 + 워커 등록 해제 (남은 lease는 만료 후 다른 워커가 회수)"""
+        while self._pending:
+            await self._flush()
+        for lane in self.lanes:
+            await self.redis.zrem(lane.workers, self.worker_id)
@@ -0,0 +1,308 @@
+"""
+Redis Streams 전달 방식 (consumer group)
+- 작업: stream:{queue}:jobs 스트림 (API Gateway가 XADD, 필드: jobId, data)
+- 결과: stream:{queue}:results 스트림 (워커가 XADD, 필드: jobId, status, result)
+
+XREADGROUP으로 배치 수신, 완료 시 결과 XADD + XACK을 모아서 한 번에 전송,
+처리 도중 죽은 워커의 작업은 XAUTOCLAIM으로 다른 워커가 가져감 (at-least-once)
+워커 복제본은 같은 consumer group에 붙기만 하면 작업이 나눠짐
+"""
+import asyncio
+import os
+import socket
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from src.concurrency import ConcurrencyLimiter
+from src.config import settings
+from src.serialization import serializer_for_queue
+
+# 결과 전송 실패 시 재시도 간격 (초, 실패할 때마다 2배, 최대 FLUSH_RETRY_MAX)
+FLUSH_RETRY_MIN = 0.1
+FLUSH_RETRY_MAX = 5.0
+
+# 종료(drain) 시 이 consumer가 처리 중인 항목을 새 항목으로 다시 추가하고 원래 항목은 ACK/삭제
+# (PEL의 항목을 다른 consumer에게 바로 넘기는 명령이 없어서 lease 만료를 기다리지 않도록 다시 추가, 스트림 끝에 들어감)
+# KEYS: 작업 스트림 / ARGV: group, 항목 ID...
+# 반환: 다시 추가한 수
+REQUEUE_SCRIPT = """
+local requeued = 0
+for i = 2, #ARGV do
+    local entries = redis.call('XRANGE', KEYS[1], ARGV[i], ARGV[i])
+    if #entries > 0 and redis.call('XACK', KEYS[1], ARGV[1], ARGV[i]) == 1 then
+        redis.call('XADD', KEYS[1], '*', unpack(entries[1][2]))
+        redis.call('XDEL', KEYS[1], ARGV[i])
+        requeued = requeued + 1
+    end
+end
+return requeued
+"""
+
+
+def jobs_stream_key(queue_name: str) -> str:
+    return f"stream:{queue_name}:jobs"
+
+
+def results_stream_key(queue_name: str) -> str:
+    return f"stream:{queue_name}:results"
+
+
+class StreamsTransport:
+    """Redis Streams consumer group 기반 작업 전달"""
+
+    name = "streams"
+
+    def __init__(self, redis_conn: Redis, queue_name: str):
+        self.redis = redis_conn
+        self.queue_name = queue_name
+        self.jobs_key = jobs_stream_key(queue_name)
+        self.results_key = results_stream_key(queue_name)
+        self.group = settings.stream_group
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        # 작업 data / 결과 result 필드 모두 큐별 직렬화 방식 사용 (Gateway의 QUEUE_SERIALIZER와 같아야 함)
+        self.job_serializer = serializer_for_queue(queue_name, settings.queue_serializer, settings.queue_serializers)
+
+        # 완료/실패 결과를 모아서 보내는 대기열: (job_id, status, result, entry_id, 전송 완료 시 결과를 받을 future)
+        self._pending: list[tuple] = []
+        self._pending_event = asyncio.Event()
+        self._flush_lock = asyncio.Lock()  # 전송 중인 항목을 종료 시 다시 추가하지 않도록
+
+        # 이 consumer가 처리 중인 항목 (heartbeat마다 idle 시간 초기화 → 오래 걸려도 reclaim되지 않음)
+        self.inflight: set = set()
+        self.fetching = True
+        self._requeue_script = redis_conn.register_script(REQUEUE_SCRIPT)
+
+        self.flushes = 0
+        self.flushed = 0
+        self.flush_retries = 0
+        self.reclaimed = 0
+
+    async def _ensure_group(self):
+        """consumer group 생성 (이미 있으면 무시, 스트림이 없으면 함께 생성)"""
+        try:
+            await self.redis.xgroup_create(self.jobs_key, self.group, id="0", mkstream=True)
+            logger.info(f"Created consumer group '{self.group}' on {self.jobs_key}")
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _put_entries(self, jobs: asyncio.Queue, limiter: ConcurrencyLimiter, entries):
+        limiter.acquire(len(entries))
+        for entry_id, fields in entries:
+            self.inflight.add(entry_id)
+            job_id = fields.get(b'jobId', entry_id).decode('utf-8')
+            await jobs.put((job_id, fields.get(b'data'), entry_id))
+
+    def lane_name(self, receipt) -> str:
+        """작업의 lane (Streams는 큐 하나만 소비)"""
+        return self.queue_name
+
+    def lane_weight(self, receipt) -> int:
+        return 1
+
+    async def depth(self) -> int:
+        """대기 + 처리 중인 작업 수 (ACK된 항목은 삭제하므로 스트림 길이와 같음)"""
+        return await self.redis.xlen(self.jobs_key)
+
+    async def lane_depths(self) -> dict:
+        return {self.queue_name: await self.depth()}
+
+    async def queue_depths(self) -> dict:
+        """아직 전달되지 않은 / 전달됐지만 ACK 안 된 작업 수 (consumer group 전체)"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.xlen(self.jobs_key)
+            pipe.xpending(self.jobs_key, self.group)
+            length, pending = await pipe.execute()
+        active = pending["pending"]
+        return {"wait": max(0, length - active), "active": active}
+
+    async def fetch(self, jobs: asyncio.Queue, limiter: ConcurrencyLimiter):
+        """
+        XREADGROUP으로 새 작업을 배치로 받아 프로세스 내부 큐(jobs)에 전달
+
+        BLOCK 중에는 항목이 하나라도 오면 바로 반환되므로 유휴 시에는 1개씩 (지연 우선),
+        밀려 있으면 최대 DEQUEUE_BATCH_SIZE개씩 (처리량 우선) 받음
+        jobs 항목: (job_id, data 원본, receipt) - receipt는 XACK할 스트림 항목 ID
+        """
+        await self._ensure_group()
+        logger.info(f"Consuming {self.jobs_key} as {self.group}/{self.consumer}")
+
+        while self.fetching:
+            room = await limiter.wait_for_room()
+            if not self.fetching:
+                break
+            reply = await self.redis.xreadgroup(
+                self.group, self.consumer, {self.jobs_key: ">"},
+                count=min(max(1, settings.dequeue_batch_size), room), block=1000,
+            )
+            for _, entries in reply or []:
+                logger.debug(f"Received {len(entries)} jobs from stream")
+                await self._put_entries(jobs, limiter, entries)
+
+    async def reclaim(self, jobs: asyncio.Queue, limiter: ConcurrencyLimiter):
+        """
+        lease 시간(JOB_LEASE_TIMEOUT) 이상 ACK되지 않은 항목을 이 consumer로 가져와 다시 처리
+        (처리 도중 죽은 워커의 작업 복구)
+
+        fetch와 같이 limiter에 자리가 난 만큼만 가져옴 (나머지는 다음 XAUTOCLAIM 또는 다른 워커가 가져감)
+        """
+        min_idle_ms = int(settings.job_lease_timeout * 1000)
+        await self._ensure_group()
+
+        while True:
+            await asyncio.sleep(settings.stream_reclaim_interval)
+            if not self.fetching:
+                break
+            start_id = "0-0"
+            try:
+                while self.fetching:
+                    room = await limiter.wait_for_room()
+                    if not self.fetching:
+                        break
+                    start_id, entries, deleted = await self.redis.xautoclaim(
+                        self.jobs_key, self.group, self.consumer, min_idle_ms,
+                        start_id=start_id, count=min(max(1, settings.dequeue_batch_size), room),
+                    )
+                    # 스트림에서 이미 삭제된 항목은 처리할 수 없으므로 ACK만
+                    # (Redis 7은 deleted 목록으로, 6.2는 entries에 필드 없는 항목 [id, nil]로 돌려줌)
+                    deleted = list(deleted or [])
+                    deleted += [entry_id for entry_id, fields in entries if entry_id is not None and not fields]
+                    entries = [(entry_id, fields) for entry_id, fields in entries if entry_id is not None and fields]
+                    if deleted:
+                        await self.redis.xack(self.jobs_key, self.group, *deleted)
+                    if entries:
+                        self.reclaimed += len(entries)
+                        logger.warning(f"Reclaimed {len(entries)} stalled stream entries")
+                        await self._put_entries(jobs, limiter, entries)
+                    if start_id in (b"0-0", "0-0"):
+                        break
+            except Exception as e:
+                logger.error(f"Stream reclaim error: {e}")
+
+    def stop_fetching(self):
+        """새 작업 가져오기 / reclaim 중단 (종료 시)"""
+        self.fetching = False
+
+    async def requeue_inflight(self) -> int:
+        """종료 시 끝내지 못한 항목을 스트림에 다시 추가 (남은 결과를 먼저 전송해서 완료된 항목은 제외)"""
+        await self._flush()
+        async with self._flush_lock:
+            if not self.inflight:
+                return 0
+            requeued = await self._requeue_script(keys=[self.jobs_key], args=[self.group, *self.inflight])
+            self.inflight.clear()
+        return requeued
+
+    async def heartbeat(self):
+        """처리 중인 항목을 자기 자신에게 다시 claim해서 idle 시간 초기화 (lease 연장)"""
+        while True:
+            await asyncio.sleep(settings.worker_heartbeat_interval)
+            if not self.inflight:
+                continue
+            try:
+                await self.redis.xclaim(
+                    self.jobs_key, self.group, self.consumer, 0, list(self.inflight), justid=True,
+                )
+            except Exception as e:
+                logger.warning(f"Heartbeat failed: {e}")
+
+    async def _enqueue(self, job_id: str, status: str, result: dict, receipt):
+        """결과를 전송 대기열에 넣고 ACK될 때까지 대기 (그동안 동시 처리 자리를 계속 차지)"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((job_id, status, result, receipt, future))
+        self._pending_event.set()
+        await future
+
+    async def complete(self, job_id: str, result: dict, receipt=None):
+        """결과 XADD + XACK (flusher가 모아서 전송, 전송될 때까지 대기)"""
+        await self._enqueue(job_id, 'completed', result, receipt)
+
+    async def fail(self, job_id: str, error: str, receipt=None):
+        await self._enqueue(job_id, 'failed', {'filter_reason': error}, receipt)
+        logger.error(f"Job {job_id} marked as failed: {error}")
+
+    async def _flush(self):
+        """
+        쌓인 결과를 한 번의 파이프라인으로 전송 (결과 XADD + 작업 XACK/XDEL)
+
+        Redis 오류로 실패하면 배치를 대기열 맨 앞으로 되돌리고 예외를 그대로 올림 (flush_loop가 재시도)
+        그 외 오류(직렬화 실패 등)는 재시도해도 같으므로 기다리는 작업에 예외를 전달하고
+        항목을 inflight에서 빼서 heartbeat가 lease를 연장하지 않도록 함 (lease 만료 후 reclaim으로 다시 처리)
+        """
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        entry_ids = [entry_id for _, _, _, entry_id, _ in batch if entry_id is not None]
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            for job_id, status, result, _, _ in batch:
+                pipe.xadd(
+                    self.results_key,
+                    {'jobId': job_id, 'status': status, 'result': self.job_serializer.dumps(result)},
+                    maxlen=settings.stream_results_maxlen, approximate=True,
+                )
+            if entry_ids:
+                # ACK 후 삭제해서 작업 스트림에는 대기 + 처리 중인 항목만 남김
+                pipe.xack(self.jobs_key, self.group, *entry_ids)
+                pipe.xdel(self.jobs_key, *entry_ids)
+            async with self._flush_lock:
+                await pipe.execute()
+                self.inflight.difference_update(entry_ids)
+        except (RedisError, OSError):
+            self._pending[:0] = batch
+            raise
+        except Exception as e:
+            self.inflight.difference_update(entry_ids)
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+
+        for *_, future in batch:
+            if not future.done():
+                future.set_result(None)
+        self.flushes += 1
+        self.flushed += len(batch)
+
+    async def flush_loop(self):
+        """
+        결과가 생기면 바로 전송, 전송 중에 쌓인 결과는 다음 전송에 묶음
+        (대기 시간을 추가하지 않고 부하가 높을수록 자연스럽게 배치가 커짐)
+        Redis 오류로 실패한 배치는 FLUSH_RETRY_MIN~FLUSH_RETRY_MAX 간격으로 재시도
+        """
+        retry_delay = FLUSH_RETRY_MIN
+        while True:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            try:
+                await self._flush()
+                retry_delay = FLUSH_RETRY_MIN
+            except (RedisError, OSError) as e:
+                logger.error(f"Stream flush error (retrying in {retry_delay:g}s): {e}")
+                self.flush_retries += 1
+                self._pending_event.set()
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, FLUSH_RETRY_MAX)
+            except Exception as e:
+                logger.error(f"Stream flush error: {e}")
+
+    def background_tasks(self, jobs: asyncio.Queue, limiter: ConcurrencyLimiter) -> list:
+        """fetch 외에 함께 실행할 태스크"""
+        return [self.flush_loop(), self.heartbeat(), self.reclaim(jobs, limiter)]
+
+    def stats(self) -> dict:
+        return {
+            "flushes": self.flushes,
+            "flushed": self.flushed,
+            "avg_flush_size": self.flushed / self.flushes if self.flushes else 0.0,
+            "flush_retries": self.flush_retries,
+            "inflight": len(self.inflight),
+            "reclaimed": self.reclaimed,
+        }
+
+    async def close(self):
+        """남은 결과 전송"""
+        await self._flush()
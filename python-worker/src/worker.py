@@ -26,8 +26,8 @@ redis_conn = Redis(
     decode_responses=True
 )
 
-# 전처리기 및 번역 서비스 초기화
-preprocessor = TextPreprocessor()
+# 전처리기 및 번역 서비스 초기화 (모델은 백그라운드에서 로드)
+preprocessor = TextPreprocessor(lazy=True)
 vllm_service = VLLMService()
 
 
@@ -123,6 +123,12 @@ def main():
     logger.info(f"Queue: {settings.queue_name}")
     logger.info(f"VLLM: {settings.vllm_url}")
 
+    # 모델 로드 + 워밍업이 끝난 뒤 작업 수신 시작
+    logger.info("Waiting for preprocessing models...")
+    if not preprocessor.wait_ready():
+        raise RuntimeError(f"Preprocessing models failed to load: {preprocessor.readiness()}")
+    logger.info(f"Preprocessor ready: {preprocessor.readiness()}")
+
     with Connection(redis_conn):
         queue = Queue(settings.queue_name)
         worker = Worker(
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+축약어/신조어 단일 패스 확장 테스트 (기존 사전 순회 방식과 결과 비교)
+"""
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.preprocessor.text_processor import TextPreprocessor
+from loguru import logger
+
+
+def legacy_expand(dictionary: dict, text: str) -> str:
+    """기존 구현: 사전 항목마다 re.sub 실행"""
+    for key, full in dictionary.items():
+        text = re.sub(rf'\b{re.escape(key)}\b', full, text)
+    return text
+
+
+def test_abbreviation_expansion():
+    """단일 패스 매처가 기존 순회 방식과 같은 결과를 내는지 확인"""
+    logger.info("=== Abbreviation / Slang Expansion Test ===\n")
+
+    preprocessor = TextPreprocessor()
+
+    test_cases = [
+        "ㅎㅇ ㅎㅇ 방가",
+        "ㅇㅋㅇ ㄱㄱ",
+        "ㄹㅇ ㄹㅈㄷ 이거 ㅇㄱㄹㅇ",
+        "ㅋㅋ하이",
+        "개꿀잼 개꿀 꿀잼",
+        "이 판 노잼 개노잼 띵작",
+        "쩔수지 쩔수 까비",
+        "ㅈㅈ ㅅㄱ ㅂㅂ",
+        "hello ㅇㅈ world",
+        "",
+    ]
+
+    for text in test_cases:
+        abbr = preprocessor.expand_abbreviations(text)
+        slang = preprocessor.expand_slang(text)
+        logger.info(f"Input: '{text}' → abbr: '{abbr}' / slang: '{slang}'")
+
+        assert abbr == legacy_expand(TextPreprocessor.CONSONANT_ABBR, text)
+        assert slang == legacy_expand(TextPreprocessor.SLANG_DICT, text).strip()
+
+
+if __name__ == "__main__":
+    test_abbreviation_expansion()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Bull lease 프로토콜 테스트 (fakeredis + Lua로 실제 스크립트 실행)
+배치 dequeue → lease, lease 만료 → 되돌림 / stalledCounter 초과 → 실패 발행, heartbeat와 reaper 경합, 종료 시 되돌림
+
+필요: pip install "fakeredis[lua]"
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from src.config import settings
+from src.transports.bull import RESULT_CHANNEL, BullTransport
+from loguru import logger
+
+QUEUE = "translation-jobs"
+WAIT = f"bull:{QUEUE}:wait"
+LEASES = f"bull:{QUEUE}:leases"
+
+
+async def make_transport(job_ids: list[str], lanes: dict | None = None) -> tuple[BullTransport, FakeRedis]:
+    """Bull처럼 작업 hash를 만들고 wait 리스트에 LPUSH (오래된 작업이 오른쪽 끝)"""
+    redis = FakeRedis(server=FakeServer())
+    for job_id in job_ids:
+        await redis.hset(f"bull:{QUEUE}:{job_id}", mapping={"data": json.dumps({"id": job_id})})
+        await redis.lpush(WAIT, job_id)
+    return BullTransport(redis, QUEUE, lanes), redis
+
+
+async def leases(redis: FakeRedis) -> dict:
+    return {job_id.decode(): int(score) for job_id, score in await redis.zrange(LEASES, 0, -1, withscores=True)}
+
+
+async def waiting(redis: FakeRedis) -> list[str]:
+    """다음에 꺼낼 작업부터 (RPOP 순서)"""
+    return [job_id.decode() for job_id in reversed(await redis.lrange(WAIT, 0, -1))]
+
+
+def test_batched_dequeue():
+    """배치 dequeue는 오래된 작업부터 가져오면서 작업마다 lease를 잡고 data를 함께 반환"""
+    logger.info("=== Bull Lease Test ===\n")
+
+    async def run():
+        transport, redis = await make_transport(["1", "2", "3"])
+        before = int(time.time() * 1000)
+        items = await transport.dequeue(2)
+        assert [(lane.name, job_id, json.loads(data)) for lane, job_id, data in items] == [
+            (QUEUE, "1", {"id": "1"}), (QUEUE, "2", {"id": "2"}),
+        ]
+        assert transport.lanes[0].depth == 1
+        assert transport.lanes[0].inflight == {"1", "2"}
+        assert await waiting(redis) == ["3"]
+
+        held = await leases(redis)
+        assert sorted(held) == ["1", "2"]
+        assert all(before + transport.lease_ms <= deadline <= before + transport.lease_ms + 1000 for deadline in held.values())
+        assert await redis.hget(f"bull:{QUEUE}:1", "processedOn") is not None
+
+    asyncio.run(run())
+
+
+def test_expired_lease_requeued():
+    """lease가 만료된 작업은 대기열 맨 앞으로 되돌리고 stalledCounter를 올림"""
+    async def run():
+        transport, redis = await make_transport(["1", "2", "3"])
+        await transport.dequeue(2)
+        # 1만 만료 (2는 lease가 남아 있음)
+        await redis.zadd(LEASES, {"1": 0})
+
+        assert await transport.reap_lane(transport.lanes[0], int(time.time() * 1000)) == (1, 0)
+        assert await waiting(redis) == ["1", "3"]
+        assert sorted(await leases(redis)) == ["2"]
+        assert await redis.hget(f"bull:{QUEUE}:1", "stalledCounter") == b"1"
+        assert transport.requeued == 1
+
+    asyncio.run(run())
+
+
+def test_stalled_job_fails():
+    """JOB_MAX_STALLED_COUNT번을 넘게 회수된 작업은 되돌리지 않고 실패 이벤트 발행"""
+    async def run():
+        transport, redis = await make_transport(["1"])
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(RESULT_CHANNEL)
+        await pubsub.get_message(timeout=0.1)  # 구독 확인 메시지
+
+        await transport.dequeue(1)
+        await redis.hset(f"bull:{QUEUE}:1", "stalledCounter", settings.job_max_stalled_count)
+        await redis.zadd(LEASES, {"1": 0})
+
+        assert await transport.reap_lane(transport.lanes[0], int(time.time() * 1000)) == (0, 1)
+        assert await waiting(redis) == []
+        assert await leases(redis) == {}
+        assert await redis.hget(f"bull:{QUEUE}:1", "failedReason") == b"job stalled more than allowable limit"
+
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        logger.info(f"Failure event: {message['data']}")
+        event = json.loads(message["data"])
+        assert event["jobId"] == "1"
+        assert event["status"] == "failed"
+        assert transport.stalled_failed == 1
+        await pubsub.aclose()
+
+    asyncio.run(run())
+
+
+def test_heartbeat_races_reaper():
+    """heartbeat가 먼저면 lease가 연장되어 회수되지 않고, reaper가 먼저면 heartbeat가 lease를 다시 만들지 않음"""
+    async def run():
+        transport, redis = await make_transport(["1", "2"])
+        await transport.dequeue(2)
+        now_ms = int(time.time() * 1000)
+
+        # heartbeat 먼저: 연장된 lease는 지금 회수되지 않음
+        await redis.zadd(LEASES, {"1": now_ms - 1})
+        await transport.extend_leases(now_ms)
+        assert await transport.reap_lane(transport.lanes[0], now_ms) == (0, 0)
+        assert (await leases(redis))["1"] == now_ms + transport.lease_ms
+
+        # reaper 먼저: 되돌린 작업의 lease는 heartbeat(ZADD XX)가 다시 잡지 않음 (다른 워커와 중복 처리 방지)
+        await redis.zadd(LEASES, {"2": now_ms - 1})
+        assert await transport.reap_lane(transport.lanes[0], now_ms) == (1, 0)
+        await transport.extend_leases(now_ms + 1000)
+        assert sorted(await leases(redis)) == ["1"]
+        assert await waiting(redis) == ["2"]
+
+    asyncio.run(run())
+
+
+def test_requeue_on_drain():
+    """종료 시 처리 중인 작업은 lease 만료를 기다리지 않고 대기열 맨 앞으로 (stalledCounter는 그대로)"""
+    async def run():
+        transport, redis = await make_transport(["1", "2", "3"])
+        await transport.dequeue(2)
+        # 2는 이미 회수되어 다른 워커가 가져감 (lease 없음): 되돌리지 않음
+        await redis.zrem(LEASES, "2")
+
+        assert await transport.requeue_inflight() == 1
+        assert await waiting(redis) == ["1", "3"]
+        assert await leases(redis) == {}
+        assert transport.inflight == 0
+        assert await redis.hget(f"bull:{QUEUE}:1", "stalledCounter") is None
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_batched_dequeue()
+    test_expired_lease_requeued()
+    test_stalled_job_fails()
+    test_heartbeat_races_reaper()
+    test_requeue_on_drain()
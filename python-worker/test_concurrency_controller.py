@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+적응형 동시 처리 제어 테스트 (증가/유지/감소 결정 + 상하한 + limiter 대기)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.concurrency import AdaptiveConcurrencyController, ConcurrencyLimiter, read_cgroup_cpu_times
+from src.preprocessor.stage_metrics import LatencyHistogram
+from loguru import logger
+
+
+def _latency(ms: float, count: int = 10) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    histogram.record(ms, count)
+    return histogram
+
+
+def test_controller_decisions():
+    """대기열이 밀리고 limit을 다 쓰면 증가, 유휴면 유지, CPU/지연 포화 시 감소"""
+    logger.info("=== Adaptive Concurrency Controller Test ===\n")
+
+    limiter = ConcurrencyLimiter(4)
+    controller = AdaptiveConcurrencyController(limiter, depth_fn=None, min_limit=4, max_limit=20, backoff=0.5)
+
+    # 대기열이 밀려 있고 limit을 모두 사용 중 → 증가 (상한까지)
+    limiter.acquire(4)
+    limits = []
+    for _ in range(10):
+        limiter.outstanding = limiter.limit
+        assert controller.step(depth=100, latency=_latency(10), cpu=0.5) in ("increase", "hold")
+        limits.append(limiter.limit)
+    logger.info(f"Increase: {limits}")
+    assert limits[0] == 6
+    assert limits == sorted(limits)
+    assert limits[-1] == 20
+
+    # 대기열이 비어 있으면 유지 (수요 없이 늘리지 않음)
+    assert controller.step(depth=0, latency=_latency(10), cpu=0.5) == "hold"
+    assert limiter.limit == 20
+
+    # CPU 포화 → 감소
+    assert controller.step(depth=100, latency=_latency(10), cpu=0.95) == "decrease_cpu"
+    assert limiter.limit == 10
+
+    # 지연 시간이 기준선(~10ms)의 2배 초과 → 감소, 하한 아래로는 내려가지 않음
+    assert controller.step(depth=100, latency=_latency(50), cpu=0.5) == "decrease_latency"
+    assert controller.step(depth=100, latency=_latency(50), cpu=0.5) == "decrease_latency"
+    assert limiter.limit == 4
+    logger.info(f"Stats: {controller.stats()}")
+    assert controller.baseline_ms < 20  # 과부하 지연은 기준선에 반영하지 않음
+    assert controller.decision_flags() == {"increase": 0, "hold": 0, "decrease_cpu": 0, "decrease_latency": 1}
+
+
+def test_cgroup_cpu_quota(tmp_path):
+    """컨테이너 CPU 할당량(cpu.max) 대비 사용량으로 CPU 사용률 계산, cgroup v2가 아니면 호스트 값"""
+    (tmp_path / "cpu.max").write_text("200000 100000\n")  # 2 CPU
+    (tmp_path / "cpu.stat").write_text("usage_usec 1000000\nuser_usec 800000\nsystem_usec 200000\n")
+
+    controller = AdaptiveConcurrencyController(ConcurrencyLimiter(4), depth_fn=None, cgroup_dir=str(tmp_path))
+    assert controller.cpu_source == "cgroup"
+    busy, total = read_cgroup_cpu_times(str(tmp_path))
+    assert busy == 1000000
+
+    # 0.1초 동안 2 CPU 할당량의 절반(0.1 CPU초) 사용 → 약 50%
+    (tmp_path / "cpu.stat").write_text("usage_usec 1100000\n")
+    controller._cpu_times = (busy, total - 200000)
+    cpu = controller._read_cpu()
+    logger.info(f"cgroup CPU: {cpu:.0%}")
+    assert 0.3 < cpu <= 0.5
+
+    missing = AdaptiveConcurrencyController(ConcurrencyLimiter(4), depth_fn=None, cgroup_dir=str(tmp_path / "none"))
+    assert missing.cpu_source == "host"
+
+
+def test_limiter_waits_for_room():
+    """limit만큼 가져간 뒤에는 완료될 때까지 대기"""
+    async def scenario():
+        limiter = ConcurrencyLimiter(2)
+        assert await limiter.wait_for_room() == 2
+        limiter.acquire(2)
+
+        waiter = asyncio.create_task(limiter.wait_for_room())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        limiter.release(5.0)
+        assert await asyncio.wait_for(waiter, 1) == 1
+        assert limiter.take_window().count == 1
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_controller_decisions()
+    test_limiter_waits_for_room()
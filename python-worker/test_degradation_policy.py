@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+부하 단계 정책 테스트 (한 단계씩 올림 + 대기열이 비면 한 단계씩 복구 + 단계별 옵션)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.degradation import LEVELS, DegradationPolicy, degrade_options
+from src.models import PreprocessOptions
+from loguru import logger
+
+
+def test_degradation_ladder():
+    """대기열 길이/작업 대기 시간에 따라 한 주기에 한 단계씩 이동"""
+    logger.info("=== Degradation Policy Test ===\n")
+
+    policy = DegradationPolicy(depth_thresholds=[100, 200, 300], age_thresholds_ms=[1000, 2000, 3000], min_hold=5.0)
+
+    # 대기열이 크게 밀려도 한 주기에 한 단계씩
+    levels = [policy.update(depth=1000, age_ms=0, now=t) for t in range(4)]
+    logger.info(f"Escalation: {[LEVELS[level] for level in levels]}")
+    assert levels == [1, 2, 3, 3]
+
+    # 대기열이 줄어도 최소 유지 시간 전에는 복구하지 않음
+    assert policy.update(depth=0, age_ms=0, now=4) == 3
+    # 임계값 × recover_ratio(0.5) 이상이면 유지
+    assert policy.update(depth=200, age_ms=0, now=10) == 3
+    # 비면 한 단계씩 복구 (단계마다 최소 유지 시간)
+    assert policy.update(depth=0, age_ms=0, now=10) == 2
+    assert policy.update(depth=0, age_ms=0, now=11) == 2
+    assert policy.update(depth=0, age_ms=0, now=16) == 1
+    assert policy.update(depth=0, age_ms=0, now=22) == 0
+
+    # 대기열은 짧아도 작업 대기 시간이 길면 올림 (기록된 대기 시간의 p90 사용)
+    for _ in range(10):
+        policy.observe_age(1500)
+    assert policy.update(depth=0, now=30) == 1
+    logger.info(f"Stats: {policy.stats()}")
+
+
+def test_degrade_options():
+    """단계별로 끄는 옵션이 누적되고, 원래 꺼져 있던 옵션은 유지"""
+    options = PreprocessOptions(filter_profanity=True)
+    assert degrade_options(options, 0) is options
+
+    no_spacing = degrade_options(options, 1)
+    assert not no_spacing.add_spacing and no_spacing.fix_typos and no_spacing.filter_profanity
+
+    regex_only = degrade_options(options, 3)
+    assert not (regex_only.add_spacing or regex_only.fix_typos or regex_only.split_sentences)
+    assert regex_only.normalize_repeats and regex_only.expand_abbreviations
+
+    # 단계가 다르면 결과 캐시 키도 달라짐 (복구 후 낮은 품질 결과를 재사용하지 않음)
+    assert len({degrade_options(options, level).cache_key() for level in range(len(LEVELS))}) == len(LEVELS)
+
+
+def test_degraded_prefers_full_cache():
+    """부하 단계에서도 전체 품질 결과가 캐시에 있으면 그 결과를 쓰고, 없을 때만 낮춘 단계의 결과 사용"""
+    from src.bull_worker import cached_preprocess, preprocess_cache
+
+    options = PreprocessOptions()
+    full_key = ("ㄹㅇ 레전드", options.cache_key())
+    degraded_key = ("ㄹㅇ 레전드", degrade_options(options, 2).cache_key())
+    preprocess_cache.clear()
+    try:
+        preprocess_cache.put(degraded_key, ("리얼 레전드", False, None, ()))
+        assert asyncio.run(cached_preprocess("ㄹㅇ 레전드", options, 2)) == ("리얼 레전드", False, None, [], 2)
+
+        preprocess_cache.put(full_key, ("리얼 레전드.", False, None, ()))
+        hits, misses = preprocess_cache.hits, preprocess_cache.misses
+        assert asyncio.run(cached_preprocess("ㄹㅇ 레전드", options, 2)) == ("리얼 레전드.", False, None, [], 0)
+        assert (preprocess_cache.hits, preprocess_cache.misses) == (hits + 1, misses)
+    finally:
+        preprocess_cache.clear()
+
+
+if __name__ == "__main__":
+    test_degradation_ladder()
+    test_degrade_options()
+    test_degraded_prefers_full_cache()
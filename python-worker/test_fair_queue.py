@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+방송별 공정 스케줄링 테스트 (deficit round-robin + 방송별 상한)
+"""
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.concurrency import ConcurrencyLimiter
+from src.fair_queue import FairJobQueue
+from loguru import logger
+
+
+def classify(item):
+    """테스트용 작업: (방송, 텍스트, 가중치)"""
+    broadcast, text, weight = item
+    return broadcast, len(text), weight, item
+
+
+async def no_shed(item):
+    raise AssertionError(f"unexpected shed: {item}")
+
+
+def test_hot_broadcast_does_not_starve_others():
+    """몰린 방송 뒤에 들어온 다른 방송의 채팅이 돌아가며 처리되는지"""
+    logger.info("=== Fair Queue Test ===\n")
+
+    async def run():
+        fair = FairJobQueue(classify, no_shed, quantum=10)
+        for i in range(50):
+            await fair.put(("hot", f"raid {i:04d}", 1))  # 9글자
+        for i in range(3):
+            await fair.put(("small-a", f"hi {i}", 1))
+            await fair.put(("small-b", f"yo {i}", 1))
+        return [(await fair.get())[0] for _ in range(fair.qsize())]
+
+    order = asyncio.run(run())
+    logger.info(f"First 12: {order[:12]}")
+    # 작은 방송은 몰린 방송 50개가 끝나기 전에 모두 처리됨
+    last_small = max(i for i, broadcast in enumerate(order) if broadcast != "hot")
+    assert last_small < 12, last_small
+    # 방송 안에서는 들어온 순서 유지
+    assert order.count("hot") == 50
+
+
+def test_cost_and_weight():
+    """비용(글자 수) × 가중치 비율로 처리량이 나뉘는지"""
+
+    async def run():
+        fair = FairJobQueue(classify, no_shed, quantum=20)
+        for _ in range(200):
+            await fair.put(("long", "x" * 20, 1))
+            await fair.put(("short", "x" * 5, 1))
+            await fair.put(("priority", "x" * 20, 3))
+        return [(await fair.get())[0] for _ in range(200)]
+
+    counts = Counter(asyncio.run(run()))
+    logger.info(f"Served (first 200): {dict(counts)}")
+    # 한 차례: long 1개 (20자), short 4개 (20자), priority 3개 (60자)
+    assert counts == {"long": 25, "short": 100, "priority": 75}
+
+
+def test_per_broadcast_cap_sheds_oldest():
+    """방송별 상한을 넘으면 그 방송의 가장 오래된 작업만 버림"""
+    shed = []
+
+    async def on_shed(item):
+        shed.append(item[1])
+
+    async def run():
+        fair = FairJobQueue(classify, on_shed, max_per_key=3)
+        for i in range(5):
+            await fair.put(("hot", f"chat {i}", 1))
+        await fair.put(("calm", "hello", 1))
+        return fair, [(await fair.get())[1] for _ in range(fair.qsize())]
+
+    fair, served = asyncio.run(run())
+    assert shed == ["chat 0", "chat 1"]
+    assert sorted(served) == ["chat 2", "chat 3", "chat 4", "hello"]
+    assert fair.stats()["shed"] == 2 and fair.qsize() == 0
+
+    # 상한을 적용하지 않는 키 (방송 정보가 없는 작업)
+    async def run_uncapped():
+        fair = FairJobQueue(classify, no_shed, max_per_key=3, capped=lambda key: key != "")
+        for i in range(5):
+            await fair.put(("", f"api {i}", 1))
+        return fair.qsize()
+
+    assert asyncio.run(run_uncapped()) == 5
+
+
+def test_dispatch_respects_limiter():
+    """dispatch는 동시 처리 자리가 있을 때만 워커 큐로 넘기고 버퍼 자리를 반환"""
+
+    async def run():
+        fair = FairJobQueue(classify, no_shed)
+        buffer, limiter, jobs = ConcurrencyLimiter(10), ConcurrencyLimiter(2), asyncio.Queue()
+        for i in range(5):
+            buffer.acquire(1)
+            await fair.put((f"b{i}", "text", 1))
+
+        task = asyncio.create_task(fair.dispatch(buffer, limiter, jobs))
+        await asyncio.sleep(0.01)
+        assert jobs.qsize() == 2 and limiter.outstanding == 2 and buffer.outstanding == 3
+
+        limiter.release()
+        await asyncio.sleep(0.01)
+        assert jobs.qsize() == 3 and fair.qsize() == 2
+        task.cancel()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_hot_broadcast_does_not_starve_others()
+    test_cost_and_weight()
+    test_per_broadcast_cap_sheds_oldest()
+    test_dispatch_respects_limiter()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+배치 오타 교정 테스트 (stub Kiwi): fix_typos_batch 결과가 문장별 fix_typos 결과와 동일한지 확인
+kiwipiepy 없이 실행 (tokenize(list)가 문장별 토큰을 돌려주는 stub)
+"""
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.preprocessor.text_processor import TextPreprocessor
+from loguru import logger
+
+Token = namedtuple("Token", ["form", "start", "len"])
+
+
+class StubKiwi:
+    """어절을 앞 글자 + 나머지 형태소로 나누고 CORRECTIONS로 교정하는 Kiwi"""
+
+    CORRECTIONS = {"외": "왜", "않": "안", "됀": "된"}
+
+    def __init__(self):
+        self.calls: list = []
+
+    def _tokens(self, text: str) -> list:
+        tokens = []
+        pos = 0
+        for word in text.split():
+            start = text.index(word, pos)
+            pos = start + len(word)
+            parts = [word[:1], word[1:]] if len(word) > 1 else [word]
+            offset = start
+            for part in parts:
+                tokens.append(Token("".join(self.CORRECTIONS.get(ch, ch) for ch in part), offset, len(part)))
+                offset += len(part)
+        return tokens
+
+    def tokenize(self, text):
+        self.calls.append(text)
+        if isinstance(text, list):
+            # 실제 Kiwi처럼 문장별 토큰 목록을 차례로 돌려주는 iterator
+            return (self._tokens(item) for item in text)
+        return self._tokens(text)
+
+
+def make_preprocessor() -> TextPreprocessor:
+    preprocessor = TextPreprocessor(warmup=False, defer_models=("spacing", "kiwi", "kss"))
+    preprocessor.kiwi = StubKiwi()
+    return preprocessor
+
+
+def test_fix_typos_batch_matches_single():
+    """배치 결과 = 문장별 결과 (빈 문자열 / 공백만 있는 문장 포함), Kiwi는 한 번만 호출"""
+    logger.info("=== Fix Typos Batch Test ===\n")
+
+    texts = [
+        "외않됀대?",
+        "",
+        "   ",
+        "오늘  날씨  좋네",
+        " 앞뒤 공백 ",
+        "ㅋ",
+        "외 않 됀",
+    ]
+
+    preprocessor = make_preprocessor()
+    expected = [preprocessor.fix_typos(text) for text in texts]
+
+    preprocessor.kiwi.calls.clear()
+    batched = preprocessor.fix_typos_batch(texts)
+    logger.info(f"Batched: {batched}")
+
+    assert batched == expected
+    assert preprocessor.kiwi.calls == [texts]
+    # 토큰이 없는 문장은 그대로
+    assert batched[1] == "" and batched[2] == "   "
+    assert batched[0] == "왜안된대?"
+    # 원본 띄어쓰기 기준으로 어절 재조합 (연속 공백은 하나로)
+    assert batched[3] == "오늘 날씨 좋네"
+
+
+def test_fix_typos_batch_without_kiwi():
+    """Kiwi가 없으면 입력을 그대로 반환"""
+    preprocessor = TextPreprocessor(warmup=False, defer_models=("spacing", "kiwi", "kss"))
+    assert preprocessor.fix_typos_batch(["외않됀대?", ""]) == ["외않됀대?", ""]
+    assert preprocessor.fix_typos_batch([]) == []
+
+
+if __name__ == "__main__":
+    test_fix_typos_batch_matches_single()
+    test_fix_typos_batch_without_kiwi()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+종료(drain) 테스트: 가져오기 중단 → 처리 중인 작업 완료 대기 → 시간 안에 못 끝낸 작업은 대기열로 되돌림
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.bull_worker import drain
+from src.concurrency import ConcurrencyLimiter
+from loguru import logger
+
+
+class MemoryTransport:
+    """처리 중인 작업만 기록하는 전달 방식 (drain이 사용하는 메서드만)"""
+
+    def __init__(self):
+        self.fetching = True
+        self.inflight: set = set()
+        self.completed: list = []
+        self.requeued: list = []
+
+    def stop_fetching(self):
+        self.fetching = False
+
+    async def requeue_inflight(self) -> int:
+        self.requeued = sorted(self.inflight)
+        self.inflight.clear()
+        return len(self.requeued)
+
+
+async def run_drain(durations: dict, timeout: float) -> MemoryTransport:
+    transport = MemoryTransport()
+    limiter = ConcurrencyLimiter(len(durations))
+
+    async def process(job_id: str, duration: float):
+        try:
+            await asyncio.sleep(duration)
+            transport.inflight.discard(job_id)
+            transport.completed.append(job_id)
+        finally:
+            limiter.release()
+
+    limiter.acquire(len(durations))
+    transport.inflight.update(durations)
+    workers = [asyncio.ensure_future(process(job_id, duration)) for job_id, duration in durations.items()]
+    await asyncio.sleep(0)
+
+    await drain(transport, limiter, workers, None, timeout)
+    assert not transport.fetching
+    assert limiter.outstanding == 0
+    return transport
+
+
+def test_drain_waits_for_jobs():
+    """시간 안에 끝나는 작업은 완료까지 기다리고 되돌리지 않음"""
+    logger.info("=== Graceful Drain Test ===\n")
+
+    transport = asyncio.run(run_drain({"a": 0.01, "b": 0.05}, timeout=1.0))
+    assert sorted(transport.completed) == ["a", "b"]
+    assert transport.requeued == []
+
+
+def test_drain_requeues_unfinished():
+    """제한 시간을 넘는 작업은 취소하고 대기열로 되돌림"""
+    transport = asyncio.run(run_drain({"fast": 0.01, "slow-1": 5.0, "slow-2": 5.0}, timeout=0.1))
+    logger.info(f"Completed: {transport.completed}, requeued: {transport.requeued}")
+    assert transport.completed == ["fast"]
+    assert transport.requeued == ["slow-1", "slow-2"]
+
+
+if __name__ == "__main__":
+    test_drain_waits_for_jobs()
+    test_drain_requeues_unfinished()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+워커 메트릭 테스트 (누적 카운터/히스토그램 + Prometheus 텍스트 형식 + HTTP 엔드포인트)
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.metrics import MetricsRegistry, start_metrics_server
+from loguru import logger
+
+
+def build_registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    completed = registry.counter("jobs_completed_total", "Completed jobs")
+    failed = registry.counter("jobs_failed_total", "Failed jobs", ("reason",))
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.01, 0.1, 1.0))
+
+    for _ in range(3):
+        completed.inc()
+    failed.inc(reason="error")
+    failed.inc(2, reason='bad "data"')
+    for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+        latency.observe(value)
+
+    async def depths():
+        return {"wait": 7, "active": 2}
+
+    registry.callback("queue_depth", "Queue depth", depths, labelname="state")
+    return registry
+
+
+def test_prometheus_text():
+    """누적 버킷/레이블 이스케이프/콜백 값이 Prometheus 텍스트 형식으로 출력되는지"""
+    logger.info("=== Metrics Test ===\n")
+
+    registry = build_registry()
+    text = asyncio.run(registry.render())
+    logger.info(f"\n{text}")
+
+    lines = text.splitlines()
+    assert "# TYPE jobs_completed_total counter" in lines
+    assert "jobs_completed_total 3" in lines
+    assert 'jobs_failed_total{reason="bad \\"data\\""} 2' in lines
+    # 버킷은 누적 값 (프로세스별 값을 더한 뒤 백분위 계산 가능)
+    assert 'latency_seconds_bucket{le="0.01"} 1' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 3' in lines
+    assert 'latency_seconds_bucket{le="1.0"} 4' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 5' in lines
+    assert "latency_seconds_count 5" in lines
+    assert 'queue_depth{state="active"} 2' in lines
+
+    try:
+        registry.counter("jobs_completed_total", "duplicate")
+        assert False, "duplicate metric should fail"
+    except ValueError:
+        pass
+
+
+def test_http_endpoint():
+    """/metrics, /metrics.json, 그 외 경로 응답"""
+    registry = build_registry()
+
+    async def get(port: int, path: str) -> tuple[str, bytes]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return head.decode().split("\r\n")[0], body
+
+    async def run():
+        server = await start_metrics_server(registry, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            status, body = await get(port, "/metrics")
+            assert status == "HTTP/1.1 200 OK"
+            assert b"jobs_completed_total 3" in body
+
+            status, body = await get(port, "/metrics.json")
+            snapshot = json.loads(body)
+            logger.info(f"JSON: {snapshot}")
+            assert snapshot["jobs_completed_total"] == 3
+            assert snapshot["queue_depth"] == {"active": 2, "wait": 7}
+            assert snapshot["latency_seconds"]["count"] == 5
+            assert snapshot["latency_seconds"]["p50"] == 0.1
+
+            status, _ = await get(port, "/nope")
+            assert status == "HTTP/1.1 404 Not Found"
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_prometheus_text()
+    test_http_endpoint()
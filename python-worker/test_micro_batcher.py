@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+마이크로 배처 테스트 (동시 요청 병합 + 순서 보장 + 예외 전달)
+"""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.preprocessor.batching import MicroBatcher
+from loguru import logger
+
+
+def test_micro_batcher():
+    """여러 스레드의 단건 요청이 배치로 합쳐지고 각자 자기 결과를 받는지 확인"""
+    logger.info("=== Micro Batcher Test ===\n")
+
+    batch_sizes = []
+    release = threading.Event()
+
+    def batch_fn(items):
+        # 첫 배치를 잠시 붙잡아 두어 나머지 요청이 큐에 쌓이도록 함
+        release.wait(timeout=1)
+        batch_sizes.append(len(items))
+        return [item.upper() for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=20, name="test")
+    texts = [f"chat-{i}" for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        futures = [pool.submit(batcher, text) for text in texts]
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    logger.info(f"Batch sizes: {batch_sizes} / stats: {batcher.stats()}")
+    assert results == [text.upper() for text in texts]
+    assert max(batch_sizes) <= 8
+    assert len(batch_sizes) < len(texts)
+
+    # batch_fn 예외는 해당 배치의 모든 호출자에게 전달
+    def failing_fn(items):
+        raise RuntimeError("model error")
+
+    failing = MicroBatcher(failing_fn, max_batch_size=4, max_wait_ms=1, name="failing")
+    try:
+        failing("text")
+        assert False, "exception expected"
+    except RuntimeError as e:
+        logger.info(f"Propagated: {e}")
+
+
+def test_micro_batcher_wait_time():
+    """배치를 모으느라 기다린 시간은 호출한 스레드에서 한 번만 가져감"""
+    batcher = MicroBatcher(lambda items: items, max_batch_size=8, max_wait_ms=20, name="test")
+    assert batcher.take_wait_ms() is None
+
+    assert batcher("chat") == "chat"
+    wait_ms = batcher.take_wait_ms()
+    logger.info(f"Batch wait: {wait_ms:.1f}ms")
+    assert 15 <= wait_ms < 1000  # 혼자라서 max_wait_ms까지 기다림
+    assert batcher.take_wait_ms() is None
+
+
+if __name__ == "__main__":
+    test_micro_batcher()
+    test_micro_batcher_wait_time()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+배치 전처리 테스트 (preprocess_batch 결과가 preprocess 단건 결과와 동일한지 확인)
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.preprocessor.text_processor import TextPreprocessor
+from loguru import logger
+
+
+def test_preprocess_batch():
+    """필터링/이모티콘/일반 문장이 섞인 배치에서 단건 결과와 동일한지 확인"""
+    logger.info("=== Preprocess Batch Test ===\n")
+
+    preprocessor = TextPreprocessor()
+
+    texts = [
+        "ㅋㅋㅋㅋㅋ",
+        "/웃음/",
+        "/웃음/ ㅋㅋ 개꿀잼 ㄹㅇ",
+        "<b>안녕</b>하세요!!!!",
+        "!!!",
+        "ㄹㅈㄷ 이거 진짜 레게노 /오이루/",
+        "hello world",
+        "사무시레서 일해요 ㅠㅠㅠㅠ",
+        "하하하하하 노노노노노",
+        "오늘날씨가좋네요그래서산책갔어요",
+    ]
+
+    option_sets = [
+        {},
+        {"fix_typos": False, "add_spacing": False},
+        {"filter_profanity": True, "remove_emoticons": False},
+    ]
+
+    for options in option_sets:
+        single_start = time.time()
+        expected = [preprocessor.preprocess(text, **options) for text in texts]
+        single_time = (time.time() - single_start) * 1000
+
+        batch_start = time.time()
+        results = preprocessor.preprocess_batch(texts, **options)
+        batch_time = (time.time() - batch_start) * 1000
+
+        logger.info(f"Options {options}: single={single_time:.1f}ms, batch={batch_time:.1f}ms")
+        for text, result in zip(texts, results):
+            logger.info(f"  '{text}' → {result}")
+
+        assert results == expected
+
+
+def test_fast_path():
+    """빠른 경로 판별 및 단계별 건너뛴 횟수 확인"""
+    logger.info("=== Fast Path Test ===\n")
+
+    preprocessor = TextPreprocessor()
+
+    # (텍스트, 오타/띄어쓰기 필요, 문장 분리 필요)
+    cases = [
+        ("ㅋㅋ", False, False),
+        ("gg", False, False),
+        ("wow. nice", False, True),
+        ("레전드", True, False),
+        ("오늘 방송 재밌네요", True, True),
+        ("안녕하세요반가워요", True, True),
+    ]
+    for text, needs_morphology, needs_split in cases:
+        assert preprocessor.classify_fast_path(text) == (needs_morphology, needs_split), text
+
+    preprocessor.preprocess_batch(["ㅋㅋㅋ", "gg", "레전드", "오늘 방송 재밌네요"])
+    stats = preprocessor.fast_path_stats()
+    logger.info(f"Fast path stats: {stats}")
+
+    # "ㅋㅋㅋ" → "하하"(한글)로 확장되므로 gg만 오타/띄어쓰기 교정 생략
+    assert stats["messages"] == 4
+    assert stats["skipped"]["fix_typos"] == 1
+    assert stats["skipped"]["add_spacing"] == 1
+    assert stats["skipped"]["split_sentences"] == 3
+
+
+if __name__ == "__main__":
+    test_preprocess_batch()
+    test_fast_path()
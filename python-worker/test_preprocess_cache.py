@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+전처리 결과 캐시 테스트 (LRU 제거 + TTL 만료 + 카운터, 처리 중인 동일 입력 합치기)
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.models import PreprocessOptions
+from src.preprocessor.cache import PreprocessCache, SingleFlight
+from loguru import logger
+
+
+def test_preprocess_cache():
+    """LRU/TTL 동작 및 hit/miss/eviction 카운터 확인"""
+    logger.info("=== Preprocess Cache Test ===\n")
+
+    cache = PreprocessCache(maxsize=2, ttl=0.05)
+    options_key = PreprocessOptions().cache_key()
+
+    cache.put(("ㅋㅋㅋ", options_key), ("하하", False, None, ()))
+    cache.put(("ㄹㅇ", options_key), ("진짜", False, None, ()))
+
+    # 조회된 항목은 최근 사용으로 이동 → 다음 put에서 "ㄹㅇ"이 밀려남
+    assert cache.get(("ㅋㅋㅋ", options_key)) == ("하하", False, None, ())
+    cache.put(("레전드", options_key), ("레전드", False, None, ()))
+
+    assert cache.get(("ㄹㅇ", options_key)) is None
+    # 옵션이 다르면 다른 키
+    assert cache.get(("ㅋㅋㅋ", PreprocessOptions(fix_typos=False).cache_key())) is None
+
+    time.sleep(0.06)
+    assert cache.get(("레전드", options_key)) is None  # TTL 만료
+
+    stats = cache.stats()
+    logger.info(f"Stats: {stats}")
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+
+    # maxsize=0 이면 비활성화
+    disabled = PreprocessCache(maxsize=0)
+    disabled.put("key", ("value", False, None, ()))
+    assert disabled.get("key") is None
+    assert disabled.stats()["misses"] == 0
+
+
+def test_single_flight():
+    """같은 키가 처리 중이면 한 번만 실행하고, 끝난 뒤에는 다시 실행 (예외도 함께 받음)"""
+    flight = SingleFlight()
+    calls = []
+
+    async def preprocess(text):
+        calls.append(text)
+        await asyncio.sleep(0.01)
+        if text == "에러":
+            raise ValueError(text)
+        return (text.upper(), False, None, ())
+
+    async def run():
+        results = await asyncio.gather(
+            *(flight.do(("ㅋㅋ", ()), lambda: preprocess("ㅋㅋ")) for _ in range(20)),
+            flight.do(("hi", ()), lambda: preprocess("hi")),
+        )
+        assert all(result == ("ㅋㅋ", False, None, ()) for result in results[:20])
+        assert results[20] == ("HI", False, None, ())
+
+        # 처리가 끝난 키는 다시 실행 (결과 재사용은 캐시 몫)
+        await flight.do(("hi", ()), lambda: preprocess("hi"))
+
+        errors = await asyncio.gather(
+            *(flight.do(("에러", ()), lambda: preprocess("에러")) for _ in range(3)), return_exceptions=True,
+        )
+        assert all(isinstance(error, ValueError) for error in errors)
+
+    asyncio.run(run())
+    logger.info(f"Single flight: {flight.stats()}")
+    assert calls == ["ㅋㅋ", "hi", "hi", "에러"]
+    assert flight.stats() == {"executed": 4, "coalesced": 21, "inflight": 0}
+
+
+if __name__ == "__main__":
+    test_preprocess_cache()
+    test_single_flight()
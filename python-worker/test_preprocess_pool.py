@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+전처리 프로세스 풀 smoke 테스트: 모든 프로세스가 준비된 뒤 start()가 반환되고, 풀을 통한 전처리 결과가 단건 실행과 동일
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.preprocessor.pool import PreprocessPool
+from src.preprocessor.text_processor import TextPreprocessor
+from loguru import logger
+
+
+async def run_pool(texts: list[str], options: dict) -> list:
+    pool = PreprocessPool(processes=2, log_level="WARNING")
+    try:
+        await pool.start(timeout=120)
+        return await asyncio.gather(*[pool.preprocess(text, options) for text in texts])
+    finally:
+        pool.shutdown()
+
+
+def test_preprocess_through_pool():
+    """풀 시작 후 전처리 결과가 같은 프로세스에서 실행한 결과와 동일"""
+    logger.info("=== Preprocess Pool Test ===\n")
+
+    texts = ["ㅋㅋㅋㅋㅋ", "<b>안녕</b>하세요!!!!", "ㄹㅈㄷ 이거 진짜 레게노 /오이루/", "hello world"]
+    options = {"fix_typos": False, "add_spacing": False}
+
+    results = asyncio.run(run_pool(texts, options))
+    logger.info(f"Pool results: {results}")
+
+    preprocessor = TextPreprocessor(warmup=False)
+    assert results == [preprocessor.preprocess(text, **options) for text in texts]
+
+
+if __name__ == "__main__":
+    test_preprocess_through_pool()
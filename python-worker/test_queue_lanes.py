@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+우선순위 lane 테스트 (가중치 비율 순서표 + lane 구성)
+"""
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError
+
+from src.concurrency import ConcurrencyLimiter
+from src.transports import bull
+from src.transports.bull import BullTransport, WeightedRoundRobin
+from loguru import logger
+
+
+def test_weighted_round_robin():
+    """가중치 비율대로 고르게 섞이고, 한 lane이 몰아서 나오지 않는지"""
+    logger.info("=== Queue Lanes Test ===\n")
+
+    schedule = WeightedRoundRobin([3, 1])
+    order = [schedule.next() for _ in range(8)]
+    logger.info(f"Order (3:1): {order}")
+    assert order == [0, 0, 1, 0, 0, 0, 1, 0]
+
+    schedule = WeightedRoundRobin([5, 2, 1])
+    counts = Counter(schedule.next() for _ in range(800))
+    assert counts == {0: 500, 1: 200, 2: 100}
+
+
+def test_lane_setup():
+    """가중치가 큰 lane부터 정렬, receipt가 없으면 첫 번째 lane"""
+    transport = BullTransport(Redis(), "translation-jobs", {"translation-jobs": 1, "translation-jobs-priority": 4})
+    assert [lane.name for lane in transport.lanes] == ["translation-jobs-priority", "translation-jobs"]
+    assert transport.lane("translation-jobs").wait_key == "bull:translation-jobs:wait"
+    assert transport.lane(None).name == "translation-jobs-priority"
+
+    # lanes가 없으면 queue_name 하나만 소비 (기존 동작)
+    single = BullTransport(Redis(), "translation-jobs")
+    assert [lane.name for lane in single.lanes] == ["translation-jobs"]
+    assert single.lane_name(None) == "translation-jobs"
+
+
+class MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.keys = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def llen(self, key):
+        self.keys.append(key)
+
+    async def execute(self):
+        return [len(self.redis.lists.get(key, [])) for key in self.keys]
+
+
+class MemoryRedis(Redis):
+    """대기열 리스트만 있는 Redis (작업을 되돌리는 RPUSH는 항상 실패)"""
+
+    def __init__(self, lists: dict):
+        super().__init__()
+        self.lists = lists
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+    async def brpop(self, keys, timeout=0):
+        for key in keys:
+            if self.lists.get(key):
+                return key, self.lists[key].pop()
+        return None
+
+    async def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    async def rpush(self, key, *values):
+        raise ConnectionError("connection reset")
+
+
+def test_wait_for_jobs_keeps_job_queued():
+    """여러 lane을 기다릴 때 작업을 꺼내지 않음 (되돌리기 실패로 작업을 잃지 않음)"""
+    redis = MemoryRedis({"bull:translation-jobs:wait": [b"42"]})
+    transport = BullTransport(redis, "translation-jobs", {"translation-jobs": 1, "translation-jobs-priority": 4})
+
+    asyncio.run(asyncio.wait_for(transport.wait_for_jobs(), timeout=0.5))
+    assert redis.lists == {"bull:translation-jobs:wait": [b"42"]}
+
+
+def test_wait_for_jobs_keeps_fifo_order():
+    """lane 1개일 때도 작업을 꺼내거나 회전시키지 않음 (가장 오래된 작업이 계속 맨 앞)"""
+    redis = MemoryRedis({"bull:translation-jobs:wait": [b"43", b"42"]})
+    transport = BullTransport(redis, "translation-jobs")
+
+    asyncio.run(asyncio.wait_for(transport.wait_for_jobs(), timeout=0.5))
+    assert redis.lists == {"bull:translation-jobs:wait": [b"43", b"42"]}
+
+
+async def run_fetch(transport: BullTransport) -> asyncio.Queue:
+    jobs: asyncio.Queue = asyncio.Queue()
+    await asyncio.wait_for(transport.fetch(jobs, ConcurrencyLimiter(4)), timeout=2)
+    return jobs
+
+
+def test_fetch_retries_after_redis_error():
+    """dequeue가 Redis 오류로 실패해도 fetcher가 끝나지 않고 재시도해서 작업을 가져옴"""
+    transport = BullTransport(MemoryRedis({}), "translation-jobs")
+    calls = []
+
+    async def dequeue(count):
+        calls.append(count)
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+        transport.stop_fetching()
+        return [(transport.lanes[0], "42", b"{}")]
+
+    transport.dequeue = dequeue
+    retry_min, bull.FETCH_RETRY_MIN = bull.FETCH_RETRY_MIN, 0.01
+    try:
+        jobs = asyncio.run(run_fetch(transport))
+    finally:
+        bull.FETCH_RETRY_MIN = retry_min
+    assert len(calls) == 2
+    assert transport.fetch_retries == 1
+    assert jobs.get_nowait() == ("42", b"{}", "translation-jobs")
+
+
+if __name__ == "__main__":
+    test_weighted_round_robin()
+    test_lane_setup()
+    test_wait_for_jobs_keeps_job_queued()
+    test_wait_for_jobs_keeps_fifo_order()
+    test_fetch_retries_after_redis_error()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+준비 상태 테스트 (모델 로더 stub): 모델 로드 + 워밍업 전 /health는 503, 끝나면 200
+모델 로드가 실패하면 기다리지 않고 not-ready로 남음
+"""
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.metrics import MetricsRegistry, start_metrics_server
+from src.preprocessor import text_processor
+from src.preprocessor.text_processor import TextPreprocessor
+from loguru import logger
+
+
+class StubPreprocessor(TextPreprocessor):
+    """실제 모델 대신 gate가 열릴 때까지 기다리는 로더 (failing에 든 모델은 로드 실패)"""
+
+    def __init__(self, gate: threading.Event, failing: tuple = (), **kwargs):
+        self.gate = gate
+        self.failing = failing
+        super().__init__(**kwargs)
+
+    def _stub_load(self, name: str):
+        self.gate.wait(5)
+        if name in self.failing:
+            raise RuntimeError(f"{name} model not found")
+
+    def _load_spacing(self):
+        self._stub_load("spacing")
+
+    def _load_kiwi(self):
+        self._stub_load("kiwi")
+
+    def _load_kss(self):
+        self._stub_load("kss")
+
+
+def make_preprocessor(gate: threading.Event, failing: tuple = ()) -> StubPreprocessor:
+    """설치 여부와 관계없이 세 모델 모두 로드 대상으로 두고 백그라운드 로드 시작"""
+    flags = ("PYKOSPACING_AVAILABLE", "KIWI_AVAILABLE", "KSS_AVAILABLE")
+    saved = {flag: getattr(text_processor, flag) for flag in flags}
+    for flag in flags:
+        setattr(text_processor, flag, True)
+    try:
+        return StubPreprocessor(gate, failing, lazy=True, warmup=False)
+    finally:
+        for flag, value in saved.items():
+            setattr(text_processor, flag, value)
+
+
+async def get_health(port: int) -> tuple[str, dict]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.decode().split("\r\n")[0], json.loads(body)
+
+
+async def run_health(preprocessor: StubPreprocessor, gate: threading.Event) -> tuple[tuple, tuple, bool]:
+    server = await start_metrics_server(MetricsRegistry(), "127.0.0.1", 0, readiness=preprocessor.readiness)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        before = await get_health(port)
+        gate.set()
+        ready = await asyncio.wait_for(asyncio.to_thread(preprocessor.wait_ready, 5), timeout=2)
+        after = await get_health(port)
+    finally:
+        server.close()
+        await server.wait_closed()
+    return before, after, ready
+
+
+def test_health_gated_on_ready():
+    """모델 로드 중에는 503 (모델별 loading), 모두 로드되면 200"""
+    logger.info("=== Readiness Test ===\n")
+
+    gate = threading.Event()
+    preprocessor = make_preprocessor(gate)
+    (status, body), (status_after, body_after), ready = asyncio.run(run_health(preprocessor, gate))
+    logger.info(f"Before: {status} {body}, after: {status_after} {body_after}")
+
+    assert status == "HTTP/1.1 503 Service Unavailable"
+    assert body["ready"] is False
+    assert set(body["models"].values()) == {"loading"}
+
+    assert ready is True
+    assert status_after == "HTTP/1.1 200 OK"
+    assert body_after["models"] == {"spacing": "ready", "kiwi": "ready", "kss": "ready"}
+
+
+def test_failed_model_stays_not_ready():
+    """모델 하나가 로드에 실패하면 wait_ready는 바로 False를 반환하고 /health는 계속 503"""
+    gate = threading.Event()
+    preprocessor = make_preprocessor(gate, failing=("kiwi",))
+    (status, _), (status_after, body_after), ready = asyncio.run(run_health(preprocessor, gate))
+    logger.info(f"After failed load: {status_after} {body_after}")
+
+    assert status == "HTTP/1.1 503 Service Unavailable"
+    assert ready is False
+    assert status_after == "HTTP/1.1 503 Service Unavailable"
+    assert body_after["ready"] is False
+    assert body_after["models"]["kiwi"] == "failed"
+    assert body_after["models"]["spacing"] == "ready"
+
+
+if __name__ == "__main__":
+    test_health_gated_on_ready()
+    test_failed_model_stays_not_ready()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+결과 배치 발행 테스트: 배치마다 pub/sub 메시지 1건 (version 2), 모든 작업이 정확히 한 번씩 완료 처리
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.transports.bull import RESULT_BATCH_VERSION, RESULT_CHANNEL, BullTransport
+from loguru import logger
+
+
+class MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hset(self, key, mapping):
+        self.commands.append(("hset", key, mapping))
+
+    def zrem(self, key, *members):
+        self.commands.append(("zrem", key, members))
+
+    def zadd(self, key, mapping):
+        self.commands.append(("zadd", key, mapping))
+
+    def publish(self, channel, message):
+        self.commands.append(("publish", channel, message))
+
+    async def execute(self):
+        self.redis.executions += 1
+        self.redis.commands.extend(self.commands)
+
+
+class MemoryRedis:
+    """결과 발행 파이프라인만 기록하는 Redis"""
+
+    def __init__(self):
+        self.executions = 0
+        self.commands: list = []
+
+    def register_script(self, script):
+        return None
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+
+async def run_batched(job_ids: list[str], batch_size: int) -> tuple[BullTransport, MemoryRedis]:
+    redis = MemoryRedis()
+    transport = BullTransport(redis, "translation-jobs")
+    transport.publish_batch_size = batch_size
+    transport.publish_batch_wait = 0.05
+    lane = transport.lanes[0]
+    lane.inflight.update(job_ids)
+    publisher = asyncio.ensure_future(transport.publish_loop())
+
+    # 짝수 번째는 완료, 홀수 번째는 실패
+    settles = [
+        transport.complete(job_id, {"preprocessed_text": job_id}, lane.name) if i % 2 == 0
+        else transport.fail(job_id, "Preprocessing failed", lane.name)
+        for i, job_id in enumerate(job_ids)
+    ]
+    await asyncio.wait_for(asyncio.gather(*settles), timeout=5)
+    publisher.cancel()
+    await asyncio.gather(publisher, return_exceptions=True)
+    return transport, redis
+
+
+def test_batch_publish():
+    """10개 작업을 4개씩 모으면 파이프라인 3번, 메시지 3건으로 발행하고 각 작업은 한 번씩만 처리"""
+    logger.info("=== Result Batching Test ===\n")
+
+    job_ids = [str(i) for i in range(10)]
+    transport, redis = asyncio.run(run_batched(job_ids, batch_size=4))
+
+    messages = [json.loads(message) for name, channel, message in redis.commands if name == "publish"]
+    logger.info(f"Messages: {len(messages)}, sizes: {[len(message['results']) for message in messages]}")
+    assert redis.executions == 3
+    assert [len(message["results"]) for message in messages] == [4, 4, 2]
+    assert all(message["version"] == RESULT_BATCH_VERSION for message in messages)
+    assert all(channel == RESULT_CHANNEL for name, channel, _ in redis.commands if name == "publish")
+
+    # 모든 작업이 정확히 한 번씩 발행 + lease 해제
+    results = [result for message in messages for result in message["results"]]
+    assert sorted(result["jobId"] for result in results) == sorted(job_ids)
+    released = [job_id for name, _, members in redis.commands if name == "zrem" for job_id in members]
+    assert sorted(released) == sorted(job_ids)
+
+    # 완료 작업만 결과 저장 + completed 추가, 실패 작업은 실패 사유와 함께 발행
+    completed = [job_id for name, _, mapping in redis.commands if name == "zadd" for job_id in mapping]
+    assert sorted(completed) == sorted(job_ids[0::2])
+    assert len([1 for name, *_ in redis.commands if name == "hset"]) == 5
+    statuses = {result["jobId"]: result["status"] for result in results}
+    assert {job_id for job_id, status in statuses.items() if status == "failed"} == set(job_ids[1::2])
+    assert next(result for result in results if result["jobId"] == "1")["result"] == {"filter_reason": "Preprocessing failed"}
+
+    assert transport.inflight == 0
+    assert transport.stats()["publishes"] == 3
+
+
+if __name__ == "__main__":
+    test_batch_publish()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+직렬화 테스트 (백엔드별 왕복 + Bull 결과 메시지 인코딩이 dict 형식과 동일한지)
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from redis.asyncio import Redis
+
+from src.serialization import available_serializers, get_serializer
+from src.transports.bull import RESULT_BATCH_VERSION, BullTransport
+from loguru import logger
+
+RESULT = {
+    "original_text": "ㅋㅋㅋ 개꿀잼 /웃음/",
+    "preprocessed_text": "하하하 정말 재미있다",
+    "preprocessing_time_ms": 3.25,
+    "filtered": False,
+    "filter_reason": None,
+    "emoticons": [[4, "/웃음/"]],
+    "degradation_level": "full",
+}
+
+
+def test_serializer_roundtrip():
+    """설치된 모든 백엔드에서 dumps → loads가 원래 값과 같은지"""
+    logger.info(f"=== Serialization Test ({available_serializers()}) ===\n")
+
+    for name in available_serializers():
+        serializer = get_serializer(name)
+        encoded = serializer.dumps(RESULT)
+        assert isinstance(encoded, bytes)
+        assert serializer.loads(encoded) == RESULT, name
+        if serializer.is_json:
+            assert json.loads(encoded) == RESULT  # Gateway(JSON.parse)와 같은 형식
+        logger.info(f"{name}: {len(encoded)} bytes")
+
+    try:
+        get_serializer("pickle")
+        assert False, "unknown serializer should fail"
+    except ValueError as e:
+        logger.info(f"Rejected: {e}")
+
+
+def test_bull_result_messages():
+    """returnvalue 인코딩을 끼워 넣은 결과 메시지가 dict로 인코딩한 것과 같은지"""
+    transport = BullTransport(Redis(), "translation-jobs")
+    serializer = transport.message_serializer
+    returnvalue = transport.job_serializer.dumps(RESULT)
+
+    single = serializer.loads(transport._encode_results([("1", "completed", RESULT, returnvalue)], batch=False))
+    assert single == {"jobId": "1", "result": RESULT, "status": "completed"}
+
+    failed = {"filter_reason": "Preprocessing failed"}
+    batch = serializer.loads(transport._encode_results(
+        [("1", "completed", RESULT, returnvalue), ("2", "failed", failed, None)], batch=True,
+    ))
+    assert batch == {
+        "version": RESULT_BATCH_VERSION,
+        "results": [
+            {"jobId": "1", "result": RESULT, "status": "completed"},
+            {"jobId": "2", "result": failed, "status": "failed"},
+        ],
+    }
+
+
+if __name__ == "__main__":
+    test_serializer_roundtrip()
+    test_bull_result_messages()
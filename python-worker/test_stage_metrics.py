@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+단계별 지연 시간 히스토그램 테스트 (백분위 + 구간 통계 + 변경 비율)
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.metrics import Histogram
+from src.preprocessor.stage_metrics import STAGE_BUCKETS, LatencyHistogram, StageMetrics, format_stage_summary
+from loguru import logger
+
+
+def test_stage_metrics():
+    """로그 버킷 백분위 오차(1.25배 이내)와 구간 통계 확인"""
+    logger.info("=== Stage Metrics Test ===\n")
+
+    histogram = LatencyHistogram()
+    for value in range(1, 101):  # 1ms ~ 100ms
+        histogram.record(float(value))
+
+    summary = histogram.summary()
+    logger.info(f"Histogram: {summary}")
+    assert summary["count"] == 100
+    assert summary["max_ms"] == 100.0
+    assert 50 <= summary["p50_ms"] <= 50 * 1.25
+    assert 99 <= summary["p99_ms"] <= 100
+
+    metrics = StageMetrics()
+    metrics.record("fix_typos", elapsed_ms=10.0, items=4, changed=1)  # 배치 4건 → 건당 2.5ms
+    first = metrics.interval_snapshot()
+    assert first["fix_typos"]["count"] == 4
+    assert first["fix_typos"]["changed_ratio"] == 0.25
+
+    metrics.record("fix_typos", elapsed_ms=1.0, items=1, changed=1)
+    second = metrics.interval_snapshot()
+    logger.info(format_stage_summary(second))
+    assert second["fix_typos"]["count"] == 1
+    assert second["fix_typos"]["changed"] == 1
+
+    # 누적 통계는 구간 로그와 무관하게 유지
+    assert metrics.snapshot()["fix_typos"]["count"] == 5
+
+
+def test_stage_metrics_export():
+    """단계 기록이 /metrics 히스토그램(초, stage 레이블)에도 기록되고, 프로세스 간 take/merge로 합쳐지는지"""
+    exported = Histogram("preprocess_stage_seconds", "", STAGE_BUCKETS, ("stage",))
+    metrics = StageMetrics()
+    metrics.export_to(exported)
+
+    metrics.record("fix_typos", elapsed_ms=10.0, items=4)
+    metrics.exporting = False  # 워밍업 중
+    metrics.record("fix_typos", elapsed_ms=1.0)
+    metrics.exporting = True
+    metrics.reset()
+    metrics.record("fix_typos_batch_wait", elapsed_ms=5.0)
+
+    assert exported.count(stage="fix_typos") == 4
+    assert exported.summary(stage="fix_typos")["mean"] == 0.0025
+    assert exported.count(stage="fix_typos_batch_wait") == 1
+    assert "fix_typos" not in metrics.snapshot()
+
+    # 프로세스 풀: 자식의 기록을 가져가서 부모 히스토그램에 더함
+    parent = Histogram("preprocess_stage_seconds", "", STAGE_BUCKETS, ("stage",))
+    parent.merge(exported.take())
+    parent.merge({("fix_typos",): [[0] * (len(STAGE_BUCKETS) + 1), 0.0]})
+    assert parent.count(stage="fix_typos") == 4
+    assert exported.count() == 0
+
+
+if __name__ == "__main__":
+    test_stage_metrics()
+    test_stage_metrics_export()
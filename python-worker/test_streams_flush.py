@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Streams 결과 전송 테스트: 전송이 실패해도 결과를 잃지 않고 재시도, ACK될 때까지 complete()가 대기
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from redis.exceptions import ConnectionError
+
+from src.transports import streams
+from src.transports.streams import StreamsTransport
+from loguru import logger
+
+
+class MemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def xadd(self, key, fields, **kwargs):
+        self.commands.append(("xadd", fields["jobId"]))
+
+    def xack(self, key, group, *entry_ids):
+        self.commands.append(("xack", *entry_ids))
+
+    def xdel(self, key, *entry_ids):
+        self.commands.append(("xdel", *entry_ids))
+
+    async def execute(self):
+        if self.redis.failures > 0:
+            self.redis.failures -= 1
+            raise ConnectionError("connection reset")
+        self.redis.executed.extend(self.commands)
+
+
+class MemoryRedis:
+    """결과 전송 파이프라인만 기록하는 Redis (처음 failures번은 실패)"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.executed: list = []
+
+    def register_script(self, script):
+        return None
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+
+async def run_flush(failures: int) -> tuple[StreamsTransport, MemoryRedis, list]:
+    redis = MemoryRedis(failures)
+    transport = StreamsTransport(redis, "translation-jobs")
+    transport.inflight.update({"1-0", "2-0"})
+    flusher = asyncio.ensure_future(transport.flush_loop())
+
+    done = []
+
+    async def complete(job_id: str, entry_id: str):
+        await transport.complete(job_id, {"preprocessed_text": job_id}, entry_id)
+        done.append(job_id)
+
+    completions = [asyncio.ensure_future(complete("a", "1-0")), asyncio.ensure_future(complete("b", "2-0"))]
+    if failures:
+        # 재시도 전까지는 complete()가 끝나지 않음 (동시 처리 자리를 계속 차지)
+        await asyncio.sleep(0.005)
+        assert done == []
+        assert transport.inflight == {"1-0", "2-0"}
+
+    await asyncio.wait_for(asyncio.gather(*completions), timeout=5)
+    flusher.cancel()
+    return transport, redis, done
+
+
+def test_flush_acks_before_complete_returns():
+    """complete()는 결과 XADD + XACK가 실행된 뒤에 반환"""
+    logger.info("=== Streams Flush Test ===\n")
+
+    transport, redis, done = asyncio.run(run_flush(failures=0))
+    assert sorted(done) == ["a", "b"]
+    assert ("xack", "1-0", "2-0") in redis.executed
+    assert transport.inflight == set()
+
+
+def test_flush_retries_after_failure():
+    """파이프라인이 한 번 실패해도 배치를 되돌려 재시도하고 결과를 잃지 않음"""
+    retry_min, streams.FLUSH_RETRY_MIN = streams.FLUSH_RETRY_MIN, 0.05
+    try:
+        transport, redis, done = asyncio.run(run_flush(failures=1))
+    finally:
+        streams.FLUSH_RETRY_MIN = retry_min
+    logger.info(f"Executed: {redis.executed}, stats: {transport.stats()}")
+    assert sorted(done) == ["a", "b"]
+    assert [cmd for cmd in redis.executed if cmd[0] == "xadd"] == [("xadd", "a"), ("xadd", "b")]
+    assert ("xack", "1-0", "2-0") in redis.executed
+    assert transport.inflight == set()
+    assert transport.flush_retries == 1
+    assert transport.stats()["flushed"] == 2
+
+
+if __name__ == "__main__":
+    test_flush_acks_before_complete_returns()
+    test_flush_retries_after_failure()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Streams reclaim 테스트: XAUTOCLAIM이 돌려준 삭제된 항목(필드 없음)은 처리하지 않고 ACK만
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from redis.exceptions import ResponseError
+
+from src.concurrency import ConcurrencyLimiter
+from src.config import settings
+from src.transports.streams import StreamsTransport
+from loguru import logger
+
+
+class MemoryRedis:
+    """XAUTOCLAIM 응답 하나만 돌려주는 Redis (XACK 기록)"""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.acked: list = []
+        self.transport: StreamsTransport | None = None
+
+    def register_script(self, script):
+        return None
+
+    async def xgroup_create(self, *args, **kwargs):
+        raise ResponseError("BUSYGROUP Consumer Group name already exists")
+
+    async def xautoclaim(self, *args, **kwargs):
+        # 한 번 돌려준 뒤 reclaim 종료
+        self.transport.stop_fetching()
+        return self.reply
+
+    async def xack(self, key, group, *entry_ids):
+        self.acked.extend(entry_ids)
+
+
+async def run_reclaim(reply) -> tuple[MemoryRedis, StreamsTransport, asyncio.Queue]:
+    redis = MemoryRedis(reply)
+    transport = StreamsTransport(redis, "translation-jobs")
+    redis.transport = transport
+    jobs: asyncio.Queue = asyncio.Queue()
+    await asyncio.wait_for(transport.reclaim(jobs, ConcurrencyLimiter(8)), timeout=2)
+    return redis, transport, jobs
+
+
+def test_reclaim_skips_deleted_entries():
+    """Redis 6.2의 [id, nil] 항목과 Redis 7의 deleted 목록은 ACK만 하고 처리 대기열에 넣지 않음"""
+    logger.info("=== Streams Reclaim Test ===\n")
+
+    reply = [
+        b"0-0",
+        [
+            (b"1-0", {b"jobId": b"a", b"data": b"{}"}),
+            (b"2-0", {}),  # Redis 6.2: 삭제된 항목은 필드가 nil
+            (None, None),
+        ],
+        [b"3-0"],  # Redis 7: 삭제된 항목 ID 목록
+    ]
+    interval, settings.stream_reclaim_interval = settings.stream_reclaim_interval, 0.01
+    try:
+        redis, transport, jobs = asyncio.run(run_reclaim(reply))
+    finally:
+        settings.stream_reclaim_interval = interval
+    logger.info(f"Acked: {redis.acked}, reclaimed: {transport.reclaimed}")
+
+    assert sorted(redis.acked) == [b"2-0", b"3-0"]
+    assert transport.reclaimed == 1
+    assert transport.inflight == {b"1-0"}
+    assert jobs.get_nowait() == ("a", b"{}", b"1-0")
+    assert jobs.empty()
+
+
+if __name__ == "__main__":
+    test_reclaim_skips_deleted_entries()
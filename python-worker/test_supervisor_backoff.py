@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+supervisor 재시작 대기 시간 테스트 (연속 실패 시 2배씩 증가, 워밍업 후 오래 실행된 뒤 종료하면 초기화)
+"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.supervisor import (
+    EXIT_WARMUP_TIMEOUT,
+    RESPAWN_BACKOFF_MAX,
+    RESPAWN_BACKOFF_MIN,
+    RESPAWN_STABLE_AFTER,
+    WARMUP_TIMEOUTS_BEFORE_UNSHARE,
+    Supervisor,
+)
+from loguru import logger
+
+
+def test_respawn_backoff():
+    """바로 죽으면 대기 시간이 상한까지 늘고, 한동안 잘 돌다가 죽으면 처음 대기 시간으로 돌아감"""
+    logger.info("=== Supervisor Respawn Backoff Test ===\n")
+
+    supervisor = Supervisor(processes=2)
+    delays = [supervisor.record_failure(1, 1, uptime=1.0) for _ in range(8)]
+    logger.info(f"Crash loop delays: {delays}")
+    assert delays[:3] == [RESPAWN_BACKOFF_MIN, RESPAWN_BACKOFF_MIN * 2, RESPAWN_BACKOFF_MIN * 4]
+    assert delays[-1] == RESPAWN_BACKOFF_MAX
+
+    # 안정적으로 실행된 뒤의 종료는 1회째로 셈
+    assert supervisor.record_failure(1, 1, uptime=RESPAWN_STABLE_AFTER + 1) == RESPAWN_BACKOFF_MIN
+    assert supervisor.record_failure(1, 1, uptime=1.0) == RESPAWN_BACKOFF_MIN * 2
+
+    # 슬롯마다 따로 셈
+    assert supervisor.record_failure(2, 1, uptime=1.0) == RESPAWN_BACKOFF_MIN
+
+
+def test_warmup_timeout_backoff():
+    """워밍업 제한 시간 초과(약 120초 뒤 종료 코드 75)는 안정 실행으로 보지 않고 대기 시간이 계속 늘어남"""
+    supervisor = Supervisor(processes=1)
+    supervisor.share_spacing = True
+    delays = [supervisor.record_failure(1, EXIT_WARMUP_TIMEOUT, uptime=120.0) for _ in range(4)]
+    logger.info(f"Warmup timeout delays: {delays}")
+    assert delays == [RESPAWN_BACKOFF_MIN * 2 ** i for i in range(4)]
+
+    # 연속 시간 초과가 쌓이면 PyKoSpacing 공유를 끄고 자식마다 fork 이후 로드
+    assert supervisor.warmup_timeouts >= WARMUP_TIMEOUTS_BEFORE_UNSHARE
+    assert supervisor.share_spacing is False
+
+
+def test_ready_pipe():
+    """워밍업을 마친 자식만 준비 완료 시각이 기록되고 (안정 실행 시간의 기준), 연속 시간 초과 횟수는 초기화"""
+    supervisor = Supervisor(processes=2)
+    supervisor.warmup_timeouts = 1
+    for pid, message in ((101, b"1"), (102, b"")):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.write(write_fd, message)
+        os.close(write_fd)
+        supervisor.ready_pipes[pid] = read_fd
+    silent_fd, silent_write_fd = os.pipe()  # 아직 워밍업 중인 자식
+    os.set_blocking(silent_fd, False)
+    supervisor.ready_pipes[103] = silent_fd
+
+    supervisor._poll_ready()
+    assert list(supervisor.ready_at) == [101]
+    assert list(supervisor.ready_pipes) == [103]
+    assert supervisor.warmup_timeouts == 0
+    os.close(silent_fd)
+    os.close(silent_write_fd)
+
+
+if __name__ == "__main__":
+    test_respawn_backoff()
+    test_warmup_timeout_backoff()
+    test_ready_pipe()
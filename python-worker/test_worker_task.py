@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+워커 태스크 테스트: 작업 하나의 실패 처리(transport.fail)가 예외를 내도 워커는 멈추지 않고 다음 작업 처리
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from redis.exceptions import ConnectionError
+
+from src.bull_worker import worker_task
+from src.concurrency import ConcurrencyLimiter
+from loguru import logger
+
+
+class FlakyTransport:
+    """실패 처리만 기록하는 전달 방식 (broken 작업은 fail()이 항상 예외)"""
+
+    job_serializer = json
+
+    def __init__(self, broken: set):
+        self.broken = broken
+        self.failed: list = []
+
+    def lane_name(self, receipt) -> str:
+        return "default"
+
+    async def fail(self, job_id: str, error: str, receipt=None):
+        if job_id in self.broken:
+            raise ConnectionError("connection reset")
+        self.failed.append(job_id)
+
+
+async def run_workers(job_ids: list, workers: int = 2) -> tuple[FlakyTransport, ConcurrencyLimiter, list]:
+    transport = FlakyTransport(broken={"a"})
+    limiter = ConcurrencyLimiter(len(job_ids))
+    jobs: asyncio.Queue = asyncio.Queue()
+    limiter.acquire(len(job_ids))
+    # data가 없는 작업은 바로 실패 처리 경로로 감
+    for job_id in job_ids:
+        jobs.put_nowait((job_id, None, job_id))
+
+    tasks = [asyncio.ensure_future(worker_task(i + 1, transport, limiter, jobs)) for i in range(workers)]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + 5
+    while limiter.outstanding > 0 and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+    alive = [not task.done() for task in tasks]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return transport, limiter, alive
+
+
+def test_worker_survives_fail_error():
+    """작업 하나의 fail()이 예외를 내도 모든 워커가 살아서 나머지 작업을 처리"""
+    logger.info("=== Worker Task Test ===\n")
+
+    transport, limiter, alive = asyncio.run(run_workers(["a", "b", "c", "d", "e"]))
+    logger.info(f"Failed: {transport.failed}, alive: {alive}")
+    assert alive == [True, True]
+    assert limiter.outstanding == 0
+    # a는 실패 처리까지 실패 (lease 만료 후 reaper 몫), 나머지는 모두 처리
+    assert sorted(transport.failed) == ["b", "c", "d", "e"]
+
+
+if __name__ == "__main__":
+    test_worker_survives_fail_error()